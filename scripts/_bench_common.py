@@ -0,0 +1,13 @@
+"""
+Setup shared by the scripts/bench_*.py benchmarks. Importing it puts the
+repo's src/ on sys.path, so a bench runs straight from a checkout:
+
+    import _bench_common # puts src/ on sys.path
+"""
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+if str(SRC) not in sys.path:
+    sys.path.append(str(SRC))
@@ -1,17 +1,21 @@
-import json
 from pathlib import Path
 import sys
 
+# Add src to sys.path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from q_ternary.training.run_writer_v1 import load_run
+
 def analyze_10k(file_path):
     p = Path(file_path)
     if not p.exists():
         print(f"File not found: {p}")
         return
 
-    obj = json.loads(p.read_text(encoding="utf-8"))
+    obj = load_run(str(p))
     rows = obj.get("history", [])
     if not rows:
-        print("No history found in JSON.")
+        print("No history found in run report.")
         return
 
     n = len(rows)
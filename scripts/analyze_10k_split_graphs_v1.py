@@ -1,7 +1,11 @@
-import json
 from pathlib import Path
 import sys
 
+# Add src to sys.path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from q_ternary.training.run_writer_v1 import load_run
+
 def generate_graph(data, title, window=100):
     n = len(data)
     # Successes (1 if error == 0.0)
@@ -35,10 +39,10 @@ def analyze_split_graphs(file_path):
         print(f"File not found: {p}")
         return
 
-    obj = json.loads(p.read_text(encoding="utf-8"))
+    obj = load_run(str(p))
     rows = obj.get("history", [])
     if not rows:
-        print("No history found in JSON.")
+        print("No history found in run report.")
         return
 
     # Split into two phases
@@ -0,0 +1,44 @@
+import time
+import argparse
+from itertools import islice
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+
+def main():
+    ap = argparse.ArgumentParser(description="Actions/sec: choose_action() vs the buffered agent.actions() stream")
+    ap.add_argument("--n", type=int, default=1000000)
+    ap.add_argument("--block", type=int, default=4096)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    agent = BootstrapAgentV1(seed=args.seed)
+    t0 = time.perf_counter()
+    for t in range(1, args.n + 1):
+        agent.choose_action(t)
+    scalar = time.perf_counter() - t0
+
+    agent = BootstrapAgentV1(seed=args.seed)
+    t0 = time.perf_counter()
+    for _ in islice(agent.actions(block=args.block), args.n):
+        pass
+    stream = time.perf_counter() - t0
+
+    # Focus loop half the time (observe() locking onto surprises)
+    agent = BootstrapAgentV1(seed=args.seed)
+    actions = agent.actions(block=args.block)
+    t0 = time.perf_counter()
+    for t in range(1, args.n + 1):
+        sent = next(actions)
+        if t % 8 == 0:
+            agent._focus_seq, agent._focus_left = sent, agent.focus_repeats
+    focus = time.perf_counter() - t0
+
+    print(f"{args.n:,} actions, block {args.block}")
+    print(f"{'choose_action()':<26} {args.n / scalar:>12,.0f}/s")
+    print(f"{'actions() stream':<26} {args.n / stream:>12,.0f}/s  {scalar / stream:.1f}x")
+    print(f"{'actions() with focus':<26} {args.n / focus:>12,.0f}/s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+import time
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+
+def make_agent(seed: int) -> BootstrapAgentV1:
+    # A trained agent over a small pulse vocabulary, so most steps hit existing handles
+    agent = BootstrapAgentV1(seed=seed, promote_threshold=2, seed_proto_handles=True)
+    sents, recvs = stream(5000, seed + 1)
+    for s, r in zip(sents, recvs):
+        agent.observe(s, r, learn=True)
+    return agent
+
+def stream(n: int, seed: int):
+    rng = random.Random(seed)
+    sents = [tuple(rng.randint(1, 6) for _ in range(rng.randint(1, 3))) for _ in range(n)]
+    return sents, [(sum(s) % 5,) for s in sents]
+
+def timed(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser(description="Steps/sec: per-call predict/observe vs predict_batch/observe_batch")
+    ap.add_argument("--sizes", default="10000,100000,1000000")
+    ap.add_argument("--seed", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'samples':>9}  {'op':<22} {'loop steps/s':>13} {'batch steps/s':>14} {'speedup':>8}")
+    for n in [int(x) for x in args.sizes.split(",")]:
+        sents, recvs = stream(n, args.seed)
+
+        a, b = make_agent(args.seed), make_agent(args.seed)
+        loop = timed(lambda: [a.predict(s) for s in sents])
+        batch = timed(lambda: b.predict_batch(sents))
+        print(f"{n:>9}  {'predict':<22} {n / loop:>13,.0f} {n / batch:>14,.0f} {loop / batch:>7.2f}x")
+
+        a, b = make_agent(args.seed), make_agent(args.seed)
+        loop = timed(lambda: [a.observe(s, r, learn=False) for s, r in zip(sents, recvs)])
+        batch = timed(lambda: b.observe_batch(sents, recvs, learn=False))
+        print(f"{n:>9}  {'observe(learn=False)':<22} {n / loop:>13,.0f} {n / batch:>14,.0f} {loop / batch:>7.2f}x")
+
+if __name__ == "__main__":
+    main()
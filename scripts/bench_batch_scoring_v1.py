@@ -0,0 +1,49 @@
+import time
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.metrics_v1 import response_error
+from constraint_bootstrap.metrics_batch_v1 import pad_pulses, response_error_batch
+from q_ternary.training.error_taxonomy_v1 import classify_error
+from q_ternary.training.error_taxonomy_batch_v1 import ERROR_CATEGORIES, classify_error_batch
+
+def samples(n: int, seed: int):
+    # Trainer-like mix: silent, question, and short acts
+    rng = random.Random(seed)
+    def act():
+        roll = rng.random()
+        return () if roll < 0.2 else (999,) if roll < 0.35 else tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 4)))
+    return [act() for _ in range(n)], [tuple(rng.randint(1, 12) for _ in range(rng.randint(0, 3))) for _ in range(n)]
+
+def main():
+    ap = argparse.ArgumentParser(description="Scoring samples: scalar response_error/classify_error vs the batch versions")
+    ap.add_argument("--n", type=int, default=1000000)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    preds, actuals = samples(args.n, args.seed)
+    t0 = time.perf_counter()
+    errs = [response_error(p, a) for p, a in zip(preds, actuals)]
+    cats = [classify_error(p, a, e).category for p, a, e in zip(preds, actuals, errs)]
+    scalar = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    width = max(max(map(len, preds)), max(map(len, actuals)))
+    pred, pred_len = pad_pulses(preds, width)
+    actual, actual_len = pad_pulses(actuals, width)
+    padded = time.perf_counter() - t0
+    err = response_error_batch(pred, pred_len, actual, actual_len)
+    codes = classify_error_batch(pred_len, actual_len, err)
+    batch = time.perf_counter() - t0
+    assert err.tolist() == errs
+    assert [ERROR_CATEGORIES[c] for c in codes] == cats
+
+    print(f"{args.n:,} samples")
+    print(f"{'scalar loop':<24} {scalar:>7.2f}s")
+    print(f"{'batch (incl. padding)':<24} {batch:>7.2f}s  {scalar / batch:>5.1f}x")
+    print(f"{'batch (padded arrays)':<24} {batch - padded:>7.2f}s  {scalar / (batch - padded):>5.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+import os
+import time
+import random
+import pickle
+import argparse
+import tempfile
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.checkpoint_v1 import load_checkpoint, save_checkpoint
+from constraint_bootstrap.signatures_v1 import SIGS
+
+def make_agent(n: int, seed: int, backend: str) -> BootstrapAgentV1:
+    rng = random.Random(seed)
+    agent = BootstrapAgentV1(seed=seed, handle_backend=backend)
+    handles = []
+    for i in range(n):
+        sent = SIGS.id_of(tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 6))))
+        resp = SIGS.id_of((rng.randint(0, 9),))
+        handles.append(Handle(hid=i + 1, sent_sig=sent, resp_sig=resp, eligibility=rng.random(), truth=rng.random(), hits=rng.randint(0, 50)))
+        agent._seen_counts.add((sent, resp))
+    agent._handles.extend(handles)
+    return agent
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+def main():
+    ap = argparse.ArgumentParser(description="Checkpoint size and save/load time vs pickle")
+    ap.add_argument("--sizes", default="10000,100000,1000000")
+    ap.add_argument("--backend", default="list", choices=["list", "table"])
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    print(f"{'handles':>9} {'ckpt MB':>8} {'save s':>7} {'load s':>7} {'pickle MB':>10} {'save s':>7} {'load s':>7}")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "agent.ckpt")
+        for n in [int(x) for x in args.sizes.split(",")]:
+            agent = make_agent(n, args.seed, args.backend)
+            save_t, size = timed(lambda: save_checkpoint(path, agent))
+            load_t, (restored, _) = timed(lambda: load_checkpoint(path))
+            assert len(restored._handles) == n
+            # Reference only: pickle of the same agent (not a portable format: ids are process-local)
+            try:
+                pickle_save_t, blob = timed(lambda: pickle.dumps(agent, protocol=pickle.HIGHEST_PROTOCOL))
+                pickle_load_t, _ = timed(lambda: pickle.loads(blob))
+                ref = f"{len(blob) / 1e6:>10.1f} {pickle_save_t:>7.2f} {pickle_load_t:>7.2f}"
+            except Exception: # table-bound handles don't round-trip through pickle
+                ref = f"{'-':>10} {'-':>7} {'-':>7}"
+            print(f"{n:>9} {size / 1e6:>8.1f} {save_t:>7.2f} {load_t:>7.2f} {ref}")
+
+if __name__ == "__main__":
+    main()
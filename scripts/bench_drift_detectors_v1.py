@@ -0,0 +1,65 @@
+import io
+import time
+import random
+import argparse
+import contextlib
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+from q_ternary.training.drift_detectors_v1 import make_drift_detector
+
+KINDS = ("rolling", "page_hinkley", "cusum", "adwin")
+
+def list_window(outcomes, window=50):
+    # The previous detector: list window with pop(0) and sum() per step
+    buf = []
+    for miss in outcomes:
+        buf.append(miss)
+        if len(buf) > window:
+            buf.pop(0)
+        if len(buf) == window:
+            sum(buf) / window >= 0.60
+
+def run(partner: str, kind: str, samples: int, seed: int) -> tuple:
+    # Settings from scripts/drift_shift_demo_v1.py
+    agent = BootstrapAgentV1(seed=seed, silence_penalty=0.02, truth_min_to_speak=0.10, min_strength_to_predict=0.10, eligibility_min_to_consider=0.10, seed_proto_handles=True)
+    trainer = AggressiveTrainerV1(agent, partner_name=partner, seed=seed, drift_detector=kind)
+    triggers = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(samples // 1000):
+            m = trainer.train_round(batch_size=1000, drill_n=0, uncertainty_threshold=0.40, question_budget_per_round=40, probe_after_budget=True)
+            triggers += m["drift_trigger_indices"]
+    split = getattr(trainer.partner, "split_point", 500)
+    return sum(i < split for i in triggers), len(triggers), m["drift_detection_delay"]
+
+def main():
+    ap = argparse.ArgumentParser(description="Drift detectors: detection delay on rule-shift partners, and per-update cost")
+    ap.add_argument("--updates", type=int, default=1000000)
+    ap.add_argument("--seed", type=int, default=123)
+    args = ap.parse_args()
+
+    print(f"{'partner':<18} {'detector':<13} {'pre-shift':>9} {'triggers':>9} {'delay':>6}")
+    for partner, samples in (("mixed_shift", 1000), ("mixed_shift_large", 10000)):
+        for kind in KINDS:
+            early, total, delay = run(partner, kind, samples, args.seed)
+            print(f"{partner:<18} {kind:<13} {early:>9} {total:>9} {str(delay):>6}")
+
+    rng = random.Random(args.seed)
+    outcomes = [rng.random() < 0.4 for _ in range(args.updates)]
+    t0 = time.perf_counter()
+    list_window(outcomes)
+    base = (time.perf_counter() - t0) / len(outcomes)
+    print(f"\n{'detector':<22} {'ns/update':>10}")
+    print(f"{'list + pop(0) + sum()':<22} {base * 1e9:>10.0f}")
+    for kind in KINDS:
+        det = make_drift_detector(kind)
+        update = det.update
+        t0 = time.perf_counter()
+        for miss in outcomes:
+            update(miss)
+        print(f"{kind:<22} {(time.perf_counter() - t0) / len(outcomes) * 1e9:>10.0f}")
+
+if __name__ == "__main__":
+    main()
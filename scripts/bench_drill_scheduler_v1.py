@@ -0,0 +1,58 @@
+import time
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from q_ternary.training.aggressive_trainer_v1 import TrainingSample
+from q_ternary.training.drill_scheduler_v1 import DrillSchedulerV1
+
+def neighbour_drills(n: int, seed: int) -> list:
+    # One-pulse mutations around a few hundred missed sequences, as apply_boundary_drills makes them
+    rng = random.Random(seed)
+    misses = [tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 6))) for _ in range(300)]
+    out = []
+    for _ in range(n):
+        sent = list(rng.choice(misses))
+        i = rng.randrange(len(sent))
+        sent[i] = max(1, sent[i] + rng.choice([-1, 1]))
+        out.append((TrainingSample(sent=tuple(sent), synthetic_drill=True), rng.random() * 2))
+    return out
+
+def main():
+    ap = argparse.ArgumentParser(description="Drill queue: FIFO list with pop(0) vs deduplicating priority scheduler")
+    ap.add_argument("--drills", type=int, default=200000)
+    ap.add_argument("--capacity", type=int, default=4096)
+    ap.add_argument("--batch", type=int, default=200, help="Drills taken per round")
+    ap.add_argument("--seed", type=int, default=3)
+    args = ap.parse_args()
+
+    drills = neighbour_drills(args.drills, args.seed)
+    rounds = args.drills // (args.batch * 5)
+    per_round = len(drills) // rounds
+
+    def run(queue, push, pop):
+        # Each round queues its drills, then takes a batch off the front
+        taken = []
+        t0 = time.perf_counter()
+        for r in range(rounds):
+            for d in drills[r * per_round:(r + 1) * per_round]:
+                push(queue, d)
+            taken.append([pop(queue) for _ in range(min(args.batch, len(queue)))])
+        return time.perf_counter() - t0, taken, len(queue)
+
+    fifo_s, fifo_taken, fifo_left = run([], lambda q, d: q.append(d[0]), lambda q: q.pop(0))
+    sched = DrillSchedulerV1(capacity=args.capacity)
+    sched_s, sched_taken, sched_left = run(sched, lambda q, d: q.push(*d), lambda q: q.pop())
+
+    def distinct(taken):
+        # Share of each round's batch that isn't a repeat within that batch
+        return sum(len({s.sent for s in b}) for b in taken) / max(1, sum(map(len, taken)))
+
+    print(f"{args.drills} drills over {rounds} rounds, {args.batch} taken per round")
+    print(f"{'queue':<22} {'seconds':>8} {'left queued':>12} {'distinct/batch':>15}")
+    print(f"{'list + pop(0)':<22} {fifo_s:>8.2f} {fifo_left:>12} {distinct(fifo_taken):>14.0%}")
+    print(f"{'DrillSchedulerV1':<22} {sched_s:>8.2f} {sched_left:>12} {distinct(sched_taken):>14.0%}   (merged {sched.merged}, dropped {sched.dropped})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import os
+import time
+import argparse
+import itertools
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.alien_partners_v1 import make_partner
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.sweep_v1 import fork_map
+
+def run(agent: BootstrapAgentV1, start: int, steps: int) -> BootstrapAgentV1:
+    partner = make_partner("mixed")
+    for t in range(start, start + steps):
+        sent = agent.choose_action(t)
+        d = agent.predict(sent)
+        agent.observe(sent, partner.respond(sent), learn=True, decision=d)
+        agent._apply_handle_decay()
+    return agent
+
+def private_kib() -> int:
+    # Pages this process has written to (not shared with the sweep parent); Linux only
+    try:
+        with open("/proc/self/smaps_rollup") as f:
+            return sum(int(line.split()[1]) for line in f if line.startswith(("Private_Dirty", "Private_Clean")))
+    except OSError:
+        return -1
+
+def main():
+    ap = argparse.ArgumentParser(description="Parameter sweep: N full runs vs fork() vs fork_map() from one warm agent")
+    ap.add_argument("--warmup", type=int, default=50000)
+    ap.add_argument("--steps", type=int, default=1000)
+    ap.add_argument("--processes", type=int, default=0)
+    args = ap.parse_args()
+
+    configs = [
+        dict(decay_rate=r, compete_topk=k, inhibit_mult=m, conflict_margin=c)
+        for r, k, m, c in itertools.product((0.0, 0.002), (0, 2), (0.0, 0.1), (0.1, 0.2))
+    ]
+    base = dict(seed=1, promote_threshold=2, seed_proto_handles=True)
+    end = args.warmup + 1
+
+    t0 = time.perf_counter()
+    parent = run(BootstrapAgentV1(**base), 1, args.warmup)
+    warm = time.perf_counter() - t0
+    print(f"warm-up: {args.warmup} steps, {len(parent._handles)} handles, {warm:.2f}s; {len(configs)} configs x {args.steps} steps")
+
+    # N full runs re-pay the warm-up every time
+    t0 = time.perf_counter()
+    for cfg in configs:
+        child = run(BootstrapAgentV1(**base), 1, args.warmup)
+        child._configure(cfg)
+        run(child, end, args.steps)
+    full = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    fork_s = 0.0
+    for cfg in configs:
+        f0 = time.perf_counter()
+        child = parent.fork(**cfg)
+        fork_s += time.perf_counter() - f0
+        run(child, end, args.steps)
+    forked = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    private = fork_map(lambda a: (run(a, end, args.steps), private_kib())[1], parent, configs, processes=args.processes or None)
+    mapped = time.perf_counter() - t0
+
+    print(f"{'mode':<30} {'seconds':>8} {'vs full':>8}")
+    print(f"{'full runs (warm-up each)':<30} {full:>8.2f} {1.0:>7.2f}x")
+    print(f"{'fork() in process':<30} {warm + forked:>8.2f} {full / (warm + forked):>7.2f}x   (clone {fork_s / len(configs) * 1e3:.1f} ms each)")
+    print(f"{'fork_map() os.fork children':<30} {warm + mapped:>8.2f} {full / (warm + mapped):>7.2f}x   ({os.cpu_count()} CPUs)")
+    if min(private) >= 0:
+        print(f"child private memory: avg {sum(private) / len(private) / 1024:.1f} MiB, parent total {private_kib() / 1024:.1f} MiB")
+
+if __name__ == "__main__":
+    main()
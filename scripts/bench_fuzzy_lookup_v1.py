@@ -0,0 +1,68 @@
+import time
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.alien_partners_v1 import make_partner
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.channel_v1 import ChannelV1
+from constraint_bootstrap.sequence_index_v1 import SequenceIndexV1, pulse_distance
+from constraint_bootstrap.signatures_v1 import SIGS
+from q_ternary.lane_v1 import Lane
+
+def lookup_cost(n: int, queries: int, radius: int, seed: int):
+    rng = random.Random(seed)
+    ids = list({SIGS.id_of(tuple(rng.randint(1, 40) for _ in range(rng.randint(2, 6)))) for _ in range(n)})
+    index = SequenceIndexV1()
+    for sid in ids:
+        index.add(sid)
+    # Jittered copies of indexed sequences (near hits) mixed with fresh ones (mostly misses)
+    qs = [tuple(max(1, p + rng.randint(-1, 1)) for p in SIGS.seq_of(rng.choice(ids))) if i % 2 else tuple(rng.randint(1, 40) for _ in range(rng.randint(2, 6))) for i in range(queries)]
+    t0 = time.perf_counter()
+    for q in qs:
+        index.nearest(q, radius)
+    tree = (time.perf_counter() - t0) / queries
+    seqs = [SIGS.seq_of(i) for i in ids]
+    t0 = time.perf_counter()
+    for q in qs[:max(1, queries // 10)]:
+        min(((pulse_distance(q, s), i) for s, i in zip(seqs, ids) if len(s) == len(q) and pulse_distance(q, s) <= radius), default=None)
+    scan = (time.perf_counter() - t0) / max(1, queries // 10)
+    return len(ids), tree, scan
+
+def noisy_run(steps: int, tol: float, noise: float, seed: int):
+    agent = BootstrapAgentV1(seed=seed, promote_threshold=2, decay_rate=0.002, fuzzy_tolerance=tol)
+    partner = make_partner("mixed")
+    chan = ChannelV1(noise_prob=noise, noise_jitter=1, seed=seed)
+    spoke = err = 0.0
+    t0 = time.perf_counter()
+    for t in range(1, steps + 1):
+        ex = chan.transmit(*(lambda s: (s, partner.respond(s)))(agent.choose_action(t)))
+        d = agent.predict(ex.sent)
+        m = agent.observe(ex.sent, ex.received, decision=d)
+        spoke += d.lane == Lane.SPEAK
+        err += m.error
+    return len(agent._handles), len(agent._seen_counts), spoke / steps, err / steps, steps / (time.perf_counter() - t0)
+
+def main():
+    ap = argparse.ArgumentParser(description="Fuzzy handle lookup: BK-tree vs scan, and registry growth under channel noise")
+    ap.add_argument("--sizes", default="1000,10000,100000")
+    ap.add_argument("--radius", type=int, default=2)
+    ap.add_argument("--steps", type=int, default=20000)
+    ap.add_argument("--noise-prob", type=float, default=0.3)
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    print(f"{'signatures':>10} {'bk-tree us/query':>17} {'scan us/query':>14}")
+    for n in [int(x) for x in args.sizes.split(",")]:
+        size, tree, scan = lookup_cost(n, 2000, args.radius, args.seed)
+        print(f"{size:>10} {tree * 1e6:>17.1f} {scan * 1e6:>14.1f}")
+
+    print(f"\nmixed partner, {args.steps} steps, noise_prob={args.noise_prob} jitter=1")
+    print(f"{'tolerance':>9} {'handles':>8} {'seen pairs':>11} {'speak rate':>11} {'mean error':>11} {'steps/s':>9}")
+    for tol in (0.0, 0.25, 0.5):
+        handles, seen, speak, err, rate = noisy_run(args.steps, tol, args.noise_prob, args.seed)
+        print(f"{tol:>9.2f} {handles:>8} {seen:>11} {speak:>11.3f} {err:>11.3f} {rate:>9,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+import time
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+
+def fill_registry(agent: BootstrapAgentV1, n: int) -> None:
+    # Background handles on signatures the probe steps never send
+    for i in range(n):
+        agent._handles.append(Handle(hid=f"H{i:03d}", sent_sig=f"100,{i}", resp_sig="5", eligibility=0.5, truth=0.5))
+
+def bench(n: int, steps: int) -> float:
+    agent = BootstrapAgentV1(seed=123, promote_threshold=2)
+    fill_registry(agent, n)
+    probes = [((1, 2), (7,)), ((3, 3, 3), (5,)), ((8, 4), (5,)), ((2, 2), (7,))]
+
+    t0 = time.perf_counter()
+    for t in range(steps):
+        sent, recv = probes[t % len(probes)]
+        agent.observe(sent, recv, learn=True)
+    return (time.perf_counter() - t0) / steps
+
+def main():
+    ap = argparse.ArgumentParser(description="Per-step latency vs registry size (sent_sig index)")
+    ap.add_argument("--sizes", default="100,1000,10000,100000,1000000")
+    ap.add_argument("--steps", type=int, default=2000)
+    args = ap.parse_args()
+
+    print(f"{'handles':>10}  {'us/step':>10}")
+    for n in [int(x) for x in args.sizes.split(",")]:
+        per_step = bench(n, args.steps)
+        print(f"{n:>10}  {per_step * 1e6:>10.1f}")
+
+if __name__ == "__main__":
+    main()
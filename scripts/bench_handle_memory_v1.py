@@ -0,0 +1,53 @@
+import argparse
+import tracemalloc
+from dataclasses import dataclass
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import Handle, _sig
+from constraint_bootstrap.signatures_v1 import SIGS
+
+@dataclass
+class LegacyHandle:
+    """The pre-slots Handle layout: dict-backed instance, string id, fresh signature strings."""
+    hid: str
+    sent_sig: str
+    resp_sig: str
+    eligibility: float = 0.25
+    truth: float = 0.1
+    hits: int = 0
+    misses: int = 0
+
+def _proto_stream(n: int):
+    # Proto-seeding traffic: many distinct sent signatures, few distinct responses
+    for i in range(n):
+        sent = (1 + i % 12, 1 + (i // 12) % 12, 1 + i // 144)
+        yield i + 1, sent, (5,) if i % 3 else (7,)
+
+def bytes_per_handle(n: int, legacy: bool) -> float:
+    # Slotted handles store signature ids; the SIGS table entries they create are counted too
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    if legacy:
+        handles = [LegacyHandle(hid=f"H{i:03d}", sent_sig=_sig(s), resp_sig=_sig(r), truth=0.0) for i, s, r in _proto_stream(n)]
+    else:
+        handles = [Handle(hid=i, sent_sig=SIGS.id_of(s), resp_sig=SIGS.id_of(r), truth=0.0) for i, s, r in _proto_stream(n)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    per = (after - before) / n
+    del handles
+    return per
+
+def main():
+    ap = argparse.ArgumentParser(description="Bytes per handle: legacy dataclass vs slotted Handle")
+    ap.add_argument("--n", type=int, default=200000)
+    args = ap.parse_args()
+
+    legacy = bytes_per_handle(args.n, legacy=True)
+    slotted = bytes_per_handle(args.n, legacy=False)
+    print(f"handles:            {args.n}")
+    print(f"legacy bytes/handle:  {legacy:8.1f}")
+    print(f"slotted bytes/handle: {slotted:8.1f}  ({slotted / legacy:.0%} of legacy)")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import time
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+
+def fill_registry(agent: BootstrapAgentV1, n: int) -> None:
+    # Background handles with spread-out strengths, so decay keeps reshuffling the order
+    rng = random.Random(7)
+    for i in range(n):
+        agent._handles.append(Handle(hid=i + 1, sent_sig=f"100,{i}", resp_sig="5", eligibility=rng.random(), truth=rng.random()))
+
+def bench(n: int, steps: int, full_sort: bool, decay_rate: float) -> float:
+    agent = BootstrapAgentV1(seed=123, promote_threshold=2, decay_rate=decay_rate, lazy_decay=True)
+    fill_registry(agent, n)
+    agent.top_handles(3) # one-time heap build
+    probes = [((1, 2), (7,)), ((3, 3, 3), (5,)), ((8, 4), (5,)), ((2, 2), (7,))]
+
+    t0 = time.perf_counter()
+    for t in range(steps):
+        sent, recv = probes[t % len(probes)]
+        agent.predict(sent)
+        agent.observe(sent, recv, learn=True)
+        # What demo_bootstrap_v1 reads every step
+        top = agent.handles[:3] if full_sort else agent.top_handles(3)
+    return (time.perf_counter() - t0) / steps
+
+def main():
+    ap = argparse.ArgumentParser(description="Per-step latency with a top-3 read: full sort vs ranking heap")
+    ap.add_argument("--sizes", default="100,1000,10000,100000")
+    ap.add_argument("--steps", type=int, default=500)
+    ap.add_argument("--decay-rate", type=float, default=0.01)
+    args = ap.parse_args()
+
+    print(f"{'handles':>10}  {'sort us/step':>14}  {'top(k) us/step':>14}")
+    for n in [int(x) for x in args.sizes.split(",")]:
+        sort_step = bench(n, args.steps, True, args.decay_rate)
+        top_step = bench(n, args.steps, False, args.decay_rate)
+        print(f"{n:>10}  {sort_step * 1e6:>14.1f}  {top_step * 1e6:>14.1f}")
+
+if __name__ == "__main__":
+    main()
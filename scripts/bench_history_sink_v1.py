@@ -0,0 +1,61 @@
+import io
+import os
+import sys
+import time
+import resource
+import argparse
+import tempfile
+import contextlib
+import subprocess
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+from q_ternary.training.history_sink_v1 import make_history
+
+SINKS = ("memory", "ring", "spill-jsonl", "spill-binary")
+
+def child(sink: str, samples: int, batch: int, workdir: str) -> None:
+    # One run in a fresh process, so peak RSS belongs to this sink alone
+    os.chdir(workdir)
+    kind, _, fmt = sink.partition("-")
+    history = make_history(kind, size=1000, path=f"history.{fmt or 'jsonl'}", fmt=fmt or "jsonl")
+    agent = BootstrapAgentV1(seed=1, seed_proto_handles=True, truth_min_to_speak=0.1, min_strength_to_predict=0.1, eligibility_min_to_consider=0.1)
+    trainer = AggressiveTrainerV1(agent, partner_name="mixed", seed=1, history=history)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(samples // batch):
+            trainer.train_round(batch_size=batch, drill_n=0, uncertainty_threshold=0.1)
+    train_s = time.perf_counter() - t0
+    rss_train = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    trainer.save_run({})
+    save_s = time.perf_counter() - t0
+    history.close()
+    print(train_s, save_s, rss_train, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+def main():
+    ap = argparse.ArgumentParser(description="Trainer history sinks: peak memory and time for a long run")
+    ap.add_argument("--samples", type=int, default=100000)
+    ap.add_argument("--batch", type=int, default=5000)
+    ap.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    ap.add_argument("--workdir", default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        child(args.child, args.samples, args.batch, args.workdir)
+        return
+
+    print(f"{args.samples} samples in rounds of {args.batch}")
+    print(f"{'history':<14} {'train s':>8} {'save_run s':>10} {'peak MiB train':>15} {'peak MiB save':>14}")
+    for sink in SINKS:
+        with tempfile.TemporaryDirectory() as workdir:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", sink, "--samples", str(args.samples), "--batch", str(args.batch), "--workdir", workdir],
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+        train_s, save_s, rss_train, rss_save = float(out[0]), float(out[1]), int(out[2]), int(out[3])
+        print(f"{sink:<14} {train_s:>8.2f} {save_s:>10.2f} {rss_train / 1024:>15.0f} {rss_save / 1024:>14.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+import io
+import time
+import random
+import argparse
+import contextlib
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+
+def stream(n: int, seed: int):
+    rng = random.Random(seed)
+    sents = [tuple(rng.randint(1, 6) for _ in range(rng.randint(1, 3))) for _ in range(n)]
+    return sents, [(sum(s) % 5,) for s in sents]
+
+def counted(agent: BootstrapAgentV1) -> BootstrapAgentV1:
+    # Count candidate searches (predict calls, including the ones observe makes)
+    agent.searches = 0
+    predict = agent.predict
+    def wrapped(sent):
+        agent.searches += 1
+        return predict(sent)
+    agent.predict = wrapped
+    return agent
+
+def demo_loop(n: int, seed: int, reuse: bool):
+    # Demo-style step: predict, then learn from the exchange
+    agent = counted(BootstrapAgentV1(seed=seed, promote_threshold=2, seed_proto_handles=True, decay_rate=0.003))
+    sents, recvs = stream(n, seed)
+    t0 = time.perf_counter()
+    for s, r in zip(sents, recvs):
+        d = agent.predict(s)
+        agent.observe(s, r, learn=True, decision=d if reuse else None)
+    return time.perf_counter() - t0, agent.searches / n
+
+def trainer_rounds(rounds: int, batch: int, seed: int, reuse: bool):
+    agent = counted(BootstrapAgentV1(seed=seed, seed_proto_handles=True))
+    if not reuse:
+        # The pre-change trainer: observe() ignores the decision and predicts again
+        observe = agent.observe
+        agent.observe = lambda *a, decision=None, **kw: observe(*a, **kw)
+    tr = AggressiveTrainerV1(agent, partner_name="mixed", seed=seed)
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(rounds):
+            tr.train_round(batch_size=batch, drill_n=3, uncertainty_threshold=0.4)
+    return time.perf_counter() - t0, agent.searches / (rounds * batch)
+
+def main():
+    ap = argparse.ArgumentParser(description="Steps/sec: observe() re-predicting vs observe(decision=...)")
+    ap.add_argument("--steps", type=int, default=200000)
+    ap.add_argument("--rounds", type=int, default=5)
+    ap.add_argument("--batch", type=int, default=400)
+    ap.add_argument("--seed", type=int, default=5)
+    args = ap.parse_args()
+
+    print(f"{'loop':<8} {'re-predict steps/s':>19} {'decision= steps/s':>18} {'speedup':>8} {'searches/step':>14}")
+    for name, run, n in (
+        ("demo", lambda reuse: demo_loop(args.steps, args.seed, reuse), args.steps),
+        ("trainer", lambda reuse: trainer_rounds(args.rounds, args.batch, args.seed, reuse), args.rounds * args.batch),
+    ):
+        (old, old_s), (new, new_s) = run(False), run(True)
+        print(f"{name:<8} {n / old:>19,.0f} {n / new:>18,.0f} {old / new:>7.2f}x {old_s:>6.2f} -> {new_s:.2f}")
+
+if __name__ == "__main__":
+    main()
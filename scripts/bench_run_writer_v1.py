@@ -0,0 +1,77 @@
+import io
+import os
+import sys
+import json
+import time
+import resource
+import argparse
+import tempfile
+import contextlib
+import subprocess
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+from q_ternary.training.history_sink_v1 import RingHistoryV1, history_row
+
+MODES = ("dict+indent", "save_run", "start_run+ring")
+
+def legacy_save(trainer: AggressiveTrainerV1, path: str) -> None:
+    # The previous save_run: one dict for the whole run, a full handle sort per row, indent=2
+    rows = []
+    for r in trainer.history:
+        row = history_row(r)
+        row["top_candidates"] = [
+            {"hid": h.hid, "eligibility": h.eligibility, "truth": h.truth, "combined_strength": h.strength}
+            for h in trainer.agent.handles[:3] if h.sent_sig == row["sent"]
+        ]
+        rows.append(row)
+    with open(path, "w") as f:
+        json.dump({"metadata": {}, "summary": {}, "history": rows}, f, indent=2)
+
+def child(mode: str, samples: int, batch: int, workdir: str) -> None:
+    # One run in a fresh process, so peak RSS belongs to this mode alone
+    os.chdir(workdir)
+    agent = BootstrapAgentV1(seed=1, seed_proto_handles=True, truth_min_to_speak=0.1, min_strength_to_predict=0.1, eligibility_min_to_consider=0.1)
+    trainer = AggressiveTrainerV1(agent, partner_name="mixed", seed=1, history=RingHistoryV1(1000) if "ring" in mode else None)
+    if mode.startswith("start_run"):
+        trainer.start_run()
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(samples // batch):
+            trainer.train_round(batch_size=batch, drill_n=0, uncertainty_threshold=0.1)
+    train_s = time.perf_counter() - t0
+    rss_train = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    t0 = time.perf_counter()
+    if mode == "dict+indent":
+        legacy_save(trainer, "run.json")
+    else:
+        trainer.save_run({})
+    save_s = time.perf_counter() - t0
+    print(train_s, save_s, rss_train, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss, len(agent._handles))
+
+def main():
+    ap = argparse.ArgumentParser(description="Run reports: save_run time and peak memory, written at the end or streamed")
+    ap.add_argument("--samples", type=int, default=20000)
+    ap.add_argument("--batch", type=int, default=2000)
+    ap.add_argument("--child", default=None, help=argparse.SUPPRESS)
+    ap.add_argument("--workdir", default=None, help=argparse.SUPPRESS)
+    args = ap.parse_args()
+    if args.child:
+        child(args.child, args.samples, args.batch, args.workdir)
+        return
+
+    print(f"{args.samples} samples in rounds of {args.batch}")
+    print(f"{'report':<16} {'handles':>8} {'train s':>8} {'save s':>8} {'peak MiB train':>15} {'peak MiB save':>14}")
+    for mode in MODES:
+        with tempfile.TemporaryDirectory() as workdir:
+            out = subprocess.run(
+                [sys.executable, __file__, "--child", mode, "--samples", str(args.samples), "--batch", str(args.batch), "--workdir", workdir],
+                check=True, capture_output=True, text=True,
+            ).stdout.split()
+        train_s, save_s, rss_train, rss_save, handles = float(out[0]), float(out[1]), int(out[2]), int(out[3]), int(out[4])
+        print(f"{mode:<16} {handles:>8} {train_s:>8.2f} {save_s:>8.2f} {rss_train / 1024:>15.0f} {rss_save / 1024:>14.0f}")
+
+if __name__ == "__main__":
+    main()
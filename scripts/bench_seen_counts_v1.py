@@ -0,0 +1,63 @@
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.alien_partners_v1 import make_partner
+from constraint_bootstrap.channel_v1 import ChannelV1
+from constraint_bootstrap.correlation_counts_v1 import ExactPairCountsV1, make_pair_counts
+from constraint_bootstrap.signatures_v1 import seq_key
+
+def pair_stream(n: int, seed: int, noise_prob: float):
+    # Trainer-style traffic: mostly random 1-10 pulse sends, some repeated probes, noisy channel
+    rng = random.Random(seed)
+    partner = make_partner("mixed")
+    chan = ChannelV1(noise_prob=noise_prob, noise_jitter=1, seed=seed)
+    for _ in range(n):
+        if rng.random() < 0.2:
+            sent = (1, 1)
+        else:
+            sent = tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 10)))
+        ex = chan.transmit(sent, partner.respond(sent))
+        # The agent's bounded counters key pairs on content fingerprints
+        yield seq_key(ex.sent), seq_key(ex.received)
+
+def measure(mode: str, budget: int, n: int, threshold: int, seed: int, noise_prob: float):
+    """Promotion events (first time a pair reaches threshold) vs an exact shadow count, and the counter's own estimate."""
+    counts = make_pair_counts(mode, budget, seed=seed)
+    exact = ExactPairCountsV1()
+    promoted = set()
+    false_promotions = 0
+    for key in pair_stream(n, seed, noise_prob):
+        true_n = exact.add(key)
+        if counts.add(key) >= threshold and key not in promoted:
+            promoted.add(key)
+            counts.promoted(key, threshold)
+            if true_n < threshold:
+                false_promotions += 1
+    should = sum(1 for c in exact.values() if c >= threshold)
+    missed = sum(1 for k, c in exact.items() if c >= threshold and k not in promoted)
+    return len(promoted), false_promotions, should, missed, len(exact), counts.stats()
+
+def main():
+    ap = argparse.ArgumentParser(description="False/missed promotion rates of bounded seen-counts modes")
+    ap.add_argument("--n", type=int, default=200000)
+    ap.add_argument("--threshold", type=int, default=4)
+    ap.add_argument("--noise-prob", type=float, default=0.2)
+    ap.add_argument("--budgets", default="16384,65536,262144,1048576")
+    ap.add_argument("--seed", type=int, default=123)
+    args = ap.parse_args()
+
+    print(f"{'mode':>7} {'budget':>9} {'promoted':>9} {'false':>7} {'false%':>7} {'est%':>7} {'audited':>8} {'missed':>7} {'missed%':>8}")
+    exact_pairs = None
+    for budget in [int(x) for x in args.budgets.split(",")]:
+        for mode in ("lru", "sketch"):
+            promoted, false, should, missed, exact_pairs, stats = measure(mode, budget, args.n, args.threshold, args.seed, args.noise_prob)
+            print(
+                f"{mode:>7} {budget:>9} {promoted:>9} {false:>7} {false / max(1, promoted):>7.2%} {stats['false_promotion_rate']:>7.2%} {stats.get('audited_promotions', '-'):>8} "
+                f"{missed:>7} {missed / max(1, should):>8.2%}"
+            )
+    print(f"exact map: {exact_pairs} distinct pairs (~{exact_pairs * 172 / 1024:.0f} KiB), {should} reach threshold")
+
+if __name__ == "__main__":
+    main()
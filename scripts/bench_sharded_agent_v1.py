@@ -0,0 +1,52 @@
+import os
+import time
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.sharded_agent_v1 import ShardedBootstrapAgentV1
+
+def traffic(n: int, seed: int):
+    # Trainer-style samples: random lengths and pulses, a fixed rule as the partner
+    rng = random.Random(seed)
+    sents = [tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 4))) for _ in range(n)]
+    return sents, [(sum(s) % 7,) for s in sents]
+
+def run(agent, sents, recvs, batch: int) -> float:
+    sharded = isinstance(agent, ShardedBootstrapAgentV1)
+    t0 = time.perf_counter()
+    for i in range(0, len(sents), batch):
+        s, r = sents[i:i + batch], recvs[i:i + batch]
+        decisions = agent.predict_batch(s)
+        if sharded:
+            agent.observe_batch(s, r, decisions=decisions)
+        else:
+            for x, y, d in zip(s, r, decisions):
+                agent.observe(x, y, decision=d)
+    return time.perf_counter() - t0
+
+def main():
+    ap = argparse.ArgumentParser(description="Steps/sec: one agent vs ShardedBootstrapAgentV1 on large batches")
+    ap.add_argument("--steps", type=int, default=50000)
+    ap.add_argument("--batch", type=int, default=4000)
+    ap.add_argument("--shards", default="2,4")
+    ap.add_argument("--decay-rate", type=float, default=0.001)
+    ap.add_argument("--lazy-decay", action="store_true")
+    ap.add_argument("--seed", type=int, default=1)
+    args = ap.parse_args()
+
+    config = dict(seed=args.seed, promote_threshold=2, decay_rate=args.decay_rate, lazy_decay=args.lazy_decay, telemetry="minimal")
+    sents, recvs = traffic(args.steps, args.seed)
+    base = run(BootstrapAgentV1(**config), sents, recvs, args.batch)
+    print(f"{os.cpu_count()} CPUs, {args.steps} steps, batch {args.batch}, decay {args.decay_rate} ({'lazy' if args.lazy_decay else 'eager'})")
+    print(f"{'agent':<12} {'steps/s':>10} {'vs single':>10}")
+    print(f"{'single':<12} {args.steps / base:>10,.0f} {1.0:>9.2f}x")
+    for n in [int(x) for x in args.shards.split(",")]:
+        with ShardedBootstrapAgentV1(shards=n, **config) as agent:
+            t = run(agent, sents, recvs, args.batch)
+        print(f"{f'{n} shards':<12} {args.steps / t:>10,.0f} {base / t:>9.2f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import time
+import random
+import argparse
+import gc
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+
+def stream(n: int, seed: int):
+    rng = random.Random(seed)
+    sents = [tuple(rng.randint(1, 6) for _ in range(rng.randint(1, 3))) for _ in range(n)]
+    return sents, [(sum(s) % 5,) for s in sents]
+
+def warm_agent(telemetry: str, seed: int, warmup: int) -> BootstrapAgentV1:
+    agent = BootstrapAgentV1(seed=seed, promote_threshold=2, seed_proto_handles=True, question_cooldown_n=2, telemetry=telemetry)
+    for s, r in zip(*stream(warmup, seed + 1)):
+        agent.observe(s, r, learn=True, decision=agent.predict(s))
+    return agent
+
+def predict_loop(agent: BootstrapAgentV1, sents, batch: int):
+    # Throughput-style caller: only lane/act are read
+    speaks = 0
+    if batch > 1:
+        for i in range(0, len(sents), batch):
+            speaks += sum(d.act is not None for d in agent.predict_batch(sents[i:i + batch]))
+    else:
+        for s in sents:
+            speaks += agent.predict(s).act is not None
+    return speaks
+
+def main():
+    ap = argparse.ArgumentParser(description="predict() throughput and allocations: telemetry=full vs minimal")
+    ap.add_argument("--steps", type=int, default=200000)
+    ap.add_argument("--warmup", type=int, default=5000)
+    ap.add_argument("--seed", type=int, default=5)
+    args = ap.parse_args()
+
+    sents, _ = stream(args.steps, args.seed)
+    # Per-step garbage shows up as young-generation collections (meta dicts are GC-tracked)
+    print(f"{'loop':<14} {'full steps/s':>13} {'minimal steps/s':>16} {'speedup':>8} {'gen0 GCs full':>14} {'minimal':>8}")
+    for name, batch in (("predict", 1), ("predict_batch", 256)):
+        rate, gcs = {}, {}
+        for level in ("full", "minimal"):
+            agent = warm_agent(level, args.seed, args.warmup)
+            gc.collect()
+            before = gc.get_stats()[0]["collections"]
+            t0 = time.perf_counter()
+            predict_loop(agent, sents, batch)
+            rate[level] = args.steps / (time.perf_counter() - t0)
+            gcs[level] = gc.get_stats()[0]["collections"] - before
+        print(f"{name:<14} {rate['full']:>13,.0f} {rate['minimal']:>16,.0f} {rate['minimal'] / rate['full']:>7.2f}x {gcs['full']:>14} {gcs['minimal']:>8}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+import time
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.signatures_v1 import SIGS
+
+def contested_agent(k: int, seed: int) -> BootstrapAgentV1:
+    # k competing handles on the adversarial partner's target signature
+    rng = random.Random(seed)
+    agent = BootstrapAgentV1(seed=seed)
+    sent_id = SIGS.id_of((8, 4))
+    for i in range(k):
+        agent._handles.append(Handle(hid=i + 1, sent_sig=sent_id, resp_sig=SIGS.id_of((i,)), eligibility=rng.uniform(0.3, 1.0), truth=rng.uniform(0.3, 1.0), hits=rng.randint(0, 20)))
+    return agent
+
+def sorted_route(agent: BootstrapAgentV1, sent_id: int) -> tuple:
+    # The previous per-call routing: sort the bucket, filter, truncate
+    matches = agent._handles.for_sent(sent_id)
+    cands = [h for h in matches if h.eligibility >= agent.eligibility_min_to_consider]
+    cands.sort(key=lambda h: (h.strength, h.hits), reverse=True)
+    active = [h for h in cands if h.strength >= agent.min_strength_to_predict]
+    if agent.compete_topk > 0:
+        active = active[:agent.compete_topk]
+    return len(matches), len(cands), active[:2]
+
+def rate(fn, n: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(n):
+        fn()
+    return n / (time.perf_counter() - t0)
+
+def main():
+    ap = argparse.ArgumentParser(description="Routing cost on a contested signature: sorted candidates vs per-signature top-2")
+    ap.add_argument("--sizes", default="2,8,32,128")
+    ap.add_argument("--calls", type=int, default=100000)
+    ap.add_argument("--seed", type=int, default=3)
+    args = ap.parse_args()
+
+    sent = (8, 4)
+    sent_id = SIGS.id_of(sent)
+    print(f"{'handles':>8} {'sort routes/s':>14} {'top2 routes/s':>14} {'speedup':>8} {'predict/s':>10} {'after update':>13}")
+    for k in [int(x) for x in args.sizes.split(",")]:
+        agent = contested_agent(k, args.seed)
+        old = rate(lambda: sorted_route(agent, sent_id), args.calls)
+        new = rate(lambda: agent._gates(sent_id), args.calls)
+        pred = rate(lambda: agent.predict(sent), args.calls)
+        # Worst case: the bucket is handed out (as observe() does) before every read
+        miss = rate(lambda: (agent._handles.for_sent(sent_id), agent._gates(sent_id)), args.calls // 4)
+        print(f"{k:>8} {old:>14,.0f} {new:>14,.0f} {new / old:>7.1f}x {pred:>10,.0f} {miss:>13,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+import time
+import random
+import argparse
+
+import _bench_common # puts src/ on sys.path
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.signatures_v1 import SIGS
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1, TrainingSample
+
+def full_scan_uncertainty(agent: BootstrapAgentV1, sent_id: int) -> float:
+    # The previous compute_uncertainty: filter the fully sorted registry
+    cands = [h for h in agent.handles if h.sent_id == sent_id and h.strength >= agent.min_strength_to_predict]
+    if not cands:
+        return 1.0
+    if agent.compete_topk > 0:
+        cands = cands[:agent.compete_topk]
+    return cands[0].strength - (cands[1].strength if len(cands) > 1 else 0.0)
+
+def grown_agent(n: int, seed: int) -> BootstrapAgentV1:
+    # n handles, about 4 per signature
+    rng = random.Random(seed)
+    agent = BootstrapAgentV1(seed=seed)
+    pool = [tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 6))) for _ in range(max(1, n // 4))]
+    for i in range(n):
+        sent = rng.choice(pool)
+        agent._handles.append(Handle(hid=i + 1, sent_sig=SIGS.id_of(sent), resp_sig=SIGS.id_of((i % 7,)), eligibility=rng.random(), truth=rng.random(), strength=rng.random(), hits=rng.randint(0, 20)))
+    return agent
+
+def main():
+    ap = argparse.ArgumentParser(description="Trainer uncertainty per sample: full registry sort vs per-signature top-2")
+    ap.add_argument("--sizes", default="1000,10000,50000")
+    ap.add_argument("--samples", type=int, default=500)
+    ap.add_argument("--seed", type=int, default=3)
+    args = ap.parse_args()
+
+    print(f"{'handles':>8} {'full sort us':>13} {'indexed us':>11} {'speedup':>8}")
+    for n in [int(x) for x in args.sizes.split(",")]:
+        agent = grown_agent(n, args.seed)
+        trainer = AggressiveTrainerV1(agent, seed=args.seed)
+        samples = [TrainingSample(sent=SIGS.seq_of(h.sent_id)) for h in random.Random(args.seed).choices(list(agent._handles), k=args.samples)]
+
+        # As in run_inference: predict, then the margin for the same sample
+        t0 = time.perf_counter()
+        old = []
+        for s in samples:
+            agent.predict(s.sent)
+            old.append(full_scan_uncertainty(agent, s.sent_id))
+        old_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        new = []
+        for s in samples:
+            agent.predict(s.sent)
+            new.append(trainer.compute_uncertainty(s.sent, s.sent_id))
+        new_s = time.perf_counter() - t0
+
+        assert new == old, "indexed margins differ from the full scan"
+        print(f"{n:>8} {old_s / len(samples) * 1e6:>13.1f} {new_s / len(samples) * 1e6:>11.1f} {old_s / new_s:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
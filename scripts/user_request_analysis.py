@@ -1,14 +1,19 @@
-import json
 from pathlib import Path
 import sys
 
-# Standardizing to the path used in the user's request
-p = Path(r"data/training_runs/run_20260106_024549.json")
+# Add src to sys.path
+sys.path.append(str(Path(__file__).parent.parent / "src"))
+
+from q_ternary.training.run_writer_v1 import load_run
+
+# Standardizing to the path used in the user's request; a report path on the command line overrides it
+p = Path(sys.argv[1] if len(sys.argv) > 1 else r"data/training_runs/run_20260106_024549.json")
 if not p.exists():
     print(f"File not found: {p}")
     sys.exit(1)
 
-obj = json.loads(p.read_text(encoding="utf-8"))
+# Streamed .jsonl reports and the older single-JSON ones
+obj = load_run(str(p))
 
 # Find the list of per-sample result dicts (robust to key name changes)
 candidates = []
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, List
+
+import numpy as np
+
+from .signatures_v1 import Seq
+
+if TYPE_CHECKING:
+    from .bootstrap_agent_v1 import BootstrapAgentV1
+
+# choose_action switches from the early phase to the probe mix at this step
+_EARLY_STEPS = 15
+
+
+class ActionStreamV1:
+    """
+    choose_action() as an iterator, with its randomness drawn in blocks from
+    a NumPy Generator instead of several random.Random calls per step.
+
+    Covers the same phases and distributions: the early phase (steps < 15),
+    the random / palindrome / 2:1 ratio probe mix, and the focus loop with its
+    one-pulse mutations. Exploration sequences are generated a block at a
+    time; the focus loop reads the agent's _focus_seq/_focus_left as it goes
+    (observe() sets them between pulls), using pre-drawn mutation numbers.
+
+    Reproducible from seed (default: the agent's seed) and block size, but a
+    different random stream than choose_action(): the two don't produce the
+    same sequences for the same seed.
+    """
+
+    def __init__(self, agent: "BootstrapAgentV1", seed: int | None = None, start: int = 1, block: int = 4096) -> None:
+        self.agent = agent
+        self.step = start # step the next action is for
+        self.block = max(1, block)
+        self._gen = np.random.default_rng(agent.seed if seed is None else seed)
+        self._explore: Iterator[Seq] = iter(())
+        self._mutate: List[tuple] = []
+        self._mutate_i = 0
+
+    def __iter__(self) -> Iterator[Seq]:
+        return self
+
+    def __next__(self) -> Seq:
+        step = self.step
+        self.step = step + 1
+        agent = self.agent
+        if agent._focus_left > 0 and agent._focus_seq is not None:
+            agent._focus_left -= 1
+            return self._focus(agent._focus_seq)
+        if step < _EARLY_STEPS:
+            return self._early()
+        seq = next(self._explore, None)
+        if seq is None:
+            self._explore = iter(self._probe_block(self.block))
+            seq = next(self._explore)
+        return seq
+
+    def _focus(self, seq: Seq) -> Seq:
+        # Usually repeat exactly; sometimes mutate one pulse by +/-1 (clamped to >=1)
+        if self._mutate_i == len(self._mutate):
+            g = self._gen
+            n = self.block
+            self._mutate = list(zip(g.random(n).tolist(), g.random(n).tolist(), (g.integers(0, 2, n) * 2 - 1).tolist()))
+            self._mutate_i = 0
+        roll, where, delta = self._mutate[self._mutate_i]
+        self._mutate_i += 1
+        if roll < self.agent.focus_mutate_prob and len(seq) > 0:
+            lst = list(seq)
+            idx = int(where * len(lst))
+            lst[idx] = max(1, lst[idx] + delta)
+            return tuple(lst)
+        return seq
+
+    def _early(self) -> Seq:
+        # Early phase: vary length heavily (1..7 pulses of 1..7)
+        g = self._gen
+        n = int(g.integers(1, 8))
+        return tuple(g.integers(1, 8, n).tolist())
+
+    def _probe_block(self, n: int) -> List[Seq]:
+        """n probe-phase sequences, laid out as rows of one padded matrix."""
+        g = self._gen
+        roll = g.random(n)
+        # random: 2..8 pulses of 1..9
+        rows = g.integers(1, 10, (n, 8))
+        lengths = g.integers(2, 9, n)
+        # palindrome: two-pulse half of 1..9, optional middle pulse
+        h0 = g.integers(1, 10, n)
+        h1 = g.integers(1, 10, n)
+        mid = g.integers(1, 10, n)
+        has_mid = g.random(n) < 0.5
+        # 2:1 ratio: (2b, b) + 0..2 tail pulses of 1..7
+        b = g.integers(1, 7, n)
+        tail = g.integers(1, 8, (n, 2))
+        tail_len = g.integers(0, 3, n)
+
+        pal = (roll >= 0.35) & (roll < 0.65)
+        rows[pal, :5] = np.stack([h0, h1, np.where(has_mid, mid, h1), np.where(has_mid, h1, h0), h0], axis=1)[pal]
+        lengths[pal] = np.where(has_mid, 5, 4)[pal]
+        ratio = roll >= 0.65
+        rows[ratio, :4] = np.column_stack([2 * b, b, tail])[ratio]
+        lengths[ratio] = (2 + tail_len)[ratio]
+        return [tuple(r[:k]) for r, k in zip(rows.tolist(), lengths.tolist())]
@@ -1,17 +1,51 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, List, Tuple
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import copy
 import random
 
 from .metrics_v1 import StepMetrics, response_error
-from q_ternary.lane_v1 import Decision, Lane
+from .handle_registry_v1 import HandleRegistryV1
+from .correlation_counts_v1 import ExactPairCountsV1, make_pair_counts
+from .signatures_v1 import SIGS, UNSEEN, as_sig_id, seq_key
+from q_ternary.lane_v1 import Decision, LazyDecision, Lane
 from q_ternary.training.clarify_templates_v1 import get_weak_knowledge_question, get_conflict_question, format_act
 
 Pulse = int
 Seq = Tuple[Pulse, ...]
 
-@dataclass
+# uid of handles with a free-form label (hand-built handles, tests); the label stays on the handle
+LABEL_UID = -1
+
+def _parse_hid(hid: int | str) -> Tuple[int, Optional[str]]:
+    """(uid, label) for an int id, its display form "H001", or a free-form label."""
+    if isinstance(hid, int):
+        return hid, None
+    if hid[:1] == "H" and hid[1:].isdigit():
+        return int(hid[1:]), None
+    return LABEL_UID, hid
+
+def _per_exchange(n: int, decisions: Optional[Sequence[Optional[Decision]]], flags: Optional[Sequence[Tuple[bool, bool, float]]], shared: Tuple[bool, bool, float]) -> tuple:
+    """observe_batch()'s decisions and flags, one per exchange (None / the shared flags where not given)."""
+    if decisions is None:
+        decisions = [None] * n
+    elif len(decisions) != n:
+        raise ValueError(f"observe_batch needs one decision (or None) per sent sequence ({len(decisions)} != {n})")
+    if flags is None:
+        flags = [shared] * n
+    elif len(flags) != n:
+        raise ValueError(f"observe_batch needs one (learn, update_truth, eligibility_bump) per sent sequence ({len(flags)} != {n})")
+    return decisions, flags
+
+def _hid_key(h: "Handle") -> int | str:
+    """What a decision keeps to name a handle: its uid, or its label if it has one."""
+    return h.uid if h._label is None else h._label
+
+def _hid_str(key: int | str) -> str:
+    """Display form of a _hid_key(): "H001", or the free-form label."""
+    return key if isinstance(key, str) else f"H{key:03d}"
+
 class Handle:
     """
     A handle is a revocable mapping:
@@ -21,21 +55,30 @@ class Handle:
     Split into two components:
     - eligibility: discoverability / relevance (grows on any observation)
     - truth: evidence-backed correctness (grows only on SPEAK corrections)
+
+    Slotted to keep per-handle memory small. The id is an int (uid); the
+    "Hnnn" form is only rendered for display and logs via .hid. A handle
+    built with a free-form label keeps it in _label (uid is LABEL_UID). Signatures
+    are SIGS ids (sent_id/resp_id); sent_sig/resp_sig render the string form.
+    The constructor takes either ids or signature strings.
     """
-    hid: str
-    sent_sig: str
-    resp_sig: str
-    eligibility: float = 0.25
-    truth: float = 0.1
-    hits: int = 0
-    misses: int = 0
-
-    def __init__(self, hid: str, sent_sig: str, resp_sig: str, eligibility: float = 0.25, truth: float = 0.1, hits: int = 0, misses: int = 0, strength: float = None):
-        self.hid = hid
-        self.sent_sig = sent_sig
-        self.resp_sig = resp_sig
+    __slots__ = (
+        "uid", "_label", "sent_id", "resp_id", "eligibility", "truth", "hits", "misses",
+        "decay_t", "prune_seq", "order_seq", # registry bookkeeping (lazy decay / prune heap / ranking)
+        "_store", "_row", # HandleTableV1 binding
+    )
+
+    def __init__(self, hid: int | str, sent_sig: int | str, resp_sig: int | str, eligibility: float = 0.25, truth: float = 0.1, hits: int = 0, misses: int = 0, strength: float = None):
+        self.uid, self._label = _parse_hid(hid)
+        self.sent_id = as_sig_id(sent_sig)
+        self.resp_id = as_sig_id(resp_sig)
         self.hits = hits
         self.misses = misses
+        self.decay_t = 0 # registry decay tick these values were materialized at
+        self.prune_seq = 0 # live prune-heap entry (registry bookkeeping)
+        self.order_seq = 0 # registry position, breaks ranking ties
+        self._store = None
+        self._row = -1
         if strength is not None:
             # For backward compatibility with tests that pass 'strength'
             self.eligibility = strength
@@ -44,6 +87,45 @@ class Handle:
             self.eligibility = eligibility
             self.truth = truth
 
+    @property
+    def hid(self) -> str:
+        return _hid_str(_hid_key(self))
+
+    @property
+    def sent_sig(self) -> str:
+        return SIGS.str_of(self.sent_id)
+
+    @sent_sig.setter
+    def sent_sig(self, sig: int | str) -> None:
+        self.sent_id = as_sig_id(sig)
+
+    @property
+    def resp_sig(self) -> str:
+        return SIGS.str_of(self.resp_id)
+
+    @resp_sig.setter
+    def resp_sig(self, sig: int | str) -> None:
+        # Registered handles should go through HandleRegistryV1.set_resp_sig()
+        self.resp_id = as_sig_id(sig)
+
+    @property
+    def resp_act(self) -> Seq:
+        return SIGS.seq_of(self.resp_id)
+
+    def clone(self) -> "Handle":
+        """Unregistered copy with the same id, signatures and values."""
+        return Handle(hid=_hid_key(self), sent_sig=self.sent_id, resp_sig=self.resp_id, eligibility=self.eligibility, truth=self.truth, hits=self.hits, misses=self.misses)
+
+    def __reduce__(self):
+        # SIGS ids are per process: a pickled handle (a worker's reply) carries its signatures as strings
+        return Handle, (_hid_key(self), self.sent_sig, self.resp_sig, self.eligibility, self.truth, self.hits, self.misses)
+
+    def __repr__(self) -> str:
+        return (
+            f"Handle(hid={self.hid!r}, sent_sig={self.sent_sig!r}, resp_sig={self.resp_sig!r}, "
+            f"eligibility={self.eligibility!r}, truth={self.truth!r}, hits={self.hits!r}, misses={self.misses!r})"
+        )
+
     @property
     def strength(self) -> float:
         """
@@ -77,8 +159,41 @@ class Handle:
                 self.truth = max(0.0, self.truth - 0.12)
 
 
+def _render_decision(template: str, args: tuple) -> Tuple[Optional[str], dict]:
+    """(question, meta) for a BootstrapAgentV1._plan() template and its args."""
+    if template == "no_match":
+        return None, {"candidate_count": 0, "eligible_count": 0, "had_any_match": False}
+    candidate_count, eligible_count, was_proto_seeded, on_cooldown = args[:4]
+    meta = {
+        "candidate_count": candidate_count,
+        "eligible_count": eligible_count,
+        "had_any_match": True,
+        "was_proto_seeded_predecision": was_proto_seeded,
+        "on_cooldown": on_cooldown
+    }
+    if template == "blocked":
+        return None, meta
+    if template == "speak":
+        hid, strength, eligibility, truth = args[4:]
+        meta.update({"hid": _hid_str(hid), "strength": strength, "eligibility": eligibility, "truth": truth})
+        return None, meta
+    if template == "nudge":
+        top1, act1, act2 = args[4:]
+        meta.update({"reason": "pre_eligible_nudge", "nudge": True, "top1": _hid_str(top1), "was_nudged_to_question": True})
+        return get_weak_knowledge_question(format_act(act1), format_act(act2)), meta
+    if template == "weak_knowledge":
+        top1, act1, act2, eligibility, truth = args[4:]
+        meta.update({"reason": "weak_knowledge", "top1": _hid_str(top1), "eligibility": eligibility, "truth": truth})
+        return get_weak_knowledge_question(format_act(act1), format_act(act2)), meta
+    margin, top1, top2, act1, act2, s1, s2 = args[4:] # conflict
+    meta.update({"reason": "conflict", "margin": margin, "top1": _hid_str(top1), "top2": _hid_str(top2), "s1": s1, "s2": s2})
+    return get_conflict_question(format_act(act1), format_act(act2)), meta
+
+# Fixed at construction (registry / counter types); fork() can't change them
+_FORK_FIXED = ("handle_backend", "seen_counts_mode", "seen_counts_budget")
+
 def _sig(seq: Seq) -> str:
-    """Cheap signature string used only internally (not meaning)."""
+    """Signature string for logs/JSON (not meaning). Internals use SIGS ids."""
     return ",".join(map(str, seq)) if seq else "0"
 
 @dataclass
@@ -107,18 +222,25 @@ class BootstrapAgentV1:
     seed_eligibility: float = 0.25
     question_cooldown_n: int = 0 # 0 means no cooldown, N means wait N steps before asking again
     question_eligibility_bump: float = 0.0 # bump eligibility on QUESTION-supervised events
+    lazy_decay: bool = False # decay on read ((1-rate)^dt) instead of sweeping every handle per step
+    handle_backend: str = "list" # "list" (Handle objects) | "table" (NumPy structure-of-arrays)
+    seen_counts_mode: str = "exact" # promotion counts: "exact" (unbounded) | "lru" | "sketch" (count-min)
+    seen_counts_budget: int = 1 << 20 # bytes, for the bounded seen_counts modes
+    telemetry: str = "full" # "full" | "minimal" (decisions render question/meta lazily, on access)
+    fuzzy_tolerance: float = 0.0 # > 0: a sent sequence without handles uses the nearest same-length one within this response_error
 
     _rng: random.Random = field(init=False)
-    _handles: List[Handle] = field(default_factory=list, init=False)
-    _seen_counts: Dict[Tuple[str, str], int] = field(default_factory=dict, init=False)
+    _registry: HandleRegistryV1 = field(default_factory=HandleRegistryV1, init=False)
+    _counts: ExactPairCountsV1 = field(default_factory=ExactPairCountsV1, init=False) # (sent_id, recv_id) -> count
     _focus_seq: Seq | None = field(default=None, init=False)
     _focus_left: int = field(default=0, init=False)
-    _last_question_step: Dict[str, int] = field(default_factory=dict, init=False)
+    _last_question_step: Dict[int, int] = field(default_factory=dict, init=False) # sent_id -> step
     _current_step: int = field(default=0, init=False)
 
     # Telemetry
     total_multi_candidate_steps: int = field(default=0, init=False)
     total_inhibitions: int = field(default=0, init=False)
+    total_evictions: int = field(default=0, init=False)
     sum_candidate_count: int = field(default=0, init=False)
     total_predict_calls: int = field(default=0, init=False)
     _total_handles_created: int = field(default=0, init=False)
@@ -128,11 +250,90 @@ class BootstrapAgentV1:
 
     def __post_init__(self) -> None:
         self._rng = random.Random(self.seed)
+        if self.handle_backend == "table":
+            from .handle_table_v1 import HandleTableV1 # requires numpy
+            self._registry = HandleTableV1()
+        elif self.handle_backend != "list":
+            raise ValueError(f"Unknown handle backend: {self.handle_backend!r}. Expected 'list' or 'table'")
+        if self.telemetry not in ("full", "minimal"):
+            raise ValueError(f"Unknown telemetry level: {self.telemetry!r}. Expected 'full' or 'minimal'")
+        if self.seen_counts_mode != "exact":
+            self._counts = make_pair_counts(self.seen_counts_mode, self.seen_counts_budget, seed=self.seed)
+
+    def fork(self, **overrides) -> "BootstrapAgentV1":
+        """
+        Child agent starting from this agent's current state (handles, counts,
+        focus, cooldowns, RNG, telemetry) with config overrides, e.g.
+        fork(decay_rate=0.01, compete_topk=2). Parent and child then evolve
+        independently; seed= reseeds the child's exploration RNG.
+
+        Handles are cloned up front rather than shared until first write: every
+        decay step rewrites every handle, so a child would copy them all on its
+        first step anyway. For sweeps, sweep_v1.fork_map() runs children in
+        os.fork()ed processes, where the OS shares the parent's memory
+        copy-on-write and the children run in parallel.
+        """
+        child = copy.copy(self)
+        child._rng = random.Random()
+        child._rng.setstate(self._rng.getstate())
+        child._registry = self._registry.fork(Handle.clone)
+        child._counts = self._counts.copy()
+        child._last_question_step = dict(self._last_question_step)
+        child._configure(overrides)
+        return child
+
+    def _configure(self, overrides: Dict[str, object]) -> None:
+        """Apply fork() config overrides to this agent in place."""
+        names = {f.name for f in fields(self) if f.init}
+        for name, value in overrides.items():
+            if name not in names:
+                raise TypeError(f"Unknown BootstrapAgentV1 config field: {name!r}")
+            if name in _FORK_FIXED and value != getattr(self, name):
+                raise ValueError(f"{name} is fixed at construction and can't be changed by fork()")
+            setattr(self, name, value)
+        if "seed" in overrides:
+            self._rng = random.Random(self.seed)
+
+    @property
+    def _handles(self) -> HandleRegistryV1:
+        # Indexed registry; assigning a plain list (as older tests do) re-wraps it
+        return self._registry
+
+    @_handles.setter
+    def _handles(self, handles: List[Handle]) -> None:
+        # Settle pending lazy decay before handles can change registry
+        self._registry.sync()
+        self._registry = handles if isinstance(handles, HandleRegistryV1) else type(self._registry)(handles)
+
+    @property
+    def _seen_counts(self):
+        # Promotion counter (see correlation_counts_v1); assigning a plain dict wraps it as exact counts
+        return self._counts
+
+    @_seen_counts.setter
+    def _seen_counts(self, counts) -> None:
+        self._counts = ExactPairCountsV1(counts) if type(counts) is dict else counts
 
     @property
     def handles(self) -> List[Handle]:
         # return strongest first for display
-        return sorted(self._handles, key=lambda h: (h.strength, h.hits), reverse=True)
+        return self._handles.top()
+
+    def top_handles(self, k: int) -> List[Handle]:
+        """Same as handles[:k], served from the registry's ranking heap instead of a full sort."""
+        return self._handles.top(k)
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Handle counts and the promotion counter's stats() under "seen_counts",
+        whose false_promotion_rate is 0 for exact and lru counting and an
+        audited estimate for the sketch.
+        """
+        return {
+            "handles": len(self._handles),
+            "handles_created": self._total_handles_created,
+            "seen_counts": self._counts.stats(),
+        }
 
     def choose_action(self, step: int) -> Seq:
         """
@@ -174,142 +375,253 @@ class BootstrapAgentV1:
         tail = tuple(self._rng.randint(1, 7) for _ in range(self._rng.choice([0, 1, 2])))
         return (a, b) + tail
 
-    def _update_telemetry(self, sent: Seq) -> None:
+    def _sent_id(self, sent: Seq) -> int:
+        """
+        Signature id that sent is predicted and learned under. With
+        fuzzy_tolerance, a sequence that has no handles of its own borrows the
+        nearest one that does, so channel jitter doesn't open a new signature
+        (and a fresh round of promotion counting) for every perturbed copy.
+
+        With a bounded seen_counts mode, a sequence that was never interned
+        has no handles, so it stays UNSEEN rather than growing SIGS with every
+        noisy copy; it is interned when a handle first needs it (promotion, or
+        proto seeding, which needs it straight away).
+        """
+        if self._counts.by_content and not self.seed_proto_handles:
+            sent_id = SIGS.find(sent)
+        else:
+            sent_id = SIGS.id_of(sent)
+        if self.fuzzy_tolerance > 0.0 and not self._handles.count_sent(sent_id):
+            # response_error between equal-length sequences is 0.25 per pulse unit
+            near = self._handles.nearest_sent(sent, int(self.fuzzy_tolerance * 4 + 1e-9))
+            if near is not None:
+                return near
+        return sent_id
+
+    def actions(self, start: int = 1, seed: int | None = None, block: int = 4096):
+        """
+        Iterator of exploration actions for steps start, start+1, ...: the
+        choose_action() policy with its randomness drawn in NumPy blocks
+        (see action_stream_v1; requires numpy). Reproducible from seed
+        (default: the agent's) and block, as its own stream, not choose_action()'s.
+        """
+        from .action_stream_v1 import ActionStreamV1 # requires numpy
+        return ActionStreamV1(self, seed=seed, start=start, block=block)
+
+    def _update_telemetry(self, sent_id: int) -> None:
         """Update telemetry counters for a given input."""
-        sent_s = _sig(sent)
         # Match by signature alone for telemetry of "discovery overlap"
-        all_match = [h for h in self._handles if h.sent_sig == sent_s]
+        n_match = self._handles.count_sent(sent_id)
         self.total_predict_calls += 1
-        self.sum_candidate_count += len(all_match)
-        if len(all_match) >= 2:
+        self.sum_candidate_count += n_match
+        if n_match >= 2:
             self.total_multi_candidate_steps += 1
 
     def predict(self, sent: Seq) -> Decision:
         self._current_step += 1
-        sent_s = _sig(sent)
-        
-        # All potential matches in registry
-        all_registry_matches = [h for h in self._handles if h.sent_sig == sent_s]
+        sent_id = self._sent_id(sent)
         
         was_proto_seeded = False
-        if self.seed_proto_handles and not all_registry_matches:
-            # Pre-decision proto-seeding: create a hypothesis handle immediately
-            # We don't know the resp_sig yet, so we use a placeholder "0" (empty)
-            # or we could use a special "?" but "0" is safer for existing logic.
-            self._total_handles_created += 1
-            hid = f"H{self._total_handles_created:03d}"
-            # SEED: Eligibility = seed_eligibility, Truth = 0.0
-            new_h = Handle(hid=hid, sent_sig=sent_s, resp_sig="0", eligibility=self.seed_eligibility, truth=0.0)
-            self._handles.append(new_h)
-            self._proto_seeded_round += 1
-            all_registry_matches = [new_h]
+        if self.seed_proto_handles and not self._handles.count_sent(sent_id):
+            self._seed_proto(sent_id)
             was_proto_seeded = True
 
-        if not all_registry_matches:
-            return Decision(lane=Lane.SILENT, meta={"candidate_count": 0, "eligible_count": 0, "had_any_match": False})
+        plan = self._plan(sent_id, self._gates(sent_id), was_proto_seeded)
+        self._book(sent_id, plan[2])
+        return self._make_decision(*plan)
 
-        # Check cooldown
-        on_cooldown = False
-        if self.question_cooldown_n > 0:
-            last_step = self._last_question_step.get(sent_s, -1)
-            if last_step >= 0 and (self._current_step - last_step) <= self.question_cooldown_n:
-                on_cooldown = True
+    def predict_batch(self, seqs: Iterable[Seq]) -> List[Decision]:
+        """
+        Decisions for a batch, identical to calling predict() on each in order.
+        predict() never changes handle strengths, so the candidate gates (and the
+        decision they lead to) are worked out once per distinct signature and
+        cooldown state in the batch; only the per-step parts (step counter, proto
+        seeding, cooldown bookkeeping) run for every sequence.
+        """
+        gates: Dict[int, tuple] = {}
+        return [self._predict_cached(self._sent_id(sent), gates) for sent in seqs]
 
-        # Identify all matching candidates that meet minimum eligibility to be "known"
-        all_candidates = [h for h in all_registry_matches if h.eligibility >= self.eligibility_min_to_consider]
-        
-        meta = {
-            "candidate_count": len(all_registry_matches),
-            "eligible_count": len(all_candidates),
-            "had_any_match": True,
-            "was_proto_seeded_predecision": was_proto_seeded,
-            "on_cooldown": on_cooldown
-        }
+    def predict_batch_top2(self, seqs: Iterable[Seq]) -> List[Tuple[Decision, Optional[Handle], Optional[Handle]]]:
+        """
+        predict_batch() with each decision's signature's strongest two handles
+        (copies of _handles.strongest_two(), taken right after that decision), so
+        a caller can score uncertainty without a registry lookup per sequence.
+        """
+        gates: Dict[int, tuple] = {}
+        out = []
+        for sent in seqs:
+            sent_id = self._sent_id(sent)
+            decision = self._predict_cached(sent_id, gates)
+            h1, h2 = self._handles.strongest_two(sent_id)
+            out.append((decision, h1 and h1.clone(), h2 and h2.clone()))
+        return out
+
+    def _predict_cached(self, sent_id: int, gates: Dict[int, tuple]) -> Decision:
+        # predict() with gates shared across a batch (drop gates[sent_id] when its handles change)
+        self._current_step += 1
+        cached = gates.get(sent_id)
+        was_proto_seeded = False
+        if cached is None:
+            if self.seed_proto_handles and not self._handles.count_sent(sent_id):
+                self._seed_proto(sent_id)
+                was_proto_seeded = True
+            cached = gates[sent_id] = (self._gates(sent_id), {})
+        g, plans = cached
+        key = (self._on_cooldown(sent_id), was_proto_seeded)
+        plan = plans.get(key)
+        if plan is None:
+            plan = plans[key] = self._plan(sent_id, g, was_proto_seeded)
+        self._book(sent_id, plan[2])
+        return self._make_decision(*plan)
+
+    def _seed_proto(self, sent_id: int) -> Handle:
+        # Pre-decision proto-seeding: create a hypothesis handle immediately
+        # We don't know the resp_sig yet, so we use a placeholder "0" (empty)
+        # or we could use a special "?" but "0" is safer for existing logic.
+        self._total_handles_created += 1
+        # SEED: Eligibility = seed_eligibility, Truth = 0.0
+        new_h = Handle(hid=self._total_handles_created, sent_sig=sent_id, resp_sig=0, eligibility=self.seed_eligibility, truth=0.0)
+        self._handles.append(new_h)
+        self._proto_seeded_round += 1
+        return new_h
+
+    def _gates(self, sent_id: int) -> tuple:
+        """
+        (matches, eligible, h1, h2) for one signature: h1/h2 are the strongest two
+        eligible handles (of all matches when none is eligible). The active
+        candidates (strength >= min_strength_to_predict, capped at compete_topk)
+        are always a prefix of the eligible ones in strength order, so these two
+        are all the routing needs. Served from the registry's per-signature
+        top-2 record instead of sorting the bucket on every call.
+        """
+        return self._handles.top2_for_sent(sent_id, self.eligibility_min_to_consider)
 
-        if not all_candidates:
+    def _on_cooldown(self, sent_id: int) -> bool:
+        """True while a question about sent_id was asked within the last question_cooldown_n steps."""
+        if self.question_cooldown_n <= 0:
+            return False
+        last_step = self._last_question_step.get(sent_id, -1)
+        return last_step >= 0 and (self._current_step - last_step) <= self.question_cooldown_n
+
+    def _plan(self, sent_id: int, gates: tuple, was_proto_seeded: bool) -> tuple:
+        """
+        (lane, act, template, args) for one step, without side effects.
+        template names the branch taken and args hold the values its question
+        and meta are rendered from (see _render_decision).
+        """
+        n_matches, n_candidates, h1, h2 = gates
+        if not n_matches:
+            return Lane.SILENT, None, "no_match", ()
+
+        on_cooldown = self._on_cooldown(sent_id)
+        base = (n_matches, n_candidates, was_proto_seeded, on_cooldown)
+        h2_act = h2.resp_act if h2 is not None else ()
+
+        if not n_candidates:
             # SILENT/NA -> QUESTION nudge rule
             if on_cooldown:
-                self._question_repeats_blocked_round += 1
-                return Decision(lane=Lane.SILENT, meta=meta)
-
-            self._silent_to_question_nudges_round += 1
-            # Sort matches so we have the best one for the question
-            matches_sorted = sorted(all_registry_matches, key=lambda h: (h.strength, h.hits), reverse=True)
-            h1 = matches_sorted[0]
-            h2_act = matches_sorted[1].resp_sig if len(matches_sorted) > 1 else "0"
-            question = get_weak_knowledge_question(format_act(h1.resp_sig), format_act(h2_act))
-            meta.update({"reason": "pre_eligible_nudge", "nudge": True, "top1": h1.hid, "was_nudged_to_question": True})
-            self._last_question_step[sent_s] = self._current_step
-            return Decision(lane=Lane.QUESTION, question=question, meta=meta)
-
-        # Sort candidates for competition
-        all_candidates.sort(key=lambda h: (h.strength, h.hits), reverse=True)
-
-        # Use Strength gate for active candidates
-        active_candidates = [h for h in all_candidates if h.strength >= self.min_strength_to_predict]
-        
-        if self.compete_topk > 0:
-            active_candidates = active_candidates[:self.compete_topk]
+                return Lane.SILENT, None, "blocked", base
+
+            # Best match (by strength) for the question
+            return Lane.QUESTION, None, "nudge", base + (_hid_key(h1), h1.resp_act, h2_act)
             
         # Middle Lane for weak but existing knowledge
-        if not active_candidates:
+        if h1.strength < self.min_strength_to_predict:
             if on_cooldown:
-                self._question_repeats_blocked_round += 1
-                return Decision(lane=Lane.NA, meta=meta)
+                return Lane.NA, None, "blocked", base
 
-            h1 = all_candidates[0]
-            h2_act = all_candidates[1].resp_sig if len(all_candidates) > 1 else "0"
-            question = get_weak_knowledge_question(format_act(h1.resp_sig), format_act(h2_act))
-            meta.update({"reason": "weak_knowledge", "top1": h1.hid, "eligibility": h1.eligibility, "truth": h1.truth})
-            self._last_question_step[sent_s] = self._current_step
-            return Decision(lane=Lane.QUESTION, question=question, meta=meta)
+            return Lane.QUESTION, None, "weak_knowledge", base + (_hid_key(h1), h1.resp_act, h2_act, h1.eligibility, h1.truth)
 
         # Middle Lane for conflicting strong knowledge
-        if len(active_candidates) >= 2:
-            margin = active_candidates[0].strength - active_candidates[1].strength
+        if h2 is not None and h2.strength >= self.min_strength_to_predict and self.compete_topk != 1:
+            margin = h1.strength - h2.strength
             if margin < self.conflict_margin:
                 if on_cooldown:
-                    self._question_repeats_blocked_round += 1
-                    return Decision(lane=Lane.NA, meta=meta)
+                    return Lane.NA, None, "blocked", base
 
-                h1 = active_candidates[0]
-                h2 = active_candidates[1]
-                question = get_conflict_question(format_act(h1.resp_sig), format_act(h2.resp_sig))
-                meta.update({"reason": "conflict", "margin": margin, "top1": h1.hid, "top2": h2.hid, "s1": h1.strength, "s2": h2.strength})
-                self._last_question_step[sent_s] = self._current_step
-                return Decision(lane=Lane.QUESTION, question=question, meta=meta)
+                return Lane.QUESTION, None, "conflict", base + (margin, _hid_key(h1), _hid_key(h2), h1.resp_act, h2.resp_act, h1.strength, h2.strength)
 
-        h = active_candidates[0]
-        act = tuple(int(x) for x in h.resp_sig.split(",")) if h.resp_sig != "0" else ()
-        meta.update({"hid": h.hid, "strength": h.strength, "eligibility": h.eligibility, "truth": h.truth})
-        return Decision(lane=Lane.SPEAK, act=act, meta=meta)
+        return Lane.SPEAK, h1.resp_act, "speak", base + (_hid_key(h1), h1.strength, h1.eligibility, h1.truth)
 
-    def _apply_handle_decay(self) -> None:
-        """Apply exponential decay to all handles and optionally prune weak ones."""
-        if self.decay_rate <= 0.0:
-            return
+    def _book(self, sent_id: int, template: str) -> None:
+        """Cooldown and per-round counters for a decision made with this template."""
+        if template == "blocked":
+            self._question_repeats_blocked_round += 1
+        elif template in ("nudge", "weak_knowledge", "conflict"):
+            if template == "nudge":
+                self._silent_to_question_nudges_round += 1
+            self._last_question_step[sent_id] = self._current_step
 
-        keep = []
-        for h in self._handles:
-            # Decay both eligibility and truth
-            # eligibility: discoverability / relevance (decay slowly)
-            # truth: evidence-backed correctness (decay slower or not at all)
-            # Instruction: "Decay eligibility slowly; decay truth slower or not at all"
-            h.eligibility *= (1.0 - self.decay_rate)
-            h.truth *= (1.0 - self.decay_rate * 0.5) # slower decay for truth
+    def _make_decision(self, lane: Lane, act: Optional[Seq], template: str, args: tuple) -> Decision:
+        if self.telemetry == "minimal":
+            return LazyDecision(lane, act, template, args, _render_decision)
+        question, meta = _render_decision(template, args)
+        return Decision(lane=lane, act=act, question=question, meta=meta)
 
-            if self.prune_below > 0.0 and h.strength < self.prune_below:
-                continue
+    def _recv_id(self, received: Seq) -> int:
+        # Like _sent_id(): bounded counting leaves unseen responses UNSEEN (no handle has them)
+        return SIGS.find(received) if self._counts.by_content else SIGS.id_of(received)
 
-            keep.append(h)
+    def _count_and_promote(self, sent: Seq, sent_id: int, received: Seq, recv_id: int) -> Optional[Tuple[int, int]]:
+        """
+        Count the (sent, received) pair; promote a handle for it once seen
+        promote_threshold times, and return the pair's ids if it did. Bounded
+        counters are keyed on the pair's fingerprints, so UNSEEN signatures
+        are only interned on promotion.
+        """
+        counts = self._counts
+        if counts.by_content:
+            key = (
+                SIGS.key_of(sent_id) if sent_id != UNSEEN else seq_key(sent),
+                SIGS.key_of(recv_id) if recv_id != UNSEEN else seq_key(received),
+            )
+        else:
+            key = (sent_id, recv_id)
+        if counts.add(key) < self.promote_threshold:
+            return None
+        if sent_id == UNSEEN:
+            sent_id = SIGS.id_of(sent)
+        if recv_id == UNSEEN:
+            recv_id = SIGS.id_of(received)
+        # Check if a handle already exists for this exact mapping
+        if self._handles.has_pair(sent_id, recv_id):
+            return None
+        counts.promoted(key, self.promote_threshold)
+        self._total_handles_created += 1
+        # New handles born with 0.25 eligibility and 0.0 truth; promotion no longer boosts truth
+        self._handles.append(Handle(hid=self._total_handles_created, sent_sig=sent_id, resp_sig=recv_id, truth=0.0))
+        return sent_id, recv_id
 
-        self._handles = keep
+    def _apply_handle_decay(self) -> None:
+        """
+        Apply exponential decay to all handles and optionally prune weak ones.
+        With lazy_decay the registry only advances its decay clock; handles are
+        brought up to date when they are next read, and prune_below evictions
+        come off a min-heap of projected drop-below ticks.
+        """
+        if self.decay_rate <= 0.0:
+            return
 
-    def observe(self, sent: Seq, received: Seq, learn: bool = True, update_truth: bool = True, eligibility_bump: float = 0.0) -> StepMetrics:
+        # Decay both eligibility and truth
+        # eligibility: discoverability / relevance (decay slowly)
+        # truth: evidence-backed correctness (decay slower or not at all)
+        # Instruction: "Decay eligibility slowly; decay truth slower or not at all"
+        self.total_evictions += self._handles.decay(
+            1.0 - self.decay_rate,
+            1.0 - self.decay_rate * 0.5, # slower decay for truth
+            lazy=self.lazy_decay,
+            prune_below=self.prune_below,
+        )
+
+    def observe(self, sent: Seq, received: Seq, learn: bool = True, update_truth: bool = True, eligibility_bump: float = 0.0, decision: Optional[Decision] = None) -> StepMetrics:
         """
         Update internals based on an exchange.
+        Pass the decision predict(sent) already returned for this step to reuse
+        it; without one observe() predicts again, which costs a second candidate
+        search and advances the step counter (and so question cooldowns) twice.
         """
-        decision = self.predict(sent)
+        if decision is None:
+            decision = self.predict(sent)
         pred = decision.act if decision.lane == Lane.SPEAK else (999,) if decision.lane == Lane.QUESTION else ()
         err = response_error(pred, received)
 
@@ -319,21 +631,12 @@ class BootstrapAgentV1:
         if not learn:
             # Still track correlation counts for promotion even if we don't update weights
             # This allows the agent to discover handles without necessarily having to SPEAK first.
-            sent_s = _sig(sent)
-            recv_s = _sig(received)
-            key = (sent_s, recv_s)
-            self._seen_counts[key] = self._seen_counts.get(key, 0) + 1
-            if self._seen_counts[key] >= self.promote_threshold:
-                # Check if a handle already exists for this exact mapping
-                existing = [h for h in self._handles if h.sent_sig == sent_s and h.resp_sig == recv_s]
-                if not existing:
-                    self._total_handles_created += 1
-                    hid = f"H{self._total_handles_created:03d}"
-                    # New handles born with 0.25 eligibility and 0.0 truth
-                    self._handles.append(Handle(hid=hid, sent_sig=sent_s, resp_sig=recv_s, truth=0.0))
-                # Promotion no longer boosts truth
+            sent_id = self._sent_id(sent)
+            promoted = self._count_and_promote(sent, sent_id, received, self._recv_id(received))
+            if promoted:
+                sent_id = promoted[0] # may only just have been interned
             # Update telemetry AFTER promotion
-            self._update_telemetry(sent)
+            self._update_telemetry(sent_id)
             return StepMetrics(predicted=pred, actual=received, error=err)
 
         self._apply_handle_decay()
@@ -346,17 +649,19 @@ class BootstrapAgentV1:
             self._focus_left = self.focus_repeats
 
         # Update existing matching handle (if any)
-        sent_s = _sig(sent)
-        recv_s = _sig(received)
+        sent_id = self._sent_id(sent)
+        recv_id = self._recv_id(received)
         updated_any = False
         
         # Identify matching candidates for competition
-        candidates = [h_cand for h_cand in self._handles if h_cand.sent_sig == sent_s]
+        candidates = self._handles.for_sent(sent_id)
         
         # If we have exactly one candidate and it's a freshly seeded proto with placeholder "0",
         # adopt the actual response signature.
-        if len(candidates) == 1 and candidates[0].resp_sig == "0" and candidates[0].hits == 0 and candidates[0].misses == 0:
-            candidates[0].resp_sig = recv_s
+        if len(candidates) == 1 and candidates[0].resp_id == 0 and candidates[0].hits == 0 and candidates[0].misses == 0:
+            if recv_id == UNSEEN:
+                recv_id = SIGS.id_of(received)
+            self._handles.set_resp_sig(candidates[0], recv_id)
 
         # Sort by strength descending
         candidates.sort(key=lambda x: (x.strength, x.hits), reverse=True)
@@ -368,7 +673,7 @@ class BootstrapAgentV1:
             allowed = candidates
 
         for h_cand in allowed:
-            if h_cand.resp_sig == recv_s:
+            if h_cand.resp_id == recv_id:
                 h_cand.update(matched=True, update_truth=update_truth)
                 # Extra eligibility bump if requested (e.g. for QUESTION supervised events)
                 if eligibility_bump > 0.0:
@@ -385,41 +690,29 @@ class BootstrapAgentV1:
 
         # Apply inhibition if enabled
         if self.inhibit_mult > 0.0 and winner is not None:
-            for h in candidates:
-                if h is not winner and h.sent_sig == sent_s:
-                    # Inhibition affects both? Or just eligibility?
-                    # Let's say it affects both proportionally.
-                    h.eligibility = max(0.0, h.eligibility - (winner.strength * self.inhibit_mult))
-                    h.truth = max(0.0, h.truth - (winner.strength * self.inhibit_mult))
-                    self.total_inhibitions += 1
+            losers = [h for h in candidates if h is not winner]
+            # Inhibition affects both? Or just eligibility?
+            # Let's say it affects both proportionally.
+            self._handles.inhibit(losers, winner.strength * self.inhibit_mult)
+            self.total_inhibitions += len(losers)
 
         # Track correlation counts for promotion
-        key = (sent_s, recv_s)
-        self._seen_counts[key] = self._seen_counts.get(key, 0) + 1
-
-        # Promote new handle if we see repeated stable mapping
-        if self._seen_counts[key] >= self.promote_threshold:
-            # Check if a handle already exists for this exact mapping
-            existing = [h for h in self._handles if h.sent_sig == sent_s and h.resp_sig == recv_s]
-            if not existing:
-                self._total_handles_created += 1
-                hid = f"H{self._total_handles_created:03d}"
-                self._handles.append(Handle(hid=hid, sent_sig=sent_s, resp_sig=recv_s, truth=0.0))
-            # Promotion no longer boosts truth
+        promoted = self._count_and_promote(sent, sent_id, received, recv_id)
+        if promoted:
+            # The pair may only just have been interned; the steps below look its handle up by id
+            sent_id, recv_id = promoted
 
         # Update telemetry AFTER promotion
-        self._update_telemetry(sent)
+        self._update_telemetry(sent_id)
 
         # If nothing updated, lightly reinforce the most recent mapping handle if it exists
         if not updated_any:
             # ONLY if we didn't update anything in the standard loop (including mismatches)
-            for h_m in self._handles:
-                if h_m.sent_sig == sent_s and h_m.resp_sig == recv_s:
-                    h_m.update(matched=True, update_truth=update_truth)
-                    if eligibility_bump > 0.0:
-                        h_m.eligibility = min(1.0, h_m.eligibility + eligibility_bump)
-                    updated_any = True # Mark it as updated
-                    break
+            for h_m in self._handles.for_pair(sent_id, recv_id)[:1]:
+                h_m.update(matched=True, update_truth=update_truth)
+                if eligibility_bump > 0.0:
+                    h_m.eligibility = min(1.0, h_m.eligibility + eligibility_bump)
+                updated_any = True # Mark it as updated
 
         # If we were silent but the environment spoke, and silence_penalty is on,
         # find or create handles for the observed mapping and give them a boost.
@@ -427,12 +720,45 @@ class BootstrapAgentV1:
         if self.silence_penalty > 0.0 and is_truly_silent and received:
             # We missed a chance to speak.
             # Boost any handle that WOULD have been correct
-            sent_s = _sig(sent)
-            recv_s = _sig(received)
-            for h_s in self._handles:
-                if h_s.sent_sig == sent_s and h_s.resp_sig == recv_s:
-                    # silence_penalty applies ONLY to eligibility.
-                    h_s.eligibility = min(1.0, h_s.eligibility + self.silence_penalty)
-                    # Truth must NEVER be gifted via silence penalty.
+            for h_s in self._handles.for_pair(sent_id, recv_id):
+                # silence_penalty applies ONLY to eligibility.
+                h_s.eligibility = min(1.0, h_s.eligibility + self.silence_penalty)
+                # Truth must NEVER be gifted via silence penalty.
         
         return StepMetrics(predicted=pred, actual=received, error=err)
+
+    def observe_batch(self, sent: Sequence[Seq], received: Sequence[Seq], learn: bool = True, update_truth: bool = True, eligibility_bump: float = 0.0, decisions: Optional[Sequence[Optional[Decision]]] = None, flags: Optional[Sequence[Tuple[bool, bool, float]]] = None) -> List[StepMetrics]:
+        """
+        observe() over a batch of exchanges, in order, with the same result as
+        calling it once per pair. decisions[i], when given, is the decision
+        predict_batch() returned for sent[i]; flags[i], when given, is that
+        exchange's (learn, update_truth, eligibility_bump) in place of the
+        shared ones.
+
+        With learn=False nothing touches handle strengths, so the internal
+        predictions share candidate gates per signature and only a promotion
+        invalidates them. With learn=True every step decays and updates the
+        handles the next step reads, so steps run one after another.
+        """
+        if len(sent) != len(received):
+            raise ValueError(f"observe_batch needs one response per sent sequence ({len(sent)} != {len(received)})")
+        if decisions is not None or flags is not None:
+            decisions, flags = _per_exchange(len(sent), decisions, flags, (learn, update_truth, eligibility_bump))
+            return [self.observe(s, r, learn=f[0], update_truth=f[1], eligibility_bump=f[2], decision=d) for s, r, d, f in zip(sent, received, decisions, flags)]
+        if learn:
+            return [self.observe(s, r, learn=True, update_truth=update_truth, eligibility_bump=eligibility_bump) for s, r in zip(sent, received)]
+
+        gates: Dict[int, tuple] = {}
+        out = []
+        for s, r in zip(sent, received):
+            sent_id = self._sent_id(s)
+            decision = self._predict_cached(sent_id, gates)
+            pred = decision.act if decision.lane == Lane.SPEAK else (999,) if decision.lane == Lane.QUESTION else ()
+            err = response_error(pred, r)
+            promoted = self._count_and_promote(s, sent_id, r, self._recv_id(r))
+            if promoted:
+                gates.pop(sent_id, None)
+                sent_id = promoted[0]
+            self._update_telemetry(sent_id)
+            out.append(StepMetrics(predicted=pred, actual=r, error=err))
+        return out
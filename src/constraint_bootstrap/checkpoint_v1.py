@@ -0,0 +1,318 @@
+"""
+Binary checkpoints for BootstrapAgentV1 (and, via an opaque JSON-able dict,
+trainer state).
+
+Layout (little framing, safetensors-style):
+    magic (8 bytes) | version u32 | reserved u32 | header length u64
+    JSON header (padded to 8 bytes)
+    data: flat arrays, each 8-byte aligned, located by header["sections"]
+
+The header holds config, scalars, RNG states and the section table
+({name: [offset, typecode, count]}). Handles, the signature table,
+correlation counts and the cooldown map are columns in the data block. The
+loader maps the file read-only and decodes each column with one memoryview
+cast (no per-value parsing), but it still builds the agent's Python objects
+(handles, index buckets, counts) from them, so loading is a full copy and
+costs time in proportion to the agent's size.
+
+A restored agent continues exactly as the original would have, except
+with lazy_decay: the registry's ranking and top-2 caches are not saved, so
+the restored registry settles pending decay at different steps, and
+mult**a * mult**b rounds differently from mult**(a + b). Handle values then
+differ from the uninterrupted run in the last bits.
+
+Signature ids are process-local (interning order), so the checkpoint carries
+its own table of the sequences it references (local index 0 is always the
+empty sequence) and ids are re-interned on load.
+"""
+
+from __future__ import annotations
+
+import gc
+import heapq
+import json
+import mmap
+import random
+import struct
+import sys
+from array import array
+from dataclasses import fields
+from typing import Any, Dict, List, Optional, Tuple
+
+from .bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from .correlation_counts_v1 import CountMinPairCountsV1, LruPairCountsV1
+from .signatures_v1 import SIGS
+
+MAGIC = b"CBCKPT\x00\x00"
+# Bumped whenever the layout or the trainer state changes; only this version loads
+FORMAT_VERSION = 7
+_PREFIX = struct.Struct("<8sIIQ")
+_ALIGN = 8
+
+
+def rng_state(rng: random.Random) -> list:
+    """JSON-able random.Random state."""
+    version, internal, gauss_next = rng.getstate()
+    return [version, list(internal), gauss_next]
+
+
+def set_rng_state(rng: random.Random, state: list) -> None:
+    version, internal, gauss_next = state
+    rng.setstate((version, tuple(internal), gauss_next))
+
+
+class _SigTable:
+    """Global SIGS id -> checkpoint-local index, built while writing."""
+
+    def __init__(self) -> None:
+        self.local: Dict[int, int] = {0: 0}
+        self.ids: List[int] = [0]
+
+    def __call__(self, sid: int) -> int:
+        i = self.local.get(sid)
+        if i is None:
+            i = self.local[sid] = len(self.ids)
+            self.ids.append(sid)
+        return i
+
+
+# HandleTableV1 keeps these fields in NumPy columns (float64 / int64)
+_TABLE_COLUMNS = {"eligibility": "_elig", "truth": "_truth", "hits": "_hits", "misses": "_misses"}
+
+
+def _column(registry, handles: list, field: str, typecode: str) -> array:
+    if getattr(registry, "_views", None) is None:
+        return array(typecode, [getattr(h, field) for h in handles])
+    # Table backend: gather rows in registry order straight from the column
+    out = array(typecode)
+    out.frombytes(getattr(registry, _TABLE_COLUMNS[field])[[h._row for h in handles]].tobytes())
+    return out
+
+
+def _registry_columns(registry, sig: _SigTable) -> Tuple[Dict[str, array], Dict[str, Any]]:
+    # Raw, unmaterialized values plus the lazy decay / prune bookkeeping, so a
+    # restored registry continues where this one stands (see the module
+    # docstring for lazy_decay rounding)
+    handles = list(registry._order.values())
+    row = {id(h): i for i, h in enumerate(handles)}
+    due = array("q", [-1]) * len(handles)
+    for tick, seq, h in registry._heap:
+        if registry._is_live(seq, h):
+            due[row[id(h)]] = tick
+    cols = {
+        "h_uid": array("q", [h.uid for h in handles]),
+        "h_sent": array("i", [sig(h.sent_id) for h in handles]),
+        "h_resp": array("i", [sig(h.resp_id) for h in handles]),
+        "h_elig": _column(registry, handles, "eligibility", "d"),
+        "h_truth": _column(registry, handles, "truth", "d"),
+        "h_hits": _column(registry, handles, "hits", "q"),
+        "h_misses": _column(registry, handles, "misses", "q"),
+        "h_decay_t": array("q", [h.decay_t for h in handles]),
+        "h_prune_seq": array("q", [h.prune_seq for h in handles]),
+        "h_prune_due": due,
+        "h_dirty": array("q", sorted(row[k] for k in registry._dirty if k in row)),
+    }
+    meta = {
+        "ticks": registry._ticks,
+        "synced_at": registry._synced_at,
+        "mults": list(registry._mults),
+        "prune_below": registry._prune_below,
+        "heap_seq": registry._heap_seq,
+        "hid_labels": {str(i): h._label for i, h in enumerate(handles) if h._label is not None},
+    }
+    return cols, meta
+
+
+def _counts_columns(counts, sig: _SigTable) -> Tuple[Dict[str, array], Dict[str, Any]]:
+    if isinstance(counts, CountMinPairCountsV1):
+        rows = array("I")
+        for r in counts._rows:
+            rows.extend(r)
+        audit = counts.audit
+        meta = {
+            "mode": "sketch", "width": counts.width, "depth": counts.depth, "salts": counts._salts, "total": counts.total,
+            "audit": {"max_entries": audit.max_entries, "sample_rate": audit.sample_rate, "pairs": [[*k, *e] for k, e in audit.pairs.items()]},
+        }
+        return {"c_rows": rows}, meta
+    if isinstance(counts, LruPairCountsV1):
+        # Spent, probation then protected, each oldest first; keys are fingerprints, valid in any process
+        items = list(counts._spent.items()) + list(counts._probation.items()) + list(counts._protected.items())
+        meta = {
+            "mode": "lru", "spent": len(counts._spent), "protected": len(counts._protected), "max_entries": counts.max_entries,
+            "max_protected": counts.max_protected, "evictions": counts.evictions,
+        }
+        keys = array("q", [k for key, _ in items for k in key])
+        return {"c_keys": keys, "c_n": array("q", [n for _, n in items])}, meta
+    items = list(counts.items())
+    meta = {"mode": "exact"}
+    keys = array("i")
+    for (sent_id, recv_id), _ in items:
+        keys.append(sig(sent_id))
+        keys.append(sig(recv_id))
+    return {"c_keys": keys, "c_n": array("q", [n for _, n in items])}, meta
+
+
+def save_checkpoint(path: str, agent: BootstrapAgentV1, trainer_state: Optional[Dict[str, Any]] = None) -> int:
+    """
+    Write agent (and an optional JSON-able trainer_state) to path. Doesn't
+    touch the agent: pending lazy decay is saved as-is. Returns bytes written.
+    """
+    sig = _SigTable()
+    cols, registry_meta = _registry_columns(agent._handles, sig)
+    counts_cols, counts_meta = _counts_columns(agent._seen_counts, sig)
+    cols.update(counts_cols)
+    cooldowns = list(agent._last_question_step.items())
+    cols["q_sent"] = array("i", [sig(s) for s, _ in cooldowns])
+    cols["q_step"] = array("q", [t for _, t in cooldowns])
+    # Last: every referenced signature is known by now
+    seqs = [SIGS.seq_of(s) for s in sig.ids]
+    cols["sig_len"] = array("i", [len(q) for q in seqs])
+    cols["sig_pulses"] = array("q", [p for q in seqs for p in q])
+
+    header = {
+        "byteorder": sys.byteorder,
+        "config": {f.name: getattr(agent, f.name) for f in fields(agent) if f.init},
+        # Telemetry counters, step counter, focus countdown, ...
+        "scalars": {
+            f.name: getattr(agent, f.name) for f in fields(agent)
+            if not f.init and type(getattr(agent, f.name)) in (int, float)
+        },
+        "focus_seq": list(agent._focus_seq) if agent._focus_seq is not None else None,
+        "rng": rng_state(agent._rng),
+        "registry": registry_meta,
+        "counts": counts_meta,
+        "trainer": trainer_state,
+        "sections": {},
+    }
+    offset = 0
+    for name, a in cols.items():
+        header["sections"][name] = [offset, a.typecode, len(a)]
+        offset += -(-len(a) * a.itemsize // _ALIGN) * _ALIGN
+    blob = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    blob += b" " * (-len(blob) % _ALIGN)
+
+    with open(path, "wb") as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, 0, len(blob)))
+        f.write(blob)
+        for a in cols.values():
+            data = a.tobytes()
+            f.write(data)
+            f.write(b"\0" * (-len(data) % _ALIGN))
+        return f.tell()
+
+
+class _Sections:
+    """Typed reads of header-listed arrays out of a mapped checkpoint."""
+
+    def __init__(self, buf: mmap.mmap, base: int, header: Dict[str, Any]) -> None:
+        self._buf = buf
+        self._base = base
+        self._table = header["sections"]
+        self._swap = header["byteorder"] != sys.byteorder
+
+    def __getitem__(self, name: str) -> list:
+        offset, typecode, count = self._table[name]
+        start = self._base + offset
+        size = count * array(typecode).itemsize
+        if start + size > len(self._buf):
+            raise ValueError(f"Truncated checkpoint: section {name!r} runs past end of file")
+        if self._swap:
+            a = array(typecode, self._buf[start:start + size])
+            a.byteswap()
+            return a.tolist()
+        with memoryview(self._buf) as view, view[start:start + size] as raw, raw.cast(typecode) as typed:
+            return typed.tolist()
+
+
+def _restore_registry(agent: BootstrapAgentV1, sec: _Sections, meta: Dict[str, Any], ids: List[int]) -> None:
+    registry = type(agent._handles)()
+    registry._ticks = meta["ticks"]
+    handles = [
+        Handle(hid=uid, sent_sig=ids[sent], resp_sig=ids[resp], eligibility=elig, truth=truth, hits=hits, misses=misses)
+        for uid, sent, resp, elig, truth, hits, misses in zip(
+            sec["h_uid"], sec["h_sent"], sec["h_resp"], sec["h_elig"], sec["h_truth"], sec["h_hits"], sec["h_misses"],
+        )
+    ]
+    for i, label in meta["hid_labels"].items():
+        handles[int(i)]._label = label
+    registry.extend(handles)
+    for h, decay_t, prune_seq in zip(handles, sec["h_decay_t"], sec["h_prune_seq"]):
+        h.decay_t = decay_t
+        h.prune_seq = prune_seq
+    registry._synced_at = meta["synced_at"]
+    registry._mults = tuple(meta["mults"])
+    registry._prune_below = meta["prune_below"]
+    registry._heap_seq = meta["heap_seq"]
+    registry._heap = [(tick, h.prune_seq, h) for tick, h in zip(sec["h_prune_due"], handles) if tick >= 0]
+    heapq.heapify(registry._heap)
+    registry._dirty = {id(handles[i]): handles[i] for i in sec["h_dirty"]}
+    agent._handles = registry
+
+
+def _restore_counts(agent: BootstrapAgentV1, sec: _Sections, meta: Dict[str, Any], ids: List[int]) -> None:
+    counts = agent._seen_counts
+    if meta["mode"] == "sketch":
+        rows = sec["c_rows"]
+        counts.width, counts.depth = meta["width"], meta["depth"]
+        counts._rows = [array("I", rows[i * counts.width:(i + 1) * counts.width]) for i in range(counts.depth)]
+        counts._salts = [tuple(s) for s in meta["salts"]]
+        counts.total = meta["total"]
+        audit = meta["audit"]
+        counts.audit.max_entries, counts.audit.sample_rate = audit["max_entries"], audit["sample_rate"]
+        counts.audit.pairs = {(p[0], p[1]): p[2:] for p in audit["pairs"]}
+        return
+    keys = sec["c_keys"]
+    if meta["mode"] == "lru":
+        items = [((keys[2 * i], keys[2 * i + 1]), n) for i, n in enumerate(sec["c_n"])]
+        spent, split = meta["spent"], len(items) - meta["protected"]
+        counts.max_entries, counts.max_protected = meta["max_entries"], meta["max_protected"]
+        counts.evictions = meta["evictions"]
+        counts._spent.update(items[:spent])
+        counts._probation.update(items[spent:split])
+        counts._protected.update(items[split:])
+    else:
+        counts.update(((ids[keys[2 * i]], ids[keys[2 * i + 1]]), n) for i, n in enumerate(sec["c_n"]))
+
+
+def load_checkpoint(path: str) -> Tuple[BootstrapAgentV1, Optional[Dict[str, Any]]]:
+    """Rebuild the agent saved by save_checkpoint(). Returns (agent, trainer_state or None)."""
+    # Bulk-allocating handles and index buckets would trigger a cyclic GC pass
+    # every few hundred objects; none of them are garbage yet
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return _load(path)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+
+def _load(path: str) -> Tuple[BootstrapAgentV1, Optional[Dict[str, Any]]]:
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        if len(buf) < _PREFIX.size:
+            raise ValueError(f"Not a checkpoint (too short): {path}")
+        magic, version, _, header_len = _PREFIX.unpack_from(buf)
+        if magic != MAGIC:
+            raise ValueError(f"Not a checkpoint (bad magic): {path}")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported checkpoint version {version} (this build reads {FORMAT_VERSION})")
+        header = json.loads(bytes(buf[_PREFIX.size:_PREFIX.size + header_len]))
+        sec = _Sections(buf, _PREFIX.size + header_len, header)
+
+        # Re-intern the checkpoint's signatures in this process
+        ids = []
+        pulses = sec["sig_pulses"]
+        at = 0
+        for n in sec["sig_len"]:
+            ids.append(SIGS.id_of(tuple(pulses[at:at + n])))
+            at += n
+
+        agent = BootstrapAgentV1(**header["config"])
+        for name, value in header["scalars"].items():
+            setattr(agent, name, value)
+        agent._focus_seq = tuple(header["focus_seq"]) if header["focus_seq"] is not None else None
+        set_rng_state(agent._rng, header["rng"])
+        agent._last_question_step = {ids[s]: t for s, t in zip(sec["q_sent"], sec["q_step"])}
+        _restore_registry(agent, sec, header["registry"], ids)
+        _restore_counts(agent, sec, header["counts"], ids)
+    return agent, header["trainer"]
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from collections import OrderedDict
+from typing import Any, Dict, Tuple
+
+# (sent_id, recv_id) for exact counts; (seq_key(sent), seq_key(recv)) for the
+# bounded ones (by_content), so counting a pair never interns its signatures
+Key = Tuple[int, int]
+
+# Rough tracemalloc cost of one OrderedDict entry keyed by an int pair
+_LRU_ENTRY_BYTES = 224
+_COUNTER_BYTES = 4 # array("I")
+_MERSENNE_61 = (1 << 61) - 1
+
+
+class ExactPairCountsV1(dict):
+    """Unbounded exact (sent_id, recv_id) -> count map (the agent's default)."""
+
+    by_content = False
+
+    def add(self, key: Key) -> int:
+        n = self.get(key, 0) + 1
+        self[key] = n
+        return n
+
+    def copy(self) -> "ExactPairCountsV1":
+        return ExactPairCountsV1(self)
+
+    def promoted(self, key: Key, threshold: int) -> None:
+        pass # exact counts never promote early
+
+    def stats(self) -> Dict[str, Any]:
+        return {"mode": "exact", "entries": len(self), "false_promotion_rate": 0.0}
+
+
+class LruPairCountsV1:
+    """
+    Exact counts for at most budget_bytes worth of pairs, as a segmented LRU
+    that evicts the pairs with least left to contribute to promotion first:
+    - spent: pairs that already promoted (promoted() moves them here); their
+      handle carries the mapping now, and they go before anything else
+    - probation: pairs seen once, least recently seen first
+    - protected: pairs seen again, which move here and are evicted last
+    A spent pair seen again keeps counting, so it promotes again at once if
+    its handle was pruned and the pair is still around. Never over-counts (no
+    false promotions, barring a 61-bit fingerprint collision), but an evicted
+    pair starts over and promotes late or not at all.
+    """
+
+    by_content = True
+
+    def __init__(self, budget_bytes: int, protected_frac: float = 0.8) -> None:
+        self.max_entries = max(2, int(budget_bytes) // _LRU_ENTRY_BYTES)
+        self.max_protected = max(1, int(self.max_entries * protected_frac))
+        self._spent: OrderedDict[Key, int] = OrderedDict()
+        self._probation: OrderedDict[Key, int] = OrderedDict()
+        self._protected: OrderedDict[Key, int] = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._spent) + len(self._probation) + len(self._protected)
+
+    def add(self, key: Key) -> int:
+        for segment in (self._protected, self._spent):
+            n = segment.get(key)
+            if n is not None:
+                n += 1
+                segment[key] = n
+                segment.move_to_end(key)
+                return n
+        probation = self._probation
+        protected = self._protected
+        n = probation.pop(key, None)
+        if n is None:
+            if len(self) >= self.max_entries:
+                (self._spent or probation or protected).popitem(last=False)
+                self.evictions += 1
+            probation[key] = 1
+            return 1
+        n += 1
+        protected[key] = n
+        if len(protected) > self.max_protected:
+            # Demote the coldest protected pair (count kept) instead of dropping it
+            old_key, old_n = protected.popitem(last=False)
+            probation[old_key] = old_n
+        return n
+
+    def promoted(self, key: Key, threshold: int) -> None:
+        """The agent promoted key's pair: its count has done its job, so it is evicted first from now on."""
+        n = self._protected.pop(key, None)
+        if n is None:
+            n = self._probation.pop(key, None)
+        if n is not None:
+            self._spent[key] = n
+
+    def copy(self) -> "LruPairCountsV1":
+        new = LruPairCountsV1.__new__(LruPairCountsV1)
+        new.max_entries = self.max_entries
+        new.max_protected = self.max_protected
+        new._spent = self._spent.copy()
+        new._probation = self._probation.copy()
+        new._protected = self._protected.copy()
+        new.evictions = self.evictions
+        return new
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": "lru",
+            "entries": len(self),
+            "protected": len(self._protected),
+            "spent": len(self._spent),
+            "max_entries": self.max_entries,
+            "evictions": self.evictions,
+            "false_promotion_rate": 0.0,
+        }
+
+
+class PromotionAuditV1:
+    """
+    Estimates the share of a bounded counter's promotions that come early,
+    from exact counts kept for a uniform sample of pairs: those whose
+    fingerprints fall in a 1/sample_rate slice. When the sample outgrows
+    max_entries the slice halves and the pairs outside it are dropped, so
+    every pair in the slice has been counted since its first sighting.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max(1, int(max_entries))
+        self.sample_rate = 1
+        self.pairs: Dict[Key, list] = {} # key -> [count, promotions, early promotions]
+
+    def _sampled(self, key: Key) -> bool:
+        return (key[0] ^ key[1]) % self.sample_rate == 0
+
+    def add(self, key: Key) -> None:
+        if not self._sampled(key):
+            return
+        entry = self.pairs.get(key)
+        if entry is None:
+            while len(self.pairs) >= self.max_entries:
+                self.sample_rate *= 2
+                self.pairs = {k: e for k, e in self.pairs.items() if self._sampled(k)}
+                if not self._sampled(key):
+                    return
+            entry = self.pairs[key] = [0, 0, 0]
+        entry[0] += 1
+
+    def promoted(self, key: Key, threshold: int) -> None:
+        entry = self.pairs.get(key)
+        if entry is None:
+            return
+        entry[1] += 1
+        if entry[0] < threshold:
+            entry[2] += 1
+
+    def copy(self) -> "PromotionAuditV1":
+        new = PromotionAuditV1(self.max_entries)
+        new.sample_rate = self.sample_rate
+        new.pairs = {k: list(e) for k, e in self.pairs.items()}
+        return new
+
+    def stats(self) -> Dict[str, Any]:
+        promotions = sum(e[1] for e in self.pairs.values())
+        early = sum(e[2] for e in self.pairs.values())
+        return {
+            "audit_sample_rate": self.sample_rate,
+            "audited_promotions": promotions,
+            "audited_false_promotions": early,
+            "false_promotion_rate": early / promotions if promotions else 0.0,
+        }
+
+
+class CountMinPairCountsV1:
+    """
+    Count-min sketch over pairs in a fixed budget_bytes (depth rows of 32-bit
+    counters) with conservative update: only the rows holding the current
+    minimum are raised. Estimates never under-count; collisions can over-count
+    and promote a pair early. stats() reports the standard e*N/width bound on
+    that over-count, and the false-promotion rate a PromotionAuditV1 (about an
+    eighth of the budget on top) measures on a sample of pairs; with few
+    audited_promotions that rate is a rough estimate. Keys are
+    the signatures' content fingerprints (seq_key), not their process-local
+    ids, so a saved sketch stays valid when reloaded.
+    """
+
+    by_content = True
+
+    def __init__(self, budget_bytes: int, depth: int = 4, seed: int | None = None) -> None:
+        self.depth = max(1, int(depth))
+        self.width = max(1, int(budget_bytes) // (self.depth * _COUNTER_BYTES))
+        self._rows = [array("I", bytes(self.width * _COUNTER_BYTES)) for _ in range(self.depth)]
+        rng = random.Random(seed)
+        self._salts = [(rng.randrange(1, _MERSENNE_61), rng.randrange(_MERSENNE_61)) for _ in range(self.depth)]
+        self.total = 0
+        self.audit = PromotionAuditV1(max_entries=max(256, int(budget_bytes) // (8 * _LRU_ENTRY_BYTES)))
+
+    def _slots(self, key: Key):
+        sent_key, recv_key = key
+        x = sent_key * 0x9E3779B1 + recv_key
+        w = self.width
+        return [((a * x + b) % _MERSENNE_61) % w for a, b in self._salts]
+
+    def estimate(self, key: Key) -> int:
+        return min(row[i] for row, i in zip(self._rows, self._slots(key)))
+
+    def add(self, key: Key) -> int:
+        slots = self._slots(key)
+        rows = self._rows
+        n = min(row[i] for row, i in zip(rows, slots)) + 1
+        for row, i in zip(rows, slots):
+            if row[i] < n:
+                row[i] = n
+        self.total += 1
+        self.audit.add(key)
+        return n
+
+    def promoted(self, key: Key, threshold: int) -> None:
+        """The agent promoted key's pair (its estimate reached threshold)."""
+        self.audit.promoted(key, threshold)
+
+    def copy(self) -> "CountMinPairCountsV1":
+        new = CountMinPairCountsV1.__new__(CountMinPairCountsV1)
+        new.depth = self.depth
+        new.width = self.width
+        new._rows = [array("I", row) for row in self._rows]
+        new._salts = list(self._salts)
+        new.total = self.total
+        new.audit = self.audit.copy()
+        return new
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "mode": "sketch",
+            "width": self.width,
+            "depth": self.depth,
+            "total": self.total,
+            # With prob >= 1 - e^-depth an estimate exceeds the true count by at most this
+            "overcount_bound": math.e * self.total / self.width,
+            **self.audit.stats(),
+        }
+
+
+def make_pair_counts(mode: str, budget_bytes: int = 1 << 20, seed: int | None = None):
+    """Correlation counter for BootstrapAgentV1 promotion: exact | lru | sketch."""
+    mode = mode.strip().lower()
+    if mode == "exact":
+        return ExactPairCountsV1()
+    if mode == "lru":
+        return LruPairCountsV1(budget_bytes)
+    if mode == "sketch":
+        return CountMinPairCountsV1(budget_bytes, seed=seed)
+    raise ValueError(f"Unknown seen-counts mode: {mode!r}. Expected 'exact', 'lru' or 'sketch'")
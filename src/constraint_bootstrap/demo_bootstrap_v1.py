@@ -6,10 +6,41 @@ from .alien_partners_v1 import make_partner
 from .bootstrap_agent_v1 import BootstrapAgentV1
 from q_ternary.lane_v1 import Lane
 from .channel_v1 import ChannelV1
+from .seeds_v1 import SeedTreeV1
 
 def _fmt(seq: tuple[int, ...]) -> str:
     return "[" + " ".join(str(x) for x in seq) + "]" if seq else "[]"
 
+def _step(agent: BootstrapAgentV1, args, t: int, ex, decision) -> None:
+    m = agent.observe(ex.sent, ex.received, learn=not args.freeze, decision=decision)
+
+    # Decay handles once per step if learning is on
+    if not args.freeze:
+        agent._apply_handle_decay()
+
+    # Use lane from Decision object
+    lane_str = decision.lane.value[:2] # SPEAK->SP, QUESTION->QU, etc
+    if decision.lane == Lane.SPEAK:
+        lane_str = "SP"
+    elif decision.lane == Lane.QUESTION:
+        lane_str = "QU"
+    elif decision.lane == Lane.NA:
+        lane_str = "NA"
+    elif decision.lane == Lane.SILENT:
+        lane_str = "SI"
+
+    # Override with "De" if surprised (surprises usually happen on SPEAK)
+    if m.error >= agent.surprise_threshold:
+        lane_str = "De"
+
+    top = agent.top_handles(3)
+    top_s = " | ".join(f"{h.hid}:{h.strength:.2f} hits={h.hits} ({h.sent_sig}->{h.resp_sig})" for h in top) if top else "(none)"
+
+    print(
+        f"{t:03d}  sent={_fmt(ex.sent):<22} pred={_fmt(m.predicted):<10} "
+        f"act={_fmt(m.actual):<10} err={m.error:>4.1f}  lane={lane_str}  handles={top_s}"
+    )
+
 def main() -> int:
     ap = argparse.ArgumentParser(description="Constraint-first bootstrap demo (v0.1)")
     ap.add_argument("--partner", default="prime", help="prime | ratio | symmetry | mixed | adversarial")
@@ -17,24 +48,39 @@ def main() -> int:
     ap.add_argument("--noise-prob", type=float, default=0.0)
     ap.add_argument("--noise-jitter", type=int, default=0)
     ap.add_argument("--seed", type=int, default=7)
+    ap.add_argument("--worker", type=int, default=None, help="Run as worker N of the experiment: per-component seeds derived from --seed (seeds_v1.SeedTreeV1)")
     ap.add_argument("--freeze", action="store_true", help="Skip learning/handle updates (for experiments)")
     ap.add_argument("--decay-rate", type=float, default=0.0)
+    ap.add_argument("--lazy-decay", action="store_true", help="Decay handles on read instead of sweeping all per step")
     ap.add_argument("--prune-below", type=float, default=0.0)
     ap.add_argument("--compete-topk", type=int, default=0)
     ap.add_argument("--inhibit-mult", type=float, default=0.0)
     ap.add_argument("--promote-threshold", type=int, default=4)
+    ap.add_argument("--batch", type=int, default=1, help="Choose and predict N steps at a time (predict_batch). Focus, obsession and cooldown do not update between steps of a chunk, so results are not comparable to a --batch 1 run")
+    ap.add_argument("--seen-counts", default="exact", help="exact | lru | sketch (bounded promotion counting)")
+    ap.add_argument("--seen-counts-budget", type=int, default=1 << 20, help="Memory budget in bytes for lru/sketch")
+    ap.add_argument("--telemetry", default="full", help="full | minimal (decision meta/question built only when read)")
+    ap.add_argument("--action-stream", action="store_true", help="Draw exploration actions from the buffered NumPy stream (agent.actions())")
+    ap.add_argument("--fuzzy-tolerance", type=float, default=0.0, help="Match unseen sequences to the nearest known one within this error (noisy channels)")
 
     args = ap.parse_args()
 
-    partner = make_partner(args.partner)
-    chan = ChannelV1(noise_prob=args.noise_prob, noise_jitter=args.noise_jitter, seed=args.seed)
+    # Without --worker, agent and channel share --seed (and the partner keeps its own default)
+    seeds = SeedTreeV1(args.seed).worker(args.worker) if args.worker is not None else None
+    partner = make_partner(args.partner, seed=seeds.seed("partner") if seeds else None)
+    chan = ChannelV1(noise_prob=args.noise_prob, noise_jitter=args.noise_jitter, seed=seeds.seed("channel") if seeds else args.seed)
     agent = BootstrapAgentV1(
-        seed=args.seed,
+        seed=seeds.seed("agent") if seeds else args.seed,
         decay_rate=args.decay_rate,
+        lazy_decay=args.lazy_decay,
         prune_below=args.prune_below,
         compete_topk=args.compete_topk,
         inhibit_mult=args.inhibit_mult,
         promote_threshold=args.promote_threshold,
+        seen_counts_mode=args.seen_counts,
+        seen_counts_budget=args.seen_counts_budget,
+        telemetry=args.telemetry,
+        fuzzy_tolerance=args.fuzzy_tolerance,
     )
 
     print("=" * 72)
@@ -42,49 +88,27 @@ def main() -> int:
     print("Watch: predicted vs actual, error, and handles forming.")
     print("=" * 72)
 
-    for t in range(1, args.steps + 1):
-        sent = agent.choose_action(t)
-        raw_resp = partner.respond(sent)
-        ex = chan.transmit(sent, raw_resp)
-        decision = agent.predict(ex.sent)
-        m = agent.observe(ex.sent, ex.received, learn=not args.freeze)
-
-        # Decay handles once per step if learning is on
-        if not args.freeze:
-            agent._apply_handle_decay()
-
-        # Use lane from Decision object
-        lane_str = decision.lane.value[:2] # SPEAK->SP, QUESTION->QU, etc
-        if decision.lane == Lane.SPEAK:
-            lane_str = "SP"
-        elif decision.lane == Lane.QUESTION:
-            lane_str = "QU"
-        elif decision.lane == Lane.NA:
-            lane_str = "NA"
-        elif decision.lane == Lane.SILENT:
-            lane_str = "SI"
-        
-        # Override with "De" if surprised (surprises usually happen on SPEAK)
-        if m.error >= agent.surprise_threshold:
-            lane_str = "De"
-
-        top = agent.handles[:3]
-        top_s = " | ".join(f"{h.hid}:{h.strength:.2f} hits={h.hits} ({h.sent_sig}->{h.resp_sig})" for h in top) if top else "(none)"
-
-        print(
-            f"{t:03d}  sent={_fmt(ex.sent):<22} pred={_fmt(m.predicted):<10} "
-            f"act={_fmt(m.actual):<10} err={m.error:>4.1f}  lane={lane_str}  handles={top_s}"
-        )
+    batch = max(1, args.batch)
+    actions = agent.actions(seed=seeds.seed("actions") if seeds else None) if args.action_stream else None
+    for start in range(1, args.steps + 1, batch):
+        # With --batch N, actions and decisions for N steps are taken up front against
+        # the handles as they were at the start of the chunk
+        ts = range(start, min(start + batch, args.steps + 1))
+        exs = [chan.transmit(sent, partner.respond(sent)) for sent in (next(actions) if actions else agent.choose_action(t) for t in ts)]
+        decisions = agent.predict_batch([ex.sent for ex in exs])
+        for t, ex, decision in zip(ts, exs, decisions):
+            _step(agent, args, t, ex, decision)
 
     print("-" * 72)
     print("Final handles (strongest first):")
-    for h in agent.handles[:12]:
+    for h in agent.top_handles(12):
         print(f"  {h.hid}  strength={h.strength:.2f}  hits={h.hits} misses={h.misses}  {h.sent_sig} -> {h.resp_sig}")
 
     print("-" * 72)
     print("Telemetry:")
     print(f"  multi-candidate steps: {agent.total_multi_candidate_steps}")
     print(f"  total inhibitions:     {agent.total_inhibitions}")
+    print(f"  total evictions:       {agent.total_evictions}")
     print(f"  total handles created: {agent._total_handles_created}")
     avg_cand = agent.sum_candidate_count / agent.total_predict_calls if agent.total_predict_calls > 0 else 0
     print(f"  avg candidate count:   {avg_cand:.2f}")
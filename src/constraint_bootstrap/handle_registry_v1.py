@@ -0,0 +1,620 @@
+from __future__ import annotations
+
+import heapq
+import math
+from collections.abc import MutableSequence
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+from .sequence_index_v1 import SequenceIndexV1
+from .signatures_v1 import SIGS, as_sig_id
+
+if TYPE_CHECKING:
+    from .bootstrap_agent_v1 import Handle
+
+# Log-space headroom on ranking bounds, covering float drift between a bound
+# and the same handle's strength after many decay ticks
+_RANK_SLACK = 1e-6
+
+
+def _best_two(handles: Iterable["Handle"]) -> tuple:
+    """Strongest two by (strength, hits); on ties the earlier one wins, like a stable descending sort."""
+    h1 = h2 = None
+    k1 = k2 = None
+    for h in handles:
+        k = (h.strength, h.hits)
+        if h1 is None or k > k1:
+            h2, k2, h1, k1 = h1, k1, h, k
+        elif h2 is None or k > k2:
+            h2, k2 = h, k
+    return h1, h2
+
+
+class HandleRegistryV1(MutableSequence):
+    """
+    Handle registry with maintained sent_id -> [Handle] and
+    (sent_id, resp_id) -> [Handle] indexes. Lookups take a signature id
+    or its string form.
+
+    Behaves like the plain list the agent used to keep (append/extend/index/iterate),
+    so existing callers and tests that poke at agent._handles keep working.
+    Storage is an insertion-ordered dict keyed by id(handle): removal is O(1)
+    and keeps registry order. Within one sent_sig bucket, handles stay in
+    registry order, so stable sorts over a bucket give the same result as
+    sorts over a full scan.
+
+    resp_id is part of the pair key, so rewrite it through set_resp_sig()
+    (e.g. proto adoption) rather than assigning it on the handle directly.
+
+    Lazy decay: decay(..., lazy=True) only advances a tick counter. Each handle
+    remembers the tick it was last materialized at (h.decay_t), and reads through
+    the registry (lookups, iteration, indexing) apply mult**dt on demand.
+
+    Lazy pruning: with prune_below > 0, handles sit in a min-heap keyed by the
+    tick at which their decayed strength will first drop below prune_below.
+    Each tick pops only the handles that are due. Handles handed out by
+    for_sent/for_pair (i.e. the ones the agent may update) are rescheduled at
+    the next tick; iteration is treated as read-only.
+
+    Ranking: top(k) serves the strongest k handles (ordered like the agent's
+    sorted() by (strength, hits), ties in registry order) from a lazily
+    maintained max-heap of upper bounds. Bounds are kept in a decay-normalized
+    log frame, so a decay step just advances a clock instead of invalidating
+    the heap. Handles handed out by lookups, indexing or top() are re-ranked
+    at the next query; iterating the registry re-ranks everything. Handles
+    mutated any other way should be passed to touch().
+
+    Per-signature top-2: top2_for_sent() serves the counts and two strongest
+    handles the agent routes a prediction on, cached per sent_id until one of
+    that signature's handles is handed out or changed through the registry,
+    or the next decay step.
+
+    Fuzzy lookup: nearest_sent() finds the closest sent signature that has
+    handles, from a SequenceIndexV1 built on first use and kept in step with
+    the sent_id index from then on.
+    """
+
+    def __init__(self, handles: Iterable["Handle"] = ()) -> None:
+        self._order: Dict[int, "Handle"] = {}
+        self._by_sent: Dict[int, List["Handle"]] = {}
+        self._by_pair: Dict[Tuple[int, int], List["Handle"]] = {}
+        # Lazy decay clock
+        self._ticks = 0
+        self._synced_at = 0
+        self._mults: Tuple[float, float] = (1.0, 1.0)
+        # Lazy prune schedule
+        self._prune_below = 0.0
+        self._heap: List[Tuple[float, int, "Handle"]] = []
+        self._heap_seq = 0
+        self._dirty: Dict[int, "Handle"] = {}
+        # Ranking heap of (-bound, -hits, order_seq, push_n, h), see top()
+        self._next_order = 0
+        self._rank_heap: List[tuple] = []
+        self._rank_pushes = 0
+        self._rank_dirty: Dict[int, "Handle"] = {}
+        self._rank_stale = True
+        self._rank_clock = 0
+        self._rank_mults = (1.0, 1.0)
+        self._rank_logm = 0.0
+        self._rank_origin = 0 # clock at the last decay-rate change
+        self._rank_offset0 = 0.0 # frame offset accumulated before it
+        # sent_id -> (rank clock, elig_min, top2_for_sent() result, strongest_two() pair or None)
+        self._top2: Dict[int, tuple] = {}
+        self._near: Optional[SequenceIndexV1] = None # see nearest_sent()
+        for h in handles:
+            self.append(h)
+
+    def _index_add(self, h: "Handle") -> None:
+        bucket = self._by_sent.get(h.sent_id)
+        if bucket is None:
+            bucket = self._by_sent[h.sent_id] = []
+            if self._near is not None:
+                self._near.add(h.sent_id)
+        bucket.append(h)
+        self._by_pair.setdefault((h.sent_id, h.resp_id), []).append(h)
+
+    @staticmethod
+    def _bucket_remove(index: dict, key, h: "Handle") -> None:
+        bucket = index.get(key)
+        if not bucket:
+            return
+        for i, other in enumerate(bucket):
+            if other is h:
+                del bucket[i]
+                break
+        if not bucket:
+            del index[key]
+
+    def _index_remove(self, h: "Handle") -> None:
+        self._bucket_remove(self._by_sent, h.sent_id, h)
+        self._bucket_remove(self._by_pair, (h.sent_id, h.resp_id), h)
+        if self._near is not None and h.sent_id not in self._by_sent:
+            self._near.discard(h.sent_id)
+
+    def _rebuild(self, handles: List["Handle"]) -> None:
+        """Replace the contents wholesale (positional edits, sorts)."""
+        self.sync()
+        self._order = {}
+        self._by_sent = {}
+        self._by_pair = {}
+        self._dirty = {}
+        self._heap = []
+        self._next_order = 0
+        self._rank_stale = True
+        self._top2 = {}
+        self._near = None
+        for h in handles:
+            self.append(h)
+
+    def fork(self, clone: Callable[["Handle"], "Handle"]) -> "HandleRegistryV1":
+        """
+        Independent copy holding clone(h) for every handle, in the same order and
+        with the same pending lazy decay / prune schedule, so both sides evolve
+        exactly as this registry would have.
+        """
+        handles = list(self._order.values())
+        clones = [clone(h) for h in handles]
+        new = type(self)()
+        new._ticks = self._ticks
+        new.extend(clones)
+        twin = {id(h): c for h, c in zip(handles, clones)}
+        for h, c in zip(handles, clones):
+            c.decay_t = h.decay_t
+            c.prune_seq = h.prune_seq
+        new._synced_at = self._synced_at
+        new._mults = self._mults
+        new._prune_below = self._prune_below
+        new._heap_seq = self._heap_seq
+        new._heap = [(tick, seq, twin[id(h)]) for tick, seq, h in self._heap if self._is_live(seq, h)]
+        heapq.heapify(new._heap)
+        new._dirty = {id(twin[k]): twin[k] for k in self._dirty if k in twin}
+        return new
+
+    # --- Lazy decay ---
+
+    def _materialize(self, h: "Handle") -> None:
+        dt = self._ticks - h.decay_t
+        if dt > 0:
+            elig_mult, truth_mult = self._mults
+            h.eligibility *= elig_mult ** dt
+            h.truth *= truth_mult ** dt
+            h.decay_t = self._ticks
+
+    def sync(self) -> None:
+        """Materialize pending lazy decay on every handle."""
+        if self._synced_at == self._ticks:
+            return
+        for h in self._order.values():
+            self._materialize(h)
+        self._synced_at = self._ticks
+
+    def decay(self, elig_mult: float, truth_mult: float, lazy: bool = False, prune_below: float = 0.0) -> int:
+        """
+        One decay step: eligibility *= elig_mult, truth *= truth_mult, then drop
+        handles whose strength fell below prune_below. Returns how many were dropped.
+        """
+        self._rank_tick(elig_mult, truth_mult)
+        if not lazy:
+            self.sync()
+            self._heap = []
+            self._dirty = {}
+            self._prune_below = 0.0
+            for h in self._order.values():
+                h.eligibility *= elig_mult
+                h.truth *= truth_mult
+            if prune_below > 0.0:
+                return self.retain(lambda h: h.strength >= prune_below)
+            return 0
+
+        if (elig_mult, truth_mult) != self._mults or prune_below != self._prune_below:
+            # Pending ticks were taken at the old rates; every due tick moves
+            self.sync()
+            self._mults = (elig_mult, truth_mult)
+            self._prune_below = prune_below
+            self._heap = []
+            self._dirty = dict(self._order) if prune_below > 0.0 else {}
+
+        if self._dirty:
+            for h in self._dirty.values():
+                if self._order.get(id(h)) is h:
+                    self._materialize(h)
+                    self._schedule(h)
+            self._dirty = {}
+            if len(self._heap) > 2 * len(self._order) + 64:
+                self._compact_heap()
+
+        self._ticks += 1
+        return self._evict_due() if self._prune_below > 0.0 else 0
+
+    # --- Lazy prune schedule ---
+
+    @staticmethod
+    def _ticks_to_below(value: float, mult: float, threshold: float) -> float:
+        """Smallest k >= 1 with value * mult**k < threshold (inf if never)."""
+        if value * mult < threshold:
+            return 1
+        if mult >= 1.0:
+            return math.inf
+        k = max(1, int(math.log(threshold / value) / math.log(mult)))
+        while value * mult ** k >= threshold:
+            k += 1
+        while k > 1 and value * mult ** (k - 1) < threshold:
+            k -= 1
+        return k
+
+    def _schedule(self, h: "Handle") -> None:
+        elig_mult, truth_mult = self._mults
+        k = min(
+            self._ticks_to_below(h.eligibility, elig_mult, self._prune_below),
+            self._ticks_to_below(h.truth, truth_mult, self._prune_below),
+        )
+        self._heap_seq += 1
+        h.prune_seq = self._heap_seq # older heap entries for h are now stale
+        if k != math.inf:
+            heapq.heappush(self._heap, (h.decay_t + k, self._heap_seq, h))
+
+    def _is_live(self, seq: int, h: "Handle") -> bool:
+        return h.prune_seq == seq and self._order.get(id(h)) is h
+
+    def _compact_heap(self) -> None:
+        self._heap = [e for e in self._heap if self._is_live(e[1], e[2])]
+        heapq.heapify(self._heap)
+
+    def _evict_due(self) -> int:
+        evicted = 0
+        while self._heap and self._heap[0][0] <= self._ticks:
+            _, seq, h = heapq.heappop(self._heap)
+            if not self._is_live(seq, h):
+                continue
+            self._materialize(h)
+            if h.strength < self._prune_below:
+                self.remove(h)
+                evicted += 1
+            else:
+                # Float rounding put the projection one tick early
+                self._schedule(h)
+        return evicted
+
+    # --- Ranking ---
+
+    def _rank_offset(self) -> float:
+        return self._rank_offset0 + (self._rank_clock - self._rank_origin) * self._rank_logm
+
+    def _rank_tick(self, elig_mult: float, truth_mult: float) -> None:
+        """
+        A decay step scales every strength by at most m = max(elig_mult, truth_mult),
+        so log(strength) - offset never rises for an untouched handle when the
+        offset grows by log(m) per step. A rate change only changes how fast it grows.
+        """
+        if (elig_mult, truth_mult) != self._rank_mults:
+            self._rank_offset0 = self._rank_offset()
+            self._rank_origin = self._rank_clock
+            self._rank_mults = (elig_mult, truth_mult)
+            m = max(elig_mult, truth_mult)
+            self._rank_logm = math.log(m) if m > 0.0 else 0.0 # 0.0 is still an upper bound
+        self._rank_clock += 1
+
+    def _rank_entry(self, h: "Handle") -> tuple:
+        self._materialize(h)
+        s = h.strength
+        if s > 0.0:
+            bound = math.log(s) - self._rank_offset() + _RANK_SLACK
+        else:
+            bound = -math.inf # zero stays exactly zero under decay
+        self._rank_pushes += 1
+        return (-bound, -h.hits, h.order_seq, self._rank_pushes, h)
+
+    def _refresh_rank(self) -> None:
+        if not self._rank_stale and len(self._rank_heap) > 2 * len(self._order) + 64:
+            self._rank_stale = True # compact duplicate/dead entries
+        if self._rank_stale:
+            self._rank_heap = [self._rank_entry(h) for h in self._order.values()]
+            heapq.heapify(self._rank_heap)
+            self._rank_dirty = {}
+            self._rank_stale = False
+        elif self._rank_dirty:
+            for h in self._rank_dirty.values():
+                if self._order.get(id(h)) is h:
+                    heapq.heappush(self._rank_heap, self._rank_entry(h))
+            self._rank_dirty = {}
+
+    def touch(self, h: "Handle") -> None:
+        """Re-rank h at the next top() query (after mutating it outside the registry)."""
+        self._top2.pop(h.sent_id, None)
+        if not self._rank_stale:
+            self._rank_dirty[id(h)] = h
+
+    def top(self, k: int | None = None) -> List["Handle"]:
+        """
+        Strongest handles first, ordered by (strength, hits) with ties in registry order.
+        top() ranks everything; top(k) pops only the heap entries whose bound could
+        still beat the k-th best exact candidate.
+        """
+        n = len(self._order)
+        if k is None or k >= n:
+            self._rank_stale = True # every handle is handed out
+            self._top2 = {}
+            return sorted(self._values(), key=lambda h: (h.strength, h.hits), reverse=True)
+        if k <= 0:
+            return []
+        self._refresh_rank()
+        heap = self._rank_heap
+        shift = self._rank_offset()
+        best: List[tuple] = [] # min-heap: worst of the best k on top
+        popped: List["Handle"] = []
+        seen = set()
+        while heap:
+            neg_bound, neg_hits, seq, _, h = heap[0]
+            if len(best) == k:
+                s_k, hits_k, neg_seq_k, _ = best[0]
+                if s_k > 0.0:
+                    if math.log(s_k) - shift > -neg_bound:
+                        break
+                elif neg_bound == math.inf and (hits_k, neg_seq_k) > (-neg_hits, -seq):
+                    break
+            heapq.heappop(heap)
+            if id(h) in seen or self._order.get(id(h)) is not h:
+                continue # duplicate or dead entry
+            seen.add(id(h))
+            self._materialize(h)
+            popped.append(h)
+            item = (h.strength, h.hits, -h.order_seq, h)
+            if len(best) < k:
+                heapq.heappush(best, item)
+            elif item[:3] > best[0][:3]:
+                heapq.heapreplace(best, item)
+        for h in popped:
+            heapq.heappush(heap, self._rank_entry(h))
+        ranked = [item[3] for item in sorted(best, key=lambda item: item[:3], reverse=True)]
+        for h in ranked:
+            self._rank_dirty[id(h)] = h
+            self._top2.pop(h.sent_id, None)
+        return ranked
+
+    # --- Sequence protocol ---
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def _values(self):
+        """Synced read-only view, for aggregates that don't hand handles out."""
+        if self._synced_at != self._ticks:
+            self.sync()
+        return self._order.values()
+
+    def __iter__(self):
+        self._rank_stale = True # callers may update what they iterate
+        self._top2 = {}
+        return iter(self._values())
+
+    def __getitem__(self, i):
+        values = self._values()
+        if isinstance(i, slice):
+            self._rank_stale = True
+            self._top2 = {}
+            return list(values)[i]
+        n = len(self._order)
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("handle registry index out of range")
+        if i > n // 2:
+            h = next(islice(reversed(values), n - 1 - i, None))
+        else:
+            h = next(islice(values, i, None))
+        self.touch(h)
+        return h
+
+    def __contains__(self, h) -> bool:
+        return self._order.get(id(h)) is h
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (list, HandleRegistryV1)):
+            return list(self._values()) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"HandleRegistryV1({list(self._values())!r})"
+
+    # --- Lookups ---
+
+    def for_sent(self, sent: int | str) -> List["Handle"]:
+        """All handles for a sent signature, in registry order (a fresh list, safe to sort)."""
+        bucket = self._by_sent.get(as_sig_id(sent))
+        if not bucket:
+            return []
+        self._hand_out(bucket)
+        return list(bucket)
+
+    def _hand_out(self, bucket: List["Handle"]) -> None:
+        """Materialize a lookup result and mark it for rescheduling / re-ranking."""
+        self._top2.pop(bucket[0].sent_id, None) # one bucket is always one sent_id
+        if self._synced_at != self._ticks:
+            for h in bucket:
+                self._materialize(h)
+        if self._prune_below > 0.0:
+            for h in bucket:
+                self._dirty[id(h)] = h
+        if not self._rank_stale:
+            for h in bucket:
+                self._rank_dirty[id(h)] = h
+
+    def top2_for_sent(self, sent: int | str, elig_min: float) -> Tuple[int, int, Optional["Handle"], Optional["Handle"]]:
+        """
+        (matches, eligible, h1, h2) for a sent signature: its handle count, how
+        many have eligibility >= elig_min, and the strongest two by (strength, hits),
+        ties in registry order, among the eligible ones (among all of them when
+        none is eligible). Read-only: the handles are not handed out.
+        """
+        sent_id = as_sig_id(sent)
+        hit = self._top2.get(sent_id)
+        if hit is not None and hit[0] == self._rank_clock and hit[1] == elig_min:
+            return hit[2]
+        bucket = self._by_sent.get(sent_id)
+        if not bucket:
+            return 0, 0, None, None
+        if self._synced_at != self._ticks:
+            for h in bucket:
+                self._materialize(h)
+        eligible = [h for h in bucket if h.eligibility >= elig_min]
+        result = (len(bucket), len(eligible), *_best_two(eligible or bucket))
+        # When the eligibility filter kept all or nothing, h1/h2 are also the bucket's strongest two
+        strongest = result[2:] if len(eligible) in (0, len(bucket)) else None
+        self._top2[sent_id] = (self._rank_clock, elig_min, result, strongest)
+        return result
+
+    def strongest_two(self, sent: int | str) -> Tuple[Optional["Handle"], Optional["Handle"]]:
+        """
+        The strongest two handles for a sent signature by (strength, hits), ties in
+        registry order, eligible or not. Read-only. Usually served from the entry
+        top2_for_sent() cached when predict() last ranked the signature; otherwise
+        one pass over the signature's bucket.
+        """
+        sent_id = as_sig_id(sent)
+        hit = self._top2.get(sent_id)
+        fresh = hit is not None and hit[0] == self._rank_clock
+        if fresh and hit[3] is not None:
+            return hit[3]
+        bucket = self._by_sent.get(sent_id)
+        if not bucket:
+            return None, None
+        if self._synced_at != self._ticks:
+            for h in bucket:
+                self._materialize(h)
+        pair = _best_two(bucket)
+        if fresh:
+            self._top2[sent_id] = (*hit[:3], pair)
+        return pair
+
+    def nearest_sent(self, sent: int | str | Tuple[int, ...], radius: int) -> Optional[int]:
+        """
+        Closest sent signature with handles, of the same length and within
+        radius in pulse_distance() (ties to the lowest id), or None. sent may
+        also be a pulse tuple that was never interned.
+        """
+        if self._near is None:
+            self._near = SequenceIndexV1()
+            for sent_id in self._by_sent:
+                self._near.add(sent_id)
+        return self._near.nearest(sent if type(sent) is tuple else SIGS.seq_of(as_sig_id(sent)), radius)
+
+    def count_sent(self, sent: int | str) -> int:
+        bucket = self._by_sent.get(as_sig_id(sent))
+        return len(bucket) if bucket else 0
+
+    def for_pair(self, sent: int | str, resp: int | str) -> List["Handle"]:
+        """Handles mapping sent -> resp, in registry order."""
+        bucket = self._by_pair.get((as_sig_id(sent), as_sig_id(resp)))
+        if not bucket:
+            return []
+        self._hand_out(bucket)
+        return list(bucket)
+
+    def has_pair(self, sent: int | str, resp: int | str) -> bool:
+        return (as_sig_id(sent), as_sig_id(resp)) in self._by_pair
+
+    def set_resp_sig(self, h: "Handle", resp: int | str) -> None:
+        """Rewrite a registered handle's response signature and move it to its new pair bucket."""
+        resp_id = as_sig_id(resp)
+        self._top2.pop(h.sent_id, None)
+        self._bucket_remove(self._by_pair, (h.sent_id, h.resp_id), h)
+        h.resp_id = resp_id
+        # Keep registry order inside the destination bucket
+        self._by_pair[(h.sent_id, resp_id)] = [
+            other for other in self._by_sent.get(h.sent_id, ()) if other.resp_id == resp_id
+        ]
+
+    # --- Bulk updates and aggregates (vectorized by HandleTableV1) ---
+
+    def inhibit(self, handles: List["Handle"], amount: float) -> None:
+        """Lower eligibility and truth of the given handles by amount (floored at 0)."""
+        for h in handles:
+            self._top2.pop(h.sent_id, None)
+            h.eligibility = max(0.0, h.eligibility - amount)
+            h.truth = max(0.0, h.truth - amount)
+
+    def avg_strength(self) -> float:
+        return sum(h.strength for h in self._values()) / len(self) if self._order else 0.0
+
+    def speakable_counts(self, truth_min: float, min_strength: float) -> Tuple[int, int]:
+        """(speakable, gated_by_eligibility): truthful handles that do / don't pass min_strength."""
+        speakable = 0
+        gated = 0
+        for h in self._values():
+            if h.truth >= truth_min:
+                if h.strength >= min_strength:
+                    speakable += 1
+                else:
+                    gated += 1
+        return speakable, gated
+
+    def top_by_strength(self, k: int) -> List["Handle"]:
+        return sorted(self._values(), key=lambda h: h.strength, reverse=True)[:k]
+
+    # --- Mutations (all keep the indexes consistent) ---
+
+    def append(self, h: "Handle") -> None:
+        # New handles hold current values; they owe no pending decay
+        h.decay_t = self._ticks
+        h.order_seq = self._next_order
+        self._next_order += 1
+        self._order[id(h)] = h
+        self._index_add(h)
+        self._top2.pop(h.sent_id, None)
+        if self._prune_below > 0.0:
+            self._dirty[id(h)] = h
+        if not self._rank_stale:
+            self._rank_dirty[id(h)] = h
+
+    def extend(self, handles: Iterable["Handle"]) -> None:
+        for h in handles:
+            self.append(h)
+
+    def __iadd__(self, handles: Iterable["Handle"]) -> "HandleRegistryV1":
+        self.extend(handles)
+        return self
+
+    def insert(self, i: int, h: "Handle") -> None:
+        handles = list(self)
+        handles.insert(i, h)
+        self._rebuild(handles)
+
+    def remove(self, h: "Handle") -> None:
+        if self._order.get(id(h)) is not h:
+            raise ValueError("handle not in registry")
+        del self._order[id(h)]
+        self._dirty.pop(id(h), None)
+        self._top2.pop(h.sent_id, None)
+        self._index_remove(h)
+
+    def pop(self, i: int = -1) -> "Handle":
+        h = self[i]
+        self.remove(h)
+        return h
+
+    def clear(self) -> None:
+        self._rebuild([])
+
+    def __setitem__(self, i, value) -> None:
+        handles = list(self)
+        handles[i] = value
+        self._rebuild(handles)
+
+    def __delitem__(self, i) -> None:
+        handles = list(self)
+        del handles[i]
+        self._rebuild(handles)
+
+    def sort(self, *args, **kwargs) -> None:
+        self._rebuild(sorted(self, *args, **kwargs))
+
+    def reverse(self) -> None:
+        self._rebuild(list(reversed(list(self))))
+
+    def retain(self, keep: Callable[["Handle"], bool]) -> int:
+        """Drop every handle for which keep(h) is False. Returns how many were dropped."""
+        self.sync()
+        dropped = [h for h in self._order.values() if not keep(h)]
+        for h in dropped:
+            self.remove(h)
+        return len(dropped)
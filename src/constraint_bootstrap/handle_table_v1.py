@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from typing import Iterable, List, Tuple
+
+import numpy as np
+
+from .bootstrap_agent_v1 import Handle
+from .handle_registry_v1 import HandleRegistryV1
+
+_FIELDS = ("eligibility", "truth", "hits", "misses")
+
+
+def _column(array_name: str, cast):
+    def fget(self):
+        return cast(getattr(self._store, array_name)[self._row])
+
+    def fset(self, value):
+        getattr(self._store, array_name)[self._row] = value
+
+    return property(fget, fset)
+
+
+class TableHandleV1(Handle):
+    """
+    A Handle whose numeric fields live in a HandleTableV1 row.
+    Handles are rebound to this class when added to a table and restored to a
+    plain Handle (values copied back) when removed, so references held by
+    callers stay valid either way.
+    """
+    __slots__ = () # same layout as Handle, so __class__ can be swapped in place
+    eligibility = _column("_elig", float)
+    truth = _column("_truth", float)
+    hits = _column("_hits", int)
+    misses = _column("_misses", int)
+
+    @property
+    def strength(self) -> float:
+        return min(self.eligibility, self.truth)
+
+
+class HandleTableV1(HandleRegistryV1):
+    """
+    Structure-of-arrays handle store: eligibility, truth, hits, misses and
+    signature ids sit in contiguous NumPy arrays (one row per handle).
+
+    Same interface and indexes as HandleRegistryV1. Decay/prune, inhibition,
+    strength and the trainer's end-of-round aggregates run as array ops.
+    Decay is always a vectorized sweep here, so the lazy flag is accepted but
+    not needed.
+    """
+
+    def __init__(self, handles: Iterable[Handle] = (), capacity: int = 1024) -> None:
+        self._n = 0
+        self._cap = max(16, int(capacity))
+        self._elig = np.zeros(self._cap, dtype=np.float64)
+        self._truth = np.zeros(self._cap, dtype=np.float64)
+        self._hits = np.zeros(self._cap, dtype=np.int64)
+        self._misses = np.zeros(self._cap, dtype=np.int64)
+        self._sent_id = np.zeros(self._cap, dtype=np.int32)
+        self._resp_id = np.zeros(self._cap, dtype=np.int32)
+        self._seq = np.zeros(self._cap, dtype=np.int64) # registry order, for stable ranking
+        self._next_seq = 0
+        self._views: List[Handle] = []
+        super().__init__(handles)
+
+    # --- Row management ---
+
+    def _grow(self) -> None:
+        self._cap *= 2
+        for name in ("_elig", "_truth", "_hits", "_misses", "_sent_id", "_resp_id", "_seq"):
+            old = getattr(self, name)
+            new = np.zeros(self._cap, dtype=old.dtype)
+            new[:self._n] = old[:self._n]
+            setattr(self, name, new)
+
+    def _bind(self, h: Handle) -> None:
+        values = [getattr(h, f) for f in _FIELDS]
+        if self._n == self._cap:
+            self._grow()
+        row = self._n
+        self._n += 1
+        self._elig[row], self._truth[row], self._hits[row], self._misses[row] = values
+        self._sent_id[row] = h.sent_id
+        self._resp_id[row] = h.resp_id
+        self._seq[row] = self._next_seq
+        self._next_seq += 1
+        self._views.append(h)
+        h._store = self
+        h._row = row
+        h.__class__ = TableHandleV1
+
+    def _unbind(self, h: Handle) -> None:
+        values = {f: getattr(h, f) for f in _FIELDS}
+        row = h._row
+        last = self._n - 1
+        if row != last:
+            for arr in (self._elig, self._truth, self._hits, self._misses, self._sent_id, self._resp_id, self._seq):
+                arr[row] = arr[last]
+            moved = self._views[last]
+            self._views[row] = moved
+            moved._row = row
+        self._views.pop()
+        self._n -= 1
+        h.__class__ = Handle
+        h._store = None
+        h._row = -1
+        for f, v in values.items():
+            setattr(h, f, v)
+
+    # --- Registry overrides ---
+
+    def append(self, h: Handle) -> None:
+        self._bind(h)
+        super().append(h)
+
+    def extend(self, handles: Iterable[Handle]) -> None:
+        # Bulk _bind: one slice write per column instead of per-row scalar writes
+        handles = list(handles)
+        n0 = self._n
+        n1 = n0 + len(handles)
+        while self._cap < n1:
+            self._grow()
+        for name, f in zip(("_elig", "_truth", "_hits", "_misses"), _FIELDS):
+            getattr(self, name)[n0:n1] = [getattr(h, f) for h in handles]
+        self._sent_id[n0:n1] = [h.sent_id for h in handles]
+        self._resp_id[n0:n1] = [h.resp_id for h in handles]
+        self._seq[n0:n1] = np.arange(self._next_seq, self._next_seq + len(handles))
+        self._next_seq += len(handles)
+        self._n = n1
+        self._views.extend(handles)
+        for row, h in enumerate(handles, n0):
+            h._store = self
+            h._row = row
+            h.__class__ = TableHandleV1
+            HandleRegistryV1.append(self, h)
+
+    def remove(self, h: Handle) -> None:
+        super().remove(h)
+        self._unbind(h)
+
+    def _rebuild(self, handles: List[Handle]) -> None:
+        handles = list(handles)
+        for h in list(self._views):
+            self._unbind(h)
+        self._next_seq = 0
+        super()._rebuild(handles)
+
+    def set_resp_sig(self, h: Handle, resp: int | str) -> None:
+        super().set_resp_sig(h, resp)
+        self._resp_id[h._row] = h.resp_id
+
+    # --- Vectorized ops ---
+
+    def strengths(self) -> np.ndarray:
+        """strength = min(eligibility, truth) for every row."""
+        n = self._n
+        return np.minimum(self._elig[:n], self._truth[:n])
+
+    def decay(self, elig_mult: float, truth_mult: float, lazy: bool = False, prune_below: float = 0.0) -> int:
+        self._rank_tick(elig_mult, truth_mult)
+        n = self._n
+        self._elig[:n] *= elig_mult
+        self._truth[:n] *= truth_mult
+        if prune_below <= 0.0:
+            return 0
+        doomed = [self._views[r] for r in np.flatnonzero(self.strengths() < prune_below)]
+        for h in doomed:
+            self.remove(h)
+        return len(doomed)
+
+    def inhibit(self, handles: List[Handle], amount: float) -> None:
+        if not handles:
+            return
+        for h in handles:
+            self._top2.pop(h.sent_id, None)
+        rows = np.fromiter((h._row for h in handles), dtype=np.int64, count=len(handles))
+        self._elig[rows] = np.maximum(0.0, self._elig[rows] - amount)
+        self._truth[rows] = np.maximum(0.0, self._truth[rows] - amount)
+
+    def avg_strength(self) -> float:
+        return float(self.strengths().mean()) if self._n else 0.0
+
+    def speakable_counts(self, truth_min: float, min_strength: float) -> Tuple[int, int]:
+        n = self._n
+        truthful = self._truth[:n] >= truth_min
+        strong = self.strengths() >= min_strength
+        return int(np.count_nonzero(truthful & strong)), int(np.count_nonzero(truthful & ~strong))
+
+    def top_by_strength(self, k: int) -> List[Handle]:
+        # Strongest first; ties keep registry order like a stable sort would
+        order = np.lexsort((self._seq[:self._n], -self.strengths()))[:k]
+        return [self._views[r] for r in order]
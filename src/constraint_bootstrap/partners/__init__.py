@@ -15,11 +15,15 @@ _REGISTRY: dict[str, Type[Partner]] = {}
 def register_partner(kind: str, cls: Type[Partner]):
     _REGISTRY[kind.lower()] = cls
 
-def make_partner(kind: str) -> Partner:
+def make_partner(kind: str, seed: int | None = None) -> Partner:
+    """Partner by registered kind; seed goes to partners that are randomized (others ignore it)."""
     # Ensure all partners are registered
     from . import legacy_v1, sum_prime_v1, mixed_v1, adversarial_partner_v1, mixed_shift_v1, mixed_shift_large_v1
     
     kind = kind.strip().lower()
     if kind not in _REGISTRY:
         raise ValueError(f"Unknown partner kind: {kind!r}. Registered: {list(_REGISTRY.keys())}")
-    return _REGISTRY[kind]()
+    cls = _REGISTRY[kind]
+    if seed is not None and "seed" in getattr(cls, "__dataclass_fields__", {}):
+        return cls(seed=seed)
+    return cls()
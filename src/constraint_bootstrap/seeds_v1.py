@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import hashlib
+import random
+from dataclasses import dataclass
+from typing import List, Tuple
+
+
+@dataclass(frozen=True)
+class SeedTreeV1:
+    """
+    Independent, reproducible random streams per component and per worker,
+    all derived from one experiment seed.
+
+    A node is the experiment's root seed plus a path of worker indices:
+    SeedTreeV1(root) is the whole experiment, .worker(i) (or .spawn(n)[i]) is
+    worker i, and workers can be split further. Each component draws from its
+    own stream at a node:
+
+        seed(component) = first 8 bytes, big-endian, of
+                          blake2b("<root>/<i>/<j>/.../<component>", digest_size=8)
+
+    e.g. SeedTreeV1(123).worker(2).seed("channel") hashes "123/2/channel".
+    The mapping depends only on (root, path, component), so worker i gets the
+    same streams whether the workers run one after another or in parallel,
+    in this process or another, and adding workers doesn't change existing
+    ones' streams. Component names used by the CLIs: "agent", "channel",
+    "partner", "trainer", "actions".
+
+    seed_sequence() is the same node as a NumPy SeedSequence (root entropy,
+    path as spawn_key), so SeedTreeV1(r).worker(i).seed_sequence() equals
+    SeedSequence(r).spawn(n)[i] for NumPy-side generators.
+    """
+
+    root: int
+    path: Tuple[int, ...] = ()
+
+    def __post_init__(self) -> None:
+        if self.root < 0 or any(i < 0 for i in self.path):
+            raise ValueError(f"Seed tree root and worker indices must be >= 0, got {self.root} {self.path}")
+
+    def worker(self, index: int) -> "SeedTreeV1":
+        return SeedTreeV1(self.root, self.path + (index,))
+
+    def spawn(self, n: int) -> List["SeedTreeV1"]:
+        """The first n workers under this node."""
+        return [self.worker(i) for i in range(n)]
+
+    def seed(self, component: str) -> int:
+        """64-bit seed for component's stream at this node."""
+        key = "/".join([str(self.root), *map(str, self.path), component])
+        return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def rng(self, component: str) -> random.Random:
+        return random.Random(self.seed(component))
+
+    def seed_sequence(self):
+        """This node as a numpy.random.SeedSequence (requires numpy)."""
+        import numpy as np
+
+        return np.random.SeedSequence(self.root, spawn_key=self.path)
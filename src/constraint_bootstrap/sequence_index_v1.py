@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Set
+
+from .signatures_v1 import SIGS, Seq
+
+
+def pulse_distance(a: Seq, b: Seq) -> int:
+    """L1 distance between two equal-length pulse sequences (4x their response_error)."""
+    return sum(abs(x - y) for x, y in zip(a, b))
+
+
+class SequenceIndexV1:
+    """
+    Nearest-neighbour index over interned pulse sequences, for fuzzy handle
+    lookup on noisy channels.
+
+    One BK-tree per sequence length under pulse_distance(). Channel jitter
+    perturbs pulse values but never the length, so lengths are never mixed.
+    That also keeps the distance a true metric, which response_error (with its
+    length penalty over unaligned tails) is not. A query only visits subtrees
+    whose edge distance lies within the search radius of the query distance.
+
+    Removal is lazy: a discarded sequence stays in its tree as a routing node
+    and queries skip it until it is added again.
+    """
+
+    def __init__(self) -> None:
+        self._roots: Dict[int, list] = {} # length -> [sid, seq, {distance: child}]
+        self._nodes: Dict[int, list] = {}
+        self._live: Set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __contains__(self, sid: int) -> bool:
+        return sid in self._live
+
+    def add(self, sid: int) -> None:
+        if sid in self._nodes:
+            self._live.add(sid)
+            return
+        seq = SIGS.seq_of(sid)
+        node = [sid, seq, {}]
+        self._nodes[sid] = node
+        self._live.add(sid)
+        parent = self._roots.get(len(seq))
+        if parent is None:
+            self._roots[len(seq)] = node
+            return
+        while True:
+            d = pulse_distance(seq, parent[1])
+            child = parent[2].get(d)
+            if child is None:
+                parent[2][d] = node
+                return
+            parent = child
+
+    def discard(self, sid: int) -> None:
+        self._live.discard(sid)
+
+    def nearest(self, seq: Seq, radius: int) -> Optional[int]:
+        """
+        Id of the closest indexed sequence of the same length within radius
+        (ties go to the lowest id), or None.
+        """
+        root = self._roots.get(len(seq))
+        if root is None or radius < 0:
+            return None
+        best: Optional[int] = None
+        best_d = radius
+        stack: List[list] = [root]
+        while stack:
+            sid, other, children = stack.pop()
+            d = pulse_distance(seq, other)
+            if sid in self._live and (d < best_d or (d == best_d and (best is None or sid < best))):
+                best, best_d = sid, d
+            for edge, child in children.items():
+                # Triangle inequality: anything under this edge is at least |d - edge| away
+                if abs(d - edge) <= best_d:
+                    stack.append(child)
+        return best
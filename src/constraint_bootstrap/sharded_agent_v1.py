@@ -0,0 +1,395 @@
+from __future__ import annotations
+
+import os
+import sys
+import traceback
+from dataclasses import fields
+from multiprocessing import Pipe
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from q_ternary.lane_v1 import Decision
+from .bootstrap_agent_v1 import BootstrapAgentV1, Handle, Seq, _per_exchange
+from .metrics_v1 import StepMetrics
+from .signatures_v1 import SIGS, UNSEEN, as_sig_id, seq_key
+
+# Telemetry counters that counters() sums over the shards
+_COUNTERS = (
+    "total_predict_calls", "sum_candidate_count", "total_multi_candidate_steps",
+    "total_inhibitions", "total_evictions", "_total_handles_created",
+    "_proto_seeded_round", "_silent_to_question_nudges_round", "_question_repeats_blocked_round",
+)
+# Settings read straight off the agent (min_strength_to_predict, compete_topk, ...)
+_CONFIG_FIELDS = frozenset(f.name for f in fields(BootstrapAgentV1) if f.init)
+
+
+class _Shard:
+    """One partition's agent, plus how many global decay steps it has applied."""
+
+    def __init__(self, config: Dict[str, Any]) -> None:
+        self.agent = BootstrapAgentV1(**config)
+        self.ticks = 0
+
+    def _sync(self, tick: int) -> None:
+        # Decay once for every global decay step taken while this shard had no traffic
+        while self.ticks < tick:
+            self.agent._apply_handle_decay()
+            self.ticks += 1
+
+    def predict(self, items: List[tuple], top2: bool = False) -> list:
+        out = []
+        for step, tick, sent in items:
+            self._sync(tick)
+            self.agent._current_step = step - 1 # cooldowns count global steps
+            decision = self.agent.predict(sent)
+            out.append((decision, *self._strongest_two(sent)) if top2 else decision)
+        return out
+
+    def observe(self, items: List[tuple]) -> List[StepMetrics]:
+        out = []
+        for step, tick, sent, received, decision, (learn, update_truth, eligibility_bump) in items:
+            self._sync(tick)
+            if decision is None:
+                self.agent._current_step = step - 1
+            out.append(self.agent.observe(sent, received, learn=learn, update_truth=update_truth, eligibility_bump=eligibility_bump, decision=decision))
+            if learn:
+                self.ticks += 1 # observe() took this step's decay itself
+        return out
+
+    def counters(self, tick: int) -> Dict[str, int]:
+        self._sync(tick)
+        out = {name: getattr(self.agent, name) for name in _COUNTERS}
+        out["handles"] = len(self.agent._handles)
+        return out
+
+    def top_handles(self, tick: int, k: int) -> List[Handle]:
+        self._sync(tick)
+        return [h.clone() for h in self.agent.top_handles(k)]
+
+    def set_counter(self, name: str, value: int) -> None:
+        setattr(self.agent, name, value)
+
+    def strongest_two(self, tick: int, sent: Seq) -> Tuple[Optional[Handle], Optional[Handle]]:
+        self._sync(tick)
+        return self._strongest_two(sent)
+
+    def _strongest_two(self, sent: Seq) -> Tuple[Optional[Handle], Optional[Handle]]:
+        sent_id = SIGS.find(sent)
+        if sent_id == UNSEEN:
+            return None, None
+        h1, h2 = self.agent._handles.strongest_two(sent_id)
+        return h1 and h1.clone(), h2 and h2.clone()
+
+    def for_sent(self, tick: int, sent: Seq) -> List[Handle]:
+        self._sync(tick)
+        sent_id = SIGS.find(sent)
+        return [h.clone() for h in self.agent._handles.for_sent(sent_id)] if sent_id != UNSEEN else []
+
+    def speakable_counts(self, tick: int, truth_min: float, min_strength: float) -> Tuple[int, int]:
+        self._sync(tick)
+        return self.agent._handles.speakable_counts(truth_min, min_strength)
+
+    def strength_total(self, tick: int) -> Tuple[float, int]:
+        self._sync(tick)
+        return sum(h.strength for h in self.agent._handles), len(self.agent._handles)
+
+    def top_by_strength(self, tick: int, k: int) -> List[Handle]:
+        self._sync(tick)
+        return [h.clone() for h in self.agent._handles.top_by_strength(k)]
+
+
+def _serve(shard: _Shard, conn) -> None:
+    # Worker loop: (op, args) in, (ok, result or traceback) out, until close or EOF
+    while True:
+        try:
+            op, args = conn.recv()
+        except EOFError:
+            return
+        if op == "close":
+            return
+        try:
+            reply = (True, getattr(shard, op)(*args))
+        except BaseException:
+            reply = (False, traceback.format_exc())
+        conn.send(reply)
+
+
+def _merged_counter(name: str) -> property:
+    """A telemetry counter summed over the shards; setting it (a per-round reset) sets shard 0 and zeroes the rest."""
+    def get(self: "ShardedBootstrapAgentV1") -> int:
+        return sum(part[name] for part in self._call("counters", [(self._ticks,)] * self.shards))
+
+    def set(self: "ShardedBootstrapAgentV1", value: int) -> None:
+        self._call("set_counter", [(name, value if i == 0 else 0) for i in range(self.shards)])
+
+    return property(get, set)
+
+
+class _ShardedHandlesV1:
+    """
+    The registry lookups AggressiveTrainerV1 makes through agent._handles,
+    answered by the shard that owns the signature (aggregates by all of
+    them). Handles are copies; avg_strength() matches the single agent's to
+    rounding, and top_by_strength() breaks strength ties by shard.
+    """
+
+    def __init__(self, agent: "ShardedBootstrapAgentV1") -> None:
+        self._agent = agent
+
+    def _ask(self, op: str, sent: int | str):
+        agent = self._agent
+        seq = SIGS.seq_of(as_sig_id(sent))
+        i = agent.shard_of(seq)
+        args: List[Optional[tuple]] = [None] * agent.shards
+        args[i] = (agent._ticks, seq)
+        return agent._call(op, args)[i]
+
+    def _all(self, op: str, *args) -> list:
+        return self._agent._call(op, [(self._agent._ticks, *args)] * self._agent.shards)
+
+    def strongest_two(self, sent: int | str) -> Tuple[Optional[Handle], Optional[Handle]]:
+        return self._ask("strongest_two", sent)
+
+    def for_sent(self, sent: int | str) -> List[Handle]:
+        return self._ask("for_sent", sent)
+
+    def speakable_counts(self, truth_min: float, min_strength: float) -> Tuple[int, int]:
+        parts = self._all("speakable_counts", truth_min, min_strength)
+        return sum(p[0] for p in parts), sum(p[1] for p in parts)
+
+    def avg_strength(self) -> float:
+        parts = self._all("strength_total")
+        n = sum(p[1] for p in parts)
+        return sum(p[0] for p in parts) / n if n else 0.0
+
+    def top_by_strength(self, k: int) -> List[Handle]:
+        merged = [h for part in self._all("top_by_strength", k) for h in part]
+        return sorted(merged, key=lambda h: h.strength, reverse=True)[:k]
+
+    def __len__(self) -> int:
+        return sum(p[1] for p in self._all("strength_total"))
+
+
+class ShardedBootstrapAgentV1:
+    """
+    BootstrapAgentV1 split by sent signature across worker processes.
+
+    Handles, promotion counts and question cooldowns are all keyed by sent_id,
+    so each shard owns the signatures whose seq_key() falls on it and runs
+    a plain BootstrapAgentV1 over them. The parent keeps the state that is
+    global in the single agent: the step counter (cooldowns are measured in
+    global steps), the decay clock, and the exploration RNG and focus loop
+    behind choose_action(). A shard applies the decay steps it missed before
+    it serves its next item, so every handle decays once per global step.
+
+    Batches go out to all shards at once and run in parallel; results come
+    back in input order. For a given seed and call sequence the decisions and
+    metrics match a single BootstrapAgentV1 (and so don't depend on the shard
+    count), with two exceptions: handle ids are numbered per shard, and the
+    bounded seen_counts modes split their budget across shards. counters()
+    sums the telemetry counters. fuzzy_tolerance isn't supported: borrowing a
+    neighbour's handles would cross shards.
+
+    AggressiveTrainerV1 can drive it: _handles answers the trainer's registry
+    lookups from the shards, the per-round counters read as sums (and reset
+    through their setters), and settings read through to the config. Train
+    with predict_chunk > 0: each chunk is then one predict_batch_top2() and
+    one observe_batch() on all shards at once, where a per-sample round makes
+    several blocking calls per sample.
+
+    Workers are os.fork()ed at construction; without os.fork(), or with
+    processes=False, the shards run in this process one after another.
+    Call close() (or use it as a context manager) to stop the workers.
+    """
+
+    def __init__(self, shards: int = 2, processes: bool = True, **config) -> None:
+        if shards < 1:
+            raise ValueError(f"shards must be >= 1, got {shards}")
+        if config.get("fuzzy_tolerance", 0.0) > 0.0:
+            raise ValueError("fuzzy_tolerance isn't supported with shards: the nearest signature may live on another shard")
+        self.shards = shards
+        self.config = dict(config)
+        # Validates the config, and owns the exploration RNG and focus loop
+        self._front = BootstrapAgentV1(**config)
+        shard_config = dict(config)
+        if self._front.seen_counts_mode != "exact":
+            shard_config["seen_counts_budget"] = max(1, self._front.seen_counts_budget // shards)
+        self._current_step = 0
+        self._ticks = 0 # global decay steps so far
+        self._routes: Dict[Seq, int] = {} # sent -> shard, memoized
+        self._local: Optional[List[_Shard]] = None
+        self._conns: List[Any] = []
+        self._pids: List[int] = []
+        self._handles = _ShardedHandlesV1(self)
+        if processes and hasattr(os, "fork"):
+            for _ in range(shards):
+                self._spawn(shard_config)
+        else:
+            self._local = [_Shard(shard_config) for _ in range(shards)]
+
+    def _spawn(self, config: Dict[str, Any]) -> None:
+        # Unflushed output would otherwise be written by the worker too
+        sys.stdout.flush()
+        sys.stderr.flush()
+        conn, child_conn = Pipe()
+        pid = os.fork()
+        if pid:
+            child_conn.close()
+            self._conns.append(conn)
+            self._pids.append(pid)
+            return
+
+        conn.close()
+        for other in self._conns: # earlier workers' parent ends
+            other.close()
+        try:
+            _serve(_Shard(config), child_conn)
+        finally:
+            os._exit(0)
+
+    def close(self) -> None:
+        """Stop the worker processes (idempotent)."""
+        for conn in self._conns:
+            try:
+                conn.send(("close", ()))
+            except OSError:
+                pass
+            conn.close()
+        for pid in self._pids:
+            os.waitpid(pid, 0)
+        self._conns = []
+        self._pids = []
+
+    _total_handles_created = _merged_counter("_total_handles_created")
+    _proto_seeded_round = _merged_counter("_proto_seeded_round")
+    _silent_to_question_nudges_round = _merged_counter("_silent_to_question_nudges_round")
+    _question_repeats_blocked_round = _merged_counter("_question_repeats_blocked_round")
+
+    def __getattr__(self, name: str) -> Any:
+        # Only for attributes not found normally: settings come from the front agent, built from the same config
+        if name in _CONFIG_FIELDS and "_front" in self.__dict__:
+            return getattr(self._front, name)
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def __enter__(self) -> "ShardedBootstrapAgentV1":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _call(self, op: str, args: List[Optional[tuple]]) -> List[Any]:
+        """Run op on every shard whose args aren't None, in parallel; results by shard."""
+        if self._local is not None:
+            return [getattr(s, op)(*a) if a is not None else None for s, a in zip(self._local, args)]
+        if not self._conns:
+            raise RuntimeError("ShardedBootstrapAgentV1 is closed")
+        for conn, a in zip(self._conns, args):
+            if a is not None:
+                conn.send((op, a))
+        results: List[Any] = [None] * self.shards
+        failed = []
+        # Drain every reply before raising, so the pipes stay in step
+        for i, (conn, a) in enumerate(zip(self._conns, args)):
+            if a is None:
+                continue
+            try:
+                ok, value = conn.recv()
+            except EOFError:
+                ok, value = False, "worker exited"
+            if ok:
+                results[i] = value
+            else:
+                failed.append(f"shard {i}: {value}")
+        if failed:
+            raise RuntimeError(f"Shard {op} failed:\n" + "\n".join(failed))
+        return results
+
+    @staticmethod
+    def _gather(where: List[int], results: List[Optional[list]]) -> list:
+        its = [iter(r) if r is not None else None for r in results]
+        return [next(its[i]) for i in where]
+
+    def shard_of(self, sent: Seq) -> int:
+        """Shard that owns a sent sequence (stable across processes and runs)."""
+        i = self._routes.get(sent)
+        if i is None:
+            i = self._routes[sent] = seq_key(sent) % self.shards
+        return i
+
+    def choose_action(self, step: int) -> Seq:
+        return self._front.choose_action(step)
+
+    def predict(self, sent: Seq) -> Decision:
+        return self.predict_batch([sent])[0]
+
+    def predict_batch(self, seqs: Iterable[Seq]) -> List[Decision]:
+        """Decisions for a batch, identical to predict() on each in order."""
+        return self._predict(seqs, False)
+
+    def predict_batch_top2(self, seqs: Iterable[Seq]) -> List[Tuple[Decision, Optional[Handle], Optional[Handle]]]:
+        """predict_batch() with each signature's strongest two handles, in the same reply (see BootstrapAgentV1)."""
+        return self._predict(seqs, True)
+
+    def _predict(self, seqs: Iterable[Seq], top2: bool) -> list:
+        parts: List[Optional[list]] = [None] * self.shards
+        where = []
+        for sent in seqs:
+            self._current_step += 1
+            i = self.shard_of(sent)
+            where.append(i)
+            if parts[i] is None:
+                parts[i] = []
+            parts[i].append((self._current_step, self._ticks, sent))
+        results = self._call("predict", [(p, top2) if p is not None else None for p in parts])
+        return self._gather(where, results)
+
+    def observe(self, sent: Seq, received: Seq, learn: bool = True, update_truth: bool = True, eligibility_bump: float = 0.0, decision: Optional[Decision] = None) -> StepMetrics:
+        return self.observe_batch([sent], [received], learn=learn, update_truth=update_truth, eligibility_bump=eligibility_bump, decisions=[decision])[0]
+
+    def observe_batch(self, sent: Sequence[Seq], received: Sequence[Seq], learn: bool = True, update_truth: bool = True, eligibility_bump: float = 0.0, decisions: Optional[Sequence[Optional[Decision]]] = None, flags: Optional[Sequence[Tuple[bool, bool, float]]] = None) -> List[StepMetrics]:
+        """
+        observe() over a batch of exchanges, in order. decisions[i] and
+        flags[i], when given, are as in BootstrapAgentV1.observe_batch.
+        """
+        if len(sent) != len(received):
+            raise ValueError(f"observe_batch needs one response per sent sequence ({len(sent)} != {len(received)})")
+        decisions, flags = _per_exchange(len(sent), decisions, flags, (learn, update_truth, eligibility_bump))
+        parts: List[Optional[list]] = [None] * self.shards
+        where = []
+        for s, r, d, f in zip(sent, received, decisions, flags):
+            if d is None:
+                self._current_step += 1 # observe() predicts again
+            i = self.shard_of(s)
+            where.append(i)
+            if parts[i] is None:
+                parts[i] = []
+            parts[i].append((self._current_step, self._ticks, s, r, d, f))
+            if f[0]:
+                self._ticks += 1
+        results = self._call("observe", [(p,) if p is not None else None for p in parts])
+        metrics = self._gather(where, results)
+        # Surprise locks the (global) focus loop, as in BootstrapAgentV1.observe
+        front = self._front
+        for s, m, f in zip(sent, metrics, flags):
+            if f[0] and m.error >= front.surprise_threshold:
+                front._focus_seq = s
+                front._focus_left = front.focus_repeats
+        return metrics
+
+    def _apply_handle_decay(self) -> None:
+        """One global decay step; shards apply it before they next read their handles."""
+        self._ticks += 1
+
+    def counters(self) -> Dict[str, int]:
+        """Telemetry counters and handle count, summed over the shards."""
+        merged: Dict[str, int] = {}
+        for part in self._call("counters", [(self._ticks,)] * self.shards):
+            for name, value in part.items():
+                merged[name] = merged.get(name, 0) + value
+        return merged
+
+    def top_handles(self, k: int) -> List[Handle]:
+        """Strongest k handles over all shards (copies; ids are per shard)."""
+        parts = self._call("top_handles", [(self._ticks, k)] * self.shards)
+        merged = [h for part in parts for h in part]
+        merged.sort(key=lambda h: (h.strength, h.hits), reverse=True)
+        return merged[:k]
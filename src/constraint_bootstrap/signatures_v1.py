@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+Pulse = int
+Seq = Tuple[Pulse, ...]
+
+_MERSENNE_61 = (1 << 61) - 1
+
+# find()'s answer for a sequence that was never interned
+UNSEEN = -1
+
+
+def seq_key(seq: Seq) -> int:
+    """61-bit fingerprint of a pulse sequence, stable across processes and runs."""
+    k = len(seq)
+    for p in seq:
+        k = (k * 1000003 + p + 1) % _MERSENNE_61
+    return k
+
+
+class SignatureTableV1:
+    """
+    Interns pulse tuples as dense integer ids.
+
+    Internals (handle indexes, correlation counts, cooldowns) work on ids.
+    The comma-joined string form ("4,6", "0" for empty) is rendered on demand
+    and cached, for logs/JSON and for callers that still pass strings.
+    Id 0 is always the empty sequence. Ids depend on interning order, so
+    anything that must mean the same thing in another process (hashes that
+    get persisted) goes through key_of() instead.
+    """
+
+    def __init__(self) -> None:
+        self._ids: Dict[Seq, int] = {(): 0}
+        self._seqs: List[Seq] = [()]
+        self._strs: List[Optional[str]] = ["0"]
+        self._str_ids: Dict[str, int] = {"0": 0}
+        self._keys: List[Optional[int]] = [0]
+
+    def __len__(self) -> int:
+        return len(self._seqs)
+
+    def id_of(self, seq: Seq) -> int:
+        sid = self._ids.get(seq)
+        if sid is None:
+            sid = len(self._seqs)
+            self._ids[seq] = sid
+            self._seqs.append(seq)
+            self._strs.append(None)
+            self._keys.append(None)
+        return sid
+
+    def find(self, seq: Seq) -> int:
+        """Id of seq if it is already interned, else UNSEEN (never interns; nothing is kept)."""
+        return self._ids.get(seq, UNSEEN)
+
+    def seq_of(self, sid: int) -> Seq:
+        return self._seqs[sid]
+
+    def str_of(self, sid: int) -> str:
+        s = self._strs[sid]
+        if s is None:
+            s = self._strs[sid] = ",".join(map(str, self._seqs[sid]))
+        return s
+
+    def key_of(self, sid: int) -> int:
+        """seq_key() of the sequence behind sid (cached)."""
+        k = self._keys[sid]
+        if k is None:
+            k = self._keys[sid] = seq_key(self._seqs[sid])
+        return k
+
+    def id_of_str(self, sig: str) -> int:
+        """Id for a comma-joined signature string ("0" or "" is the empty sequence)."""
+        sid = self._str_ids.get(sig)
+        if sid is None:
+            seq = tuple(int(x) for x in sig.split(",")) if sig and sig != "0" else ()
+            sid = self._str_ids[sig] = self.id_of(seq)
+        return sid
+
+
+# Process-wide table: handles built outside an agent (tests, tools) share ids with it
+SIGS = SignatureTableV1()
+
+
+def as_sig_id(sig: int | str) -> int:
+    """Accept a signature id or its string form."""
+    return sig if type(sig) is int else SIGS.id_of_str(sig)
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import gc
+import os
+import pickle
+import sys
+import traceback
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from .bootstrap_agent_v1 import BootstrapAgentV1
+
+Config = Dict[str, Any]
+
+
+def fork_map(fn: Callable[[BootstrapAgentV1], Any], agent: BootstrapAgentV1, configs: Iterable[Config], processes: Optional[int] = None) -> List[Any]:
+    """
+    [fn(agent.fork(**cfg)) for cfg in configs], branching every configuration
+    from one warmed-up agent.
+
+    Where os.fork() exists, each configuration runs in a forked child process
+    that applies its overrides to its own copy of the agent. Nothing is
+    copied up front: the OS shares the parent's memory copy-on-write and a
+    child only duplicates the pages it writes to. Up to `processes`
+    (default: CPU count) children run at once. fn's return value comes back
+    pickled; an exception in a child is re-raised here as RuntimeError with
+    the child's traceback. Without os.fork() this runs the in-process forks
+    one after another.
+    """
+    configs = list(configs)
+    if not hasattr(os, "fork"):
+        return [fn(agent.fork(**cfg)) for cfg in configs]
+
+    processes = max(1, processes or os.cpu_count() or 1)
+    results: List[Any] = [None] * len(configs)
+    running: List[tuple] = [] # (index, pid, read_fd), oldest first
+    # Objects in the parent are never collected by a child, and freezing keeps
+    # the child's collector from writing to (and so un-sharing) their pages
+    gc.collect()
+    gc.freeze()
+    try:
+        for i, cfg in enumerate(configs):
+            if len(running) >= processes:
+                _reap(running.pop(0), results)
+            running.append((i, *_spawn(fn, agent, cfg)))
+        while running:
+            _reap(running.pop(0), results)
+    finally:
+        for _, pid, fd in running: # only left over if _reap raised
+            os.close(fd)
+            os.waitpid(pid, 0)
+        gc.unfreeze()
+    return results
+
+
+def _spawn(fn: Callable[[BootstrapAgentV1], Any], agent: BootstrapAgentV1, cfg: Config) -> tuple:
+    # Unflushed output would otherwise be written once by every child too
+    sys.stdout.flush()
+    sys.stderr.flush()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid:
+        os.close(write_fd)
+        return pid, read_fd
+
+    os.close(read_fd)
+    try:
+        agent._configure(cfg)
+        payload = pickle.dumps((True, fn(agent)), protocol=pickle.HIGHEST_PROTOCOL)
+    except BaseException:
+        payload = pickle.dumps((False, traceback.format_exc()))
+    with os.fdopen(write_fd, "wb") as out:
+        out.write(payload)
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(0)
+
+
+def _reap(child: tuple, results: List[Any]) -> None:
+    # Read to EOF before waiting, so a child never blocks on a full pipe
+    i, pid, read_fd = child
+    with os.fdopen(read_fd, "rb") as src:
+        payload = src.read()
+    _, status = os.waitpid(pid, 0)
+    if not payload:
+        raise RuntimeError(f"Sweep child for config #{i} exited without a result (status {status})")
+    ok, value = pickle.loads(payload)
+    if not ok:
+        raise RuntimeError(f"Sweep config #{i} failed in its child process:\n{value}")
+    results[i] = value
@@ -14,3 +14,41 @@ class Decision:
     act: Optional[Tuple[int, ...]] = None
     question: Optional[str] = None
     meta: dict = field(default_factory=dict)
+
+class LazyDecision(Decision):
+    """
+    A Decision that carries only lane/act plus a template id and its
+    arguments; question text and meta dict are built by render(template, args)
+    on first access (then cached, so meta mutations stick like on Decision).
+    Used at the agent's minimal telemetry level, where most callers never
+    read either.
+    """
+
+    def __init__(self, lane: Lane, act: Optional[Tuple[int, ...]], template: str, args: tuple, render) -> None:
+        object.__setattr__(self, "lane", lane)
+        object.__setattr__(self, "act", act)
+        object.__setattr__(self, "template", template)
+        object.__setattr__(self, "args", args)
+        object.__setattr__(self, "_render", render)
+        object.__setattr__(self, "_rendered", None)
+
+    def _materialize(self) -> Tuple[Optional[str], dict]:
+        if self._rendered is None:
+            object.__setattr__(self, "_rendered", self._render(self.template, self.args))
+        return self._rendered
+
+    @property
+    def question(self) -> Optional[str]:
+        return self._materialize()[0]
+
+    @property
+    def meta(self) -> dict:
+        return self._materialize()[1]
+
+    def __eq__(self, other) -> bool:
+        # Equal to the eager Decision it stands for
+        if not isinstance(other, Decision):
+            return NotImplemented
+        return (self.lane, self.act, self.question, self.meta) == (other.lane, other.act, other.question, other.meta)
+
+    __hash__ = None
@@ -1,26 +1,87 @@
 import argparse
 import sys
+from datetime import datetime
 from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.seeds_v1 import SeedTreeV1
 from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+from q_ternary.training.drift_detectors_v1 import detector_params
+from q_ternary.training.history_sink_v1 import make_history
 
-def train_aggressive(args):
-    agent = BootstrapAgentV1(
-        seed=args.seed,
-        silence_penalty=args.silence_penalty,
-        min_strength_to_predict=args.min_strength,
-        promote_threshold=args.promote_threshold,
-        conflict_margin=args.conflict_margin,
-        eligibility_min_to_consider=args.eligibility_min_to_consider,
-        truth_min_to_speak=args.truth_min_to_speak,
-        seed_proto_handles=args.seed_proto_handles,
-        seed_eligibility=args.seed_eligibility,
-        question_cooldown_n=args.question_cooldown_n,
-        question_eligibility_bump=args.question_eligibility_bump
-    )
-    trainer = AggressiveTrainerV1(agent, partner_name=args.partner, seed=args.seed)
+# CLI dest -> BootstrapAgentV1 field. With --resume the agent's config comes
+# from the checkpoint, so these flags are ignored and the metadata reads the agent
+_AGENT_FLAGS = {
+    "seed": "seed",
+    "silence_penalty": "silence_penalty",
+    "min_strength": "min_strength_to_predict",
+    "promote_threshold": "promote_threshold",
+    "conflict_margin": "conflict_margin",
+    "eligibility_min_to_consider": "eligibility_min_to_consider",
+    "truth_min_to_speak": "truth_min_to_speak",
+    "seed_proto_handles": "seed_proto_handles",
+    "seed_eligibility": "seed_eligibility",
+    "question_cooldown_n": "question_cooldown_n",
+    "question_eligibility_bump": "question_eligibility_bump",
+    "seen_counts": "seen_counts_mode",
+    "seen_counts_budget": "seen_counts_budget",
+}
+# Trainer flags the checkpoint also overrides
+_TRAINER_FLAGS = ("partner", "worker", "drill_capacity", "drift_detector", "drift_param")
+
+def _ignored_on_resume(args, defaults):
+    # Flags given a non-default value, which --resume doesn't apply
+    return [f"--{dest.replace('_', '-')}" for dest, default in defaults.items() if getattr(args, dest) != default]
+
+def _drift_params(pairs):
+    # NAME=VALUE pairs from --drift-param; values are ints or floats
+    params = {}
+    for pair in pairs or []:
+        name, _, value = pair.partition("=")
+        params[name.strip().replace("-", "_")] = int(value) if value.strip().lstrip("-").isdigit() else float(value)
+    return params
+
+def train_aggressive(args, defaults=None):
+    """defaults: parser defaults of the _AGENT_FLAGS / _TRAINER_FLAGS dests, to warn about flags --resume ignores."""
+    if args.resume:
+        # Agent config and stream state come from the checkpoint; agent flags are ignored
+        trainer = AggressiveTrainerV1.from_checkpoint(args.resume)
+        print(f"Resumed from {args.resume} ({len(trainer.agent._handles)} handles)")
+        ignored = _ignored_on_resume(args, defaults or {})
+        if ignored:
+            print(f"Warning: {', '.join(ignored)} ignored with --resume; the checkpoint's settings are used.")
+    else:
+        # --worker N: this run is worker N of experiment --seed, with its own agent/trainer/partner streams
+        seeds = SeedTreeV1(args.seed).worker(args.worker) if args.worker is not None else None
+        agent = BootstrapAgentV1(
+            seed=seeds.seed("agent") if seeds else args.seed,
+            silence_penalty=args.silence_penalty,
+            min_strength_to_predict=args.min_strength,
+            promote_threshold=args.promote_threshold,
+            conflict_margin=args.conflict_margin,
+            eligibility_min_to_consider=args.eligibility_min_to_consider,
+            truth_min_to_speak=args.truth_min_to_speak,
+            seed_proto_handles=args.seed_proto_handles,
+            seed_eligibility=args.seed_eligibility,
+            question_cooldown_n=args.question_cooldown_n,
+            question_eligibility_bump=args.question_eligibility_bump,
+            seen_counts_mode=args.seen_counts,
+            seen_counts_budget=args.seen_counts_budget
+        )
+        if seeds:
+            trainer = AggressiveTrainerV1(agent, partner_name=args.partner, seed=seeds.seed("trainer"), partner_seed=seeds.seed("partner"), drill_capacity=args.drill_capacity, drift_detector=args.drift_detector, drift_params=_drift_params(args.drift_param))
+        else:
+            trainer = AggressiveTrainerV1(agent, partner_name=args.partner, seed=args.seed, drill_capacity=args.drill_capacity, drift_detector=args.drift_detector, drift_params=_drift_params(args.drift_param))
     
+    if args.history != "memory":
+        path = args.history_path
+        if args.history == "spill" and not path:
+            path = f"data/training_runs/history_{datetime.now():%Y%m%d_%H%M%S}.{'jsonl' if args.history_format == 'jsonl' else 'bin'}"
+        trainer.history = make_history(args.history, size=args.history_size, path=path, fmt=args.history_format)
+
+    # The report is written as results come in; save_run() adds the summary
+    trainer.start_run()
+
     print(f"Starting Aggressive Training Sandbox (v1.2 - Truth/Eligibility Split)...")
-    print(f"Partner: {args.partner} | Batch: {args.batch} | Rounds: {args.rounds}")
+    print(f"Partner: {trainer.partner_name} | Batch: {args.batch} | Rounds: {args.rounds}")
     print(f"Utility Credit: {args.question_credit} | Conflict Margin: {args.conflict_margin}")
     print(f"Eligibility Min: {args.eligibility_min_to_consider} | Truth Min to Speak: {args.truth_min_to_speak}")
     print("-" * 65)
@@ -33,7 +94,8 @@ def train_aggressive(args):
             question_credit=args.question_credit,
             question_preferred=args.question_preferred,
             question_budget_per_round=args.question_budget_per_round,
-            probe_after_budget=args.probe_after_budget
+            probe_after_budget=args.probe_after_budget,
+            predict_chunk=args.predict_chunk
         )
         
         print(f"Round {r:02d}: Acc={metrics['accuracy']:.2%} | SP={metrics['speak_rate']:.2%} | QU={metrics['question_rate']:.2%} | Prec={metrics['precision']:.2%} | Util={metrics['utility']:.2%}")
@@ -48,7 +110,9 @@ def train_aggressive(args):
         if metrics['top_errors']:
             err_str = ", ".join([f"{cat}: {count}" for cat, count in metrics['top_errors']])
             print(f"          Top SPEAK Errors: {err_str}")
-        print(f"          Drill Queue: {metrics['drill_queue_size']}")
+        print(f"          Drill Queue: {metrics['drill_queue_size']} | Merged={metrics['drills_merged']} | Dropped={metrics['drills_dropped']}")
+        if metrics['drift_triggers'] or metrics['drift_detection_delay'] is not None:
+            print(f"          Drift ({trainer.drift_detector.kind}): Triggers={metrics['drift_triggers']} | Delay={metrics['drift_detection_delay']}")
 
     metadata = {
         "batch": args.batch,
@@ -59,19 +123,36 @@ def train_aggressive(args):
         "question_preferred": args.question_preferred,
         "min_strength": args.min_strength,
         "promote_threshold": args.promote_threshold,
+        "seen_counts": args.seen_counts,
+        "seen_counts_budget": args.seen_counts_budget,
+        "predict_chunk": args.predict_chunk,
+        "drill_capacity": trainer.drill_queue.capacity,
+        "history": args.history,
+        "drift_detector": trainer.drift_detector.kind,
+        "drift_params": detector_params(trainer.drift_detector),
         "eligibility_min_to_consider": args.eligibility_min_to_consider,
         "truth_min_to_speak": args.truth_min_to_speak,
-        "partner": args.partner,
+        "partner": trainer.partner_name,
         "seed": args.seed,
+        "worker": args.worker,
         "silence_penalty": args.silence_penalty,
         "seed_proto_handles": args.seed_proto_handles,
         "seed_eligibility": args.seed_eligibility,
         "question_cooldown_n": args.question_cooldown_n,
         "question_eligibility_bump": args.question_eligibility_bump,
         "question_budget_per_round": args.question_budget_per_round,
-        "probe_after_budget": args.probe_after_budget
+        "probe_after_budget": args.probe_after_budget,
+        "resume": args.resume
     }
+    if args.resume:
+        # Describe the agent that actually ran, not the unused flags
+        metadata.update({dest: getattr(trainer.agent, name) for dest, name in _AGENT_FLAGS.items()})
+        metadata["worker"] = None
     filename = trainer.save_run(metadata)
+    trainer.history.close()
+    if args.save_checkpoint:
+        size = trainer.save_checkpoint(args.save_checkpoint)
+        print(f"Checkpoint ({size / 1024:.0f} KiB) saved to {args.save_checkpoint}")
     print("-" * 60)
     print(f"Training complete. Metrics saved to {filename}")
 
@@ -89,12 +170,22 @@ def main():
     train_parser.add_argument("--question-preferred", type=bool, default=True)
     train_parser.add_argument("--min-strength", type=float, default=0.35)
     train_parser.add_argument("--promote-threshold", type=int, default=4)
+    train_parser.add_argument("--seen-counts", default="exact", help="exact | lru | sketch (bounded promotion counting)")
+    train_parser.add_argument("--seen-counts-budget", type=int, default=1 << 20, help="Memory budget in bytes for lru/sketch")
     train_parser.add_argument("--eligibility-min-to-consider", type=float, default=0.25)
     train_parser.add_argument("--truth-min-to-speak", type=float, default=0.35)
     train_parser.add_argument("--drill-n", type=int, default=3)
+    train_parser.add_argument("--drift-detector", default="rolling", help="rolling | page_hinkley | cusum | adwin (drift_detectors_v1)")
+    train_parser.add_argument("--drift-param", action="append", metavar="NAME=VALUE", help="Drift detector parameter, e.g. window=50 or threshold=0.6 (repeatable)")
+    train_parser.add_argument("--history", default="memory", help="memory | ring (last --history-size results) | spill (append results to --history-path as they happen)")
+    train_parser.add_argument("--history-size", type=int, default=10000)
+    train_parser.add_argument("--history-path", default=None, help="Spill file (default: data/training_runs/history_<time>.jsonl|bin)")
+    train_parser.add_argument("--history-format", default="jsonl", help="jsonl | binary (pickled rows) for --history spill")
+    train_parser.add_argument("--drill-capacity", type=int, default=4096, help="Max queued drills; lowest-priority ones are dropped beyond it")
     train_parser.add_argument("--silence-penalty", type=float, default=0.0)
     train_parser.add_argument("--partner", default="mixed")
     train_parser.add_argument("--seed", type=int, default=123)
+    train_parser.add_argument("--worker", type=int, default=None, help="Run as worker N of the experiment: per-component seeds derived from --seed (seeds_v1.SeedTreeV1)")
     train_parser.add_argument("--seed-proto-handles", action="store_true", default=True)
     train_parser.add_argument("--no-seed-proto-handles", action="store_false", dest="seed_proto_handles")
     train_parser.add_argument("--seed-eligibility", type=float, default=0.25)
@@ -102,11 +193,14 @@ def main():
     train_parser.add_argument("--question-eligibility-bump", type=float, default=0.0)
     train_parser.add_argument("--question-budget-per-round", type=int, default=0)
     train_parser.add_argument("--probe-after-budget", action="store_true", default=False)
+    train_parser.add_argument("--resume", default=None, help="Continue from a checkpoint written by --save-checkpoint")
+    train_parser.add_argument("--save-checkpoint", default=None, help="Write a binary agent+trainer checkpoint here after the last round")
+    train_parser.add_argument("--predict-chunk", type=int, default=0, help="Decide, score and update N samples at a time (one predict_batch_top2 and one observe_batch per chunk; 0 = per sample)")
 
     args = parser.parse_args()
 
     if args.command == "train_aggressive":
-        train_aggressive(args)
+        train_aggressive(args, {dest: train_parser.get_default(dest) for dest in (*_AGENT_FLAGS, *_TRAINER_FLAGS)})
     else:
         parser.print_help()
 
@@ -1,8 +1,9 @@
 import argparse
-import json
 import sys
 from pathlib import Path
 
+from q_ternary.training.run_writer_v1 import load_run
+
 def print_summary(data):
     metadata = data.get("metadata", {})
     summary = data.get("summary", {})
@@ -44,7 +45,7 @@ def print_summary(data):
     print("========================================================================")
 
 def main():
-    parser = argparse.ArgumentParser(description="Summarize q_ternary training JSON results.")
+    parser = argparse.ArgumentParser(description="Summarize q_ternary training run reports (.jsonl or .json).")
     parser.add_argument("input_file", nargs="?", help="Input JSON file path (positional).")
     parser.add_argument("--in", dest="in_flag", help="Input JSON file path (flag).")
     args = parser.parse_args()
@@ -63,10 +64,11 @@ def main():
         return 1
         
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        # Streamed .jsonl reports and older single-JSON ones
+        data = load_run(str(path))
         print_summary(data)
     except Exception as e:
-        print(f"Error parsing JSON: {e}")
+        print(f"Error parsing run report: {e}")
         return 1
     return 0
 
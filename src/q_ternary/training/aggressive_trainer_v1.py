@@ -1,11 +1,10 @@
-import json
-import os
 import random
-from datetime import datetime
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import List, Tuple, Dict, Any, Optional
 
-from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, _sig, Seq
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle, Seq, _sig
+from constraint_bootstrap.checkpoint_v1 import load_checkpoint, rng_state, save_checkpoint, set_rng_state
+from constraint_bootstrap.signatures_v1 import SIGS
 from constraint_bootstrap.alien_partners_v1 import make_partner
 from q_ternary.lane_v1 import Lane, Decision
 from q_ternary.training.clarify_templates_v1 import (
@@ -14,14 +13,36 @@ from q_ternary.training.clarify_templates_v1 import (
     get_conflict_question, 
     format_act
 )
+from .drill_scheduler_v1 import DrillSchedulerV1, drill_priority
+from .history_sink_v1 import SUMMARY_TAIL, HistoryV1, history_row
+from .run_writer_v1 import RunWriterV1, new_run_path
+from .drift_detectors_v1 import RollingRateDetectorV1, detector_params, detector_state, load_detector_state, make_drift_detector
 from .error_taxonomy_v1 import classify_error, ErrorCategory
+try:
+    from .error_taxonomy_batch_v1 import ERROR_CATEGORIES, score_batch
+except ImportError: # NumPy is optional; chunks are then scored sample by sample
+    score_batch = None
+
+def _pred_sig(decision: Decision) -> Seq:
+    # What response_error() scores a decision as: its act, (999,) for a question, () otherwise
+    return decision.act if decision.lane == Lane.SPEAK else (999,) if decision.lane == Lane.QUESTION else ()
 
 @dataclass
 class TrainingSample:
     sent: Seq
-    sent_sig: str
+    sent_sig: str = ""
     synthetic_drill: bool = False
 
+    def __post_init__(self):
+        if not self.sent_sig:
+            self.sent_sig = _sig(self.sent)
+
+    @property
+    def sent_id(self) -> int:
+        # Looked up, never interned: the agent interns what it keeps handles for, and
+        # bounded seen_counts modes rely on nothing else growing SIGS
+        return SIGS.find(self.sent)
+
 @dataclass
 class TrainingResult:
     sample: TrainingSample
@@ -34,27 +55,102 @@ class TrainingResult:
     oracle_ambiguous: bool = False
     is_trainable_oracle: bool = False
     update_type: Optional[str] = None
+    # (hid, eligibility, truth, strength) of the signature's strongest two handles when the decision was taken
+    top_candidates: Tuple[Tuple[str, float, float, float], ...] = ()
+    partner_step: Optional[int] = None # the partner's step for this sample, if it counts them (mixed_shift)
 
 class AggressiveTrainerV1:
-    def __init__(self, agent: BootstrapAgentV1, partner_name: str = "mixed", seed: int = 42):
+    def __init__(self, agent: BootstrapAgentV1, partner_name: str = "mixed", seed: int = 42, partner_seed: int | None = None, drill_capacity: int = 4096, drift_detector: str = "rolling", drift_params: Optional[Dict[str, Any]] = None, history: Optional[HistoryV1] = None):
         self.agent = agent
-        self.partner = make_partner(partner_name)
+        self.partner_name = partner_name
+        self.partner = make_partner(partner_name, seed=partner_seed)
         self.rng = random.Random(seed)
-        self.drill_queue: List[TrainingSample] = []
-        self.history: List[TrainingResult] = []
+        self.drill_queue = DrillSchedulerV1(capacity=drill_capacity)
+        # All results in memory by default; see history_sink_v1 for ring / spill-to-disk sinks
+        self.history: HistoryV1 = history if history is not None else HistoryV1()
+        # Open between start_run() and save_run(): results are written to the report as they are final
+        self.run_writer: Optional[RunWriterV1] = None
         
-        # Drift Detection (Training-only)
-        self.drift_window_size = 50
-        self.drift_outcomes = [] # List of bool (True if miss)
+        # Drift Detection (Training-only); see drift_detectors_v1
+        self.drift_detector = make_drift_detector(drift_detector, **(drift_params or {}))
+        self.drift_detection_delay: Optional[int] = None # partner steps from a rule shift to the first trigger
         self.drift_probe_burst_steps_left = 0
         self.drift_triggers = 0
         self.drift_probe_steps_total = 0
 
+    def save_checkpoint(self, path: str) -> int:
+        """
+        Binary checkpoint of the agent plus this trainer's stream state (RNG,
+        partner, drill queue, drift window), so a run can resume mid-stream.
+        history is not included; save_run() writes it.
+        """
+        return save_checkpoint(path, self.agent, trainer_state=self._checkpoint_state())
+
+    @classmethod
+    def from_checkpoint(cls, path: str) -> "AggressiveTrainerV1":
+        """Resume a trainer (and its agent) written by save_checkpoint()."""
+        agent, state = load_checkpoint(path)
+        if state is None:
+            raise ValueError(f"Checkpoint has no trainer state: {path}")
+        det = state["drift_detector"]
+        trainer = cls(agent, partner_name=state["partner_name"], drill_capacity=state["drill_capacity"], drift_detector=det["kind"], drift_params=det["params"])
+        load_detector_state(trainer.drift_detector, det["state"])
+        set_rng_state(trainer.rng, state["rng"])
+        for name, value in state["partner"].items():
+            attr = getattr(trainer.partner, name)
+            if isinstance(attr, random.Random):
+                set_rng_state(attr, value)
+            else:
+                setattr(trainer.partner, name, value)
+        # Pushed in pop order, so ties keep their order
+        for sent, drill, priority in state["drill_queue"]:
+            trainer.drill_queue.push(TrainingSample(sent=tuple(sent), synthetic_drill=drill), priority)
+        trainer.drill_queue.merged = state["drills_merged"]
+        trainer.drill_queue.dropped = state["drills_dropped"]
+        for name in ("drift_detection_delay", "drift_probe_burst_steps_left", "drift_triggers", "drift_probe_steps_total"):
+            setattr(trainer, name, state[name])
+        return trainer
+
+    def _checkpoint_state(self) -> Dict[str, Any]:
+        partner = {}
+        for name, value in vars(self.partner).items():
+            # Step counters, seasons and partner RNGs; sub-partners are stateless
+            if isinstance(value, random.Random):
+                partner[name] = rng_state(value)
+            elif isinstance(value, (int, float, str)) or value is None:
+                partner[name] = value
+        return {
+            "partner_name": self.partner_name,
+            "partner": partner,
+            "rng": rng_state(self.rng),
+            "drill_queue": [(list(s.sent), s.synthetic_drill, p) for s, p in self.drill_queue.items()],
+            "drill_capacity": self.drill_queue.capacity,
+            "drills_merged": self.drill_queue.merged,
+            "drills_dropped": self.drill_queue.dropped,
+            "drift_detector": {
+                "kind": self.drift_detector.kind,
+                "params": detector_params(self.drift_detector),
+                "state": detector_state(self.drift_detector),
+            },
+            "drift_detection_delay": self.drift_detection_delay,
+            "drift_probe_burst_steps_left": self.drift_probe_burst_steps_left,
+            "drift_triggers": self.drift_triggers,
+            "drift_probe_steps_total": self.drift_probe_steps_total,
+        }
+
+    def _note_detection_delay(self, step: int) -> None:
+        # First trigger at or after a mixed_shift partner's rule switch, in partner steps (step: this sample's)
+        if self.drift_detection_delay is not None or "mixed_shift" not in self.partner.name:
+            return
+        split_point = getattr(self.partner, "split_point", 500)
+        if step >= split_point:
+            self.drift_detection_delay = step - split_point
+
     def generate_batch(self, size: int) -> List[TrainingSample]:
         batch = []
-        # First pull from drill queue
+        # First pull from drill queue, most informative first
         while self.drill_queue and len(batch) < size:
-            batch.append(self.drill_queue.pop(0))
+            batch.append(self.drill_queue.pop())
         
         # Then generate new ones
         while len(batch) < size:
@@ -64,48 +160,90 @@ class AggressiveTrainerV1:
             else:
                 n = self.rng.randint(1, 10)
                 sent = tuple(self.rng.randint(1, 12) for _ in range(n))
-            batch.append(TrainingSample(sent=sent, sent_sig=_sig(sent)))
+            batch.append(TrainingSample(sent=sent))
         
         return batch
 
-    def compute_uncertainty(self, sent: Seq) -> float:
-        sent_s = _sig(sent)
-        # Use strongest first for consistency with predict
-        candidates = [h for h in self.agent.handles if h.sent_sig == sent_s and h.strength >= self.agent.min_strength_to_predict]
-        if not candidates:
+    def compute_uncertainty(self, sent: Seq, sent_id: Optional[int] = None) -> float:
+        """
+        Strength margin between the two strongest handles for sent that clear
+        min_strength_to_predict (1.0 if none does). Reads the registry's per-signature
+        top-2, which predict() has usually just cached, so the cost doesn't grow
+        with the registry.
+        """
+        if sent_id is None:
+            sent_id = SIGS.find(sent)
+        return self._margin(*self.agent._handles.strongest_two(sent_id))
+
+    def _margin(self, h1: Optional[Handle], h2: Optional[Handle]) -> float:
+        # compute_uncertainty() for a signature's strongest two handles
+        min_strength = self.agent.min_strength_to_predict
+        if h1 is None or h1.strength < min_strength:
             return 1.0 # Max uncertainty if no matches
-        
-        # Respect topk
-        if self.agent.compete_topk > 0:
-            candidates = candidates[:self.agent.compete_topk]
-            
-        s1 = candidates[0].strength
-        s2 = candidates[1].strength if len(candidates) > 1 else 0.0
-        
+
+        s1 = h1.strength
+        # Respect topk: with compete_topk == 1 the runner-up never competes
+        s2 = h2.strength if h2 is not None and h2.strength >= min_strength and self.agent.compete_topk != 1 else 0.0
+
         # We ensure uncertainty is a positive value reflecting the margin
         # Smaller margin = Higher uncertainty
         margin = s1 - s2
         return margin
 
-    def run_inference(self, sample: TrainingSample) -> TrainingResult:
-        decision = self.agent.predict(sample.sent)
+    def run_inference(self, sample: TrainingSample, decision: Optional[Decision] = None) -> TrainingResult:
+        if decision is None:
+            decision = self.agent.predict(sample.sent)
         actual = self.partner.respond(sample.sent)
         
         from constraint_bootstrap.metrics_v1 import response_error
         # response_error still uses raw pred for now, but we'll adapt
-        pred_sig = decision.act if decision.lane == Lane.SPEAK else (999,) if decision.lane == Lane.QUESTION else ()
+        pred_sig = _pred_sig(decision)
         err = response_error(pred_sig, actual)
-        uncertainty = self.compute_uncertainty(sample.sent)
-        
-        classification = classify_error(_sig(pred_sig), _sig(actual), err)
+        uncertainty = self.compute_uncertainty(sample.sent, sample.sent_id)
+        # Same pair compute_uncertainty() just read, snapshotted before this sample's update
+        top2 = self.agent._handles.strongest_two(sample.sent_id)
         
+        classification = classify_error(pred_sig, actual, err)
+        return self._result(sample, decision, actual, err, uncertainty, classification.category, top2, self._partner_step())
+
+    def run_inference_batch(self, samples: List[TrainingSample], decided: List[tuple]) -> List[TrainingResult]:
+        """
+        run_inference() for a chunk decided by agent.predict_batch_top2(): the
+        partner answers every sample in order, then the chunk is scored in one
+        score_batch() call (sample by sample without NumPy). Uncertainty and
+        top_candidates come from the decision-time pairs in decided.
+        """
+        actuals = []
+        steps = []
+        for sample in samples:
+            actuals.append(self.partner.respond(sample.sent))
+            steps.append(self._partner_step())
+        preds = [_pred_sig(d) for d, _, _ in decided]
+        if score_batch is not None:
+            err, codes = score_batch(preds, actuals)
+            errors = err.tolist()
+            categories = [ERROR_CATEGORIES[c] for c in codes.tolist()]
+        else:
+            from constraint_bootstrap.metrics_v1 import response_error
+            errors = [response_error(p, a) for p, a in zip(preds, actuals)]
+            categories = [classify_error(p, a, e).category for p, a, e in zip(preds, actuals, errors)]
+        return [
+            self._result(sample, decision, actual, e, self._margin(h1, h2), category, (h1, h2), step)
+            for sample, (decision, h1, h2), actual, e, category, step in zip(samples, decided, actuals, errors, categories, steps)
+        ]
+
+    def _partner_step(self) -> Optional[int]:
+        # The sample the partner just answered, for partners that count steps (step_count was already incremented in respond())
+        step_count = getattr(self.partner, "step_count", None)
+        return step_count - 1 if step_count is not None else None
+
+    def _result(self, sample: TrainingSample, decision: Decision, actual: Seq, err: float, uncertainty: float, category: ErrorCategory, top2: tuple, partner_step: Optional[int]) -> TrainingResult:
         # Check if oracle has multi-label (ambiguous)
         oracle_ambiguous = len(actual) > 1
         
         # Define is_trainable_oracle = oracle_act is single-label AND representable.
-        # If oracle has comma (e.g. "5,7") => treat as ambiguous => QUESTION/NA; no accuracy; NO core update.
-        oracle_sig = _sig(actual)
-        is_trainable_oracle = (len(actual) == 1) and ("," not in oracle_sig)
+        # If oracle is multi-pulse (e.g. "5,7") => treat as ambiguous => QUESTION/NA; no accuracy; NO core update.
+        is_trainable_oracle = len(actual) == 1
 
         return TrainingResult(
             sample=sample,
@@ -113,11 +251,34 @@ class AggressiveTrainerV1:
             actual=actual,
             error=err,
             uncertainty=uncertainty,
-            category=classification.category.value,
+            category=category.value,
             oracle_ambiguous=oracle_ambiguous,
-            is_trainable_oracle=is_trainable_oracle
+            is_trainable_oracle=is_trainable_oracle,
+            top_candidates=tuple((h.hid, h.eligibility, h.truth, h.strength) for h in top2 if h is not None),
+            partner_step=partner_step
         )
 
+    def _strongest_handle(self, sent_id: int) -> Optional[Handle]:
+        # Probe target: the signature's strongest handle by (strength, hits), gated or not
+        all_matches = self.agent._handles.for_sent(sent_id)
+        if not all_matches:
+            return None
+        all_matches.sort(key=lambda h: (h.strength, h.hits), reverse=True)
+        return all_matches[0]
+
+    def _observe(self, pending: Optional[list], res: TrainingResult, decision: Decision, learn: bool, update_truth: bool = True, eligibility_bump: float = 0.0) -> None:
+        # agent.observe() now, or queued for the chunk's observe_batch() when pending is a list
+        if pending is None:
+            self.agent.observe(res.sample.sent, res.actual, learn=learn, update_truth=update_truth, eligibility_bump=eligibility_bump, decision=decision)
+        else:
+            pending.append((res.sample.sent, res.actual, decision, (learn, update_truth, eligibility_bump)))
+
+    def _flush_observes(self, pending: Optional[list]) -> None:
+        if pending:
+            sent, received, decisions, flags = zip(*pending)
+            self.agent.observe_batch(sent, received, decisions=decisions, flags=flags)
+            pending.clear()
+
     def apply_boundary_drills(self, result: TrainingResult, n: int):
         if result.error == 0.0:
             return
@@ -125,6 +286,7 @@ class AggressiveTrainerV1:
         sent = list(result.sample.sent)
         if not sent:
             return
+        priority = drill_priority(result.error, result.uncertainty)
 
         for _ in range(n):
             # Mutate one pulse
@@ -141,9 +303,18 @@ class AggressiveTrainerV1:
                     new_sent.pop(self.rng.randrange(len(new_sent)))
             
             drill_sent = tuple(new_sent)
-            self.drill_queue.append(TrainingSample(sent=drill_sent, sent_sig=_sig(drill_sent), synthetic_drill=True))
+            # Neighbours already queued merge into one drill
+            self.drill_queue.push(TrainingSample(sent=drill_sent, synthetic_drill=True), priority)
 
-    def train_round(self, batch_size: int, drill_n: int, uncertainty_threshold: float, fixed_batch: List[TrainingSample] = None, question_credit: float = 0.25, question_preferred: bool = True, question_budget_per_round: int = 0, probe_after_budget: bool = False) -> Dict[str, Any]:
+    def train_round(self, batch_size: int, drill_n: int, uncertainty_threshold: float, fixed_batch: List[TrainingSample] = None, question_credit: float = 0.25, question_preferred: bool = True, question_budget_per_round: int = 0, probe_after_budget: bool = False, predict_chunk: int = 0) -> Dict[str, Any]:
+        """
+        predict_chunk > 0 runs the round predict_chunk samples at a time
+        (mini-batch semantics): one agent.predict_batch_top2() call decides the
+        chunk, run_inference_batch() scores it in one go, every sample is routed
+        against the handles as they were then, and one agent.observe_batch()
+        applies the chunk's updates. A sharded agent serves each of those calls
+        on all shards at once. 0 decides every sample after the previous update.
+        """
         batch = fixed_batch if fixed_batch else self.generate_batch(batch_size)
         results = []
         corrections = 0
@@ -157,18 +328,38 @@ class AggressiveTrainerV1:
         probe_wrong_or_uncertain_count = 0
         question_budget_hit_count = 0
         questions_blocked_count = 0
+        drills_merged_before = self.drill_queue.merged
+        drills_dropped_before = self.drill_queue.dropped
         
         # Reset per-round drift counters if needed, but drift state persists across rounds
         drift_trigger_indices = []
 
+        chunk: List[tuple] = []
+        chunk_results: List[TrainingResult] = []
+        # This chunk's updates, for one observe_batch() at its end (None: observe per sample)
+        pending: Optional[list] = [] if predict_chunk > 0 else None
+        top2 = None
         for sample_idx, sample in enumerate(batch):
-            res = self.run_inference(sample)
+            if predict_chunk > 0:
+                if sample_idx % predict_chunk == 0:
+                    self._flush_observes(pending)
+                    chunk_samples = batch[sample_idx:sample_idx + predict_chunk]
+                    chunk = self.agent.predict_batch_top2([s.sent for s in chunk_samples])
+                    chunk_results = self.run_inference_batch(chunk_samples, chunk)
+                    top_h = None
+                _, h1, h2 = chunk[sample_idx % predict_chunk]
+                top2 = (h1, h2)
+                res = chunk_results[sample_idx % predict_chunk]
+            else:
+                res = self.run_inference(sample)
+                top_h = None
+            # The agent's own decision; res.decision may be replaced by probes/forced questions below
+            agent_decision = res.decision
             
             # Add phase info if partner is mixed_shift
-            if hasattr(self.partner, "step_count") and "mixed_shift" in self.partner.name:
-                # partner.step_count was already incremented in respond()
-                # step_count - 1 is the index for the current sample
-                current_step = getattr(self.partner, "step_count") - 1
+            if res.partner_step is not None and "mixed_shift" in self.partner.name:
+                # The partner's index for the current sample (a chunk's responses are all drawn up front)
+                current_step = res.partner_step
                 split_point = getattr(self.partner, "split_point", 500)
                 phase = 0 if current_step < split_point else 1
                 res.decision.meta["phase"] = phase
@@ -180,11 +371,9 @@ class AggressiveTrainerV1:
                 self.drift_probe_steps_total += 1
                 # Force lane = SPEAK but mark meta={"probe": true, "drift_probe": true}
                 # We need to find the best handle prediction
-                all_matches = [h for h in self.agent._handles if h.sent_sig == res.sample.sent_sig]
-                if all_matches:
-                    all_matches.sort(key=lambda h: (h.strength, h.hits), reverse=True)
-                    h = all_matches[0]
-                    act = tuple(int(x) for x in h.resp_sig.split(",")) if h.resp_sig != "0" else ()
+                h = top2[0] if top2 is not None else self._strongest_handle(res.sample.sent_id)
+                if h is not None:
+                    act = h.resp_act
                     res.decision = Decision(lane=Lane.SPEAK, act=act, meta={**res.decision.meta, "probe": True, "drift_probe": True})
                     # Re-evaluate error
                     from constraint_bootstrap.metrics_v1 import response_error
@@ -204,9 +393,10 @@ class AggressiveTrainerV1:
                     # If we were NA/SILENT but uncertain, force QUESTION template if possible
                     if res.decision.lane in [Lane.NA, Lane.SILENT]:
                         # Generate a question template based on what we know
-                        top_h = self.agent.handles[:2] if self.agent.handles else []
-                        top1_act = format_act(top_h[0].resp_sig) if top_h else "[]"
-                        top2_act = format_act(top_h[1].resp_sig) if len(top_h) > 1 else "0"
+                        if top_h is None: # the handles only change once the chunk's updates go in
+                            top_h = self.agent.top_handles(2)
+                        top1_act = format_act(top_h[0].resp_act) if top_h else "[]"
+                        top2_act = format_act(top_h[1].resp_act) if len(top_h) > 1 else "0"
                         
                         if res.oracle_ambiguous:
                             q_text = get_ambiguous_oracle_question(top1_act, top2_act)
@@ -223,11 +413,9 @@ class AggressiveTrainerV1:
                     if probe_after_budget:
                         # Force a PROBE decision: choose best candidate mapping (top handle prediction) even if gated
                         # We use agent._handles because agent.handles filters by eligibility/truth
-                        all_matches = [h for h in self.agent._handles if h.sent_sig == res.sample.sent_sig]
-                        if all_matches:
-                            all_matches.sort(key=lambda h: (h.strength, h.hits), reverse=True)
-                            h = all_matches[0]
-                            act = tuple(int(x) for x in h.resp_sig.split(",")) if h.resp_sig != "0" else ()
+                        h = top2[0] if top2 is not None else self._strongest_handle(res.sample.sent_id)
+                        if h is not None:
+                            act = h.resp_act
                             # Emit decision lane as SPEAK but with meta {"probe": true}
                             res.decision = Decision(lane=Lane.SPEAK, act=act, meta={**res.decision.meta, "probe": True})
                             probe_count += 1
@@ -274,7 +462,7 @@ class AggressiveTrainerV1:
                 # observe() with update_truth=False for probe (even if learn=True)
                 # UNLESS it triggers a correction (which it does here if should_correct_truth is True)
                 # Requirement 3: "If oracle/correction is available, a wrong/uncertain probe may trigger a proper supervised truth update"
-                self.agent.observe(sample.sent, res.actual, learn=True, update_truth=True)
+                self._observe(pending, res, agent_decision, learn=True, update_truth=True)
                 res.corrected = True
                 corrections += 1
                 res.update_type = "correction_truth_probe" if is_probe else "correction_truth"
@@ -284,9 +472,10 @@ class AggressiveTrainerV1:
                     self.apply_boundary_drills(res, drill_n)
             elif should_question_train:
                 # QUESTION lane acts as a request for label
-                self.agent.observe(
-                    sample.sent, 
-                    res.actual, 
+                self._observe(
+                    pending,
+                    res,
+                    agent_decision,
                     learn=True, 
                     update_truth=True, 
                     eligibility_bump=self.agent.question_eligibility_bump
@@ -303,19 +492,19 @@ class AggressiveTrainerV1:
                     is_probe = res.decision.meta.get("probe", False)
                     if is_probe:
                         # Requirement: "ensure observe() is called with update_truth=False for probe (even if learn=True)"
-                        self.agent.observe(sample.sent, res.actual, learn=True, update_truth=False)
+                        self._observe(pending, res, agent_decision, learn=True, update_truth=False)
                         res.update_type = "probe_speak"
                     elif res.decision.lane in [Lane.QUESTION, Lane.NA, Lane.SILENT] and self.agent.silence_penalty > 0.0 and res.is_trainable_oracle:
                         # This triggers the silence_penalty logic in agent.observe
                         # which now only boosts eligibility (because update_truth=False).
-                        self.agent.observe(sample.sent, res.actual, learn=True, update_truth=False)
+                        self._observe(pending, res, agent_decision, learn=True, update_truth=False)
                         res.update_type = "eligibility_nudge"
                     else:
                         # No core update (except for promotion logic)
-                        self.agent.observe(sample.sent, res.actual, learn=False)
+                        self._observe(pending, res, agent_decision, learn=False)
             
             results.append(res)
-            self.history.append(res)
+            index = len(self.history) # this result's position in the full history
             
             # DRIFT DETECTION (Training-only)
             # Consider “committed” = SPEAK or PROBE (not QUESTION, not SILENT)
@@ -323,22 +512,29 @@ class AggressiveTrainerV1:
             if res.decision.lane == Lane.SPEAK or is_probe:
                 # err > 0 counts as miss
                 is_miss = res.error > 0.0
-                self.drift_outcomes.append(is_miss)
-                if len(self.drift_outcomes) > self.drift_window_size:
-                    self.drift_outcomes.pop(0)
-                
-                # Trigger drift when: miss_rate >= 0.60 AND window is full (50 items)
-                if len(self.drift_outcomes) == self.drift_window_size:
-                    miss_rate = sum(self.drift_outcomes) / self.drift_window_size
-                    if miss_rate >= 0.60 and self.drift_probe_burst_steps_left <= 0:
+                # Trigger drift when the detector signals (default: miss_rate >= 0.60 over a full 50-item window)
+                if self.drift_detector.update(is_miss):
+                    miss_rate = self.drift_detector.rate
+                    if self.drift_probe_burst_steps_left <= 0:
                         self.drift_triggers += 1
                         self.drift_probe_burst_steps_left = 20
-                        drift_trigger_indices.append(len(self.history) - 1)
+                        drift_trigger_indices.append(index)
                         # Log “DE_DRIFT” event to telemetry
                         res.decision.meta["DE_DRIFT"] = True
                         res.decision.meta["drift_miss_rate"] = miss_rate
-                        res.decision.meta["drift_trigger_index"] = len(self.history) - 1
-                        print(f"!!! DRIFT TRIGGERED at index {len(self.history)-1}, miss_rate={miss_rate:.2f}")
+                        res.decision.meta["drift_trigger_index"] = index
+                        res.decision.meta["drift_detector"] = self.drift_detector.kind
+                        self._note_detection_delay(res.partner_step)
+                        print(f"!!! DRIFT TRIGGERED at index {index}, miss_rate={miss_rate:.2f}")
+
+            # Only now is the result final (drift meta above)
+            self.history.append(res)
+            if self.run_writer is not None:
+                self.run_writer.write(history_row(res))
+
+        self._flush_observes(pending)
+        if self.run_writer is not None:
+            self.run_writer.flush() # a report is complete up to the last round
 
         # Metrics computation (v1.1)
         n = len(results)
@@ -362,17 +558,11 @@ class AggressiveTrainerV1:
         silent_to_question_nudges = 0
         
         # Diagnostics for gate mismatch
-        speakable_handle_count = 0
-        gated_by_eligibility_count = 0
-        
         # We can look at the handles directly at the end of the round
-        for h in self.agent.handles:
-            # speakable: meets truth_min_to_speak AND strength meets min_strength_to_predict
-            if h.truth >= self.agent.truth_min_to_speak:
-                if h.strength >= self.agent.min_strength_to_predict:
-                    speakable_handle_count += 1
-                else:
-                    gated_by_eligibility_count += 1
+        # speakable: meets truth_min_to_speak AND strength meets min_strength_to_predict
+        speakable_handle_count, gated_by_eligibility_count = self.agent._handles.speakable_counts(
+            self.agent.truth_min_to_speak, self.agent.min_strength_to_predict
+        )
 
         for r in results:
             meta = r.decision.meta
@@ -418,11 +608,11 @@ class AggressiveTrainerV1:
         speak_wrong_or_uncertain_count = sum(1 for r in results if r.decision.lane == Lane.SPEAK and r.is_trainable_oracle and (r.error > 0.0 or r.uncertainty < uncertainty_threshold))
         
         # Avg strength across ALL handles (diagnostic)
-        avg_strength = sum(h.strength for h in self.agent._handles) / len(self.agent._handles) if self.agent._handles else 0.0
+        avg_strength = self.agent._handles.avg_strength()
 
         # Avg eligibility and truth for top handles
         # Use _handles directly to avoid property overhead in metrics
-        top_h = sorted(self.agent._handles, key=lambda h: h.strength, reverse=True)[:10]
+        top_h = self.agent._handles.top_by_strength(10)
         avg_eligibility = sum(h.eligibility for h in top_h) / len(top_h) if top_h else 0.0
         avg_truth = sum(h.truth for h in top_h) / len(top_h) if top_h else 0.0
 
@@ -438,6 +628,8 @@ class AggressiveTrainerV1:
             "corrections": corrections,
             "question_supervised_count": question_supervised_count,
             "drill_queue_size": len(self.drill_queue),
+            "drills_merged": self.drill_queue.merged - drills_merged_before,
+            "drills_dropped": self.drill_queue.dropped - drills_dropped_before,
             "top_errors": self._get_top_errors(results),
             "avg_eligibility": avg_eligibility,
             "avg_truth": avg_truth,
@@ -458,7 +650,8 @@ class AggressiveTrainerV1:
             "questions_blocked_count": questions_blocked_count,
             "drift_triggers": self.drift_triggers,
             "drift_probe_steps": self.drift_probe_steps_total,
-            "drift_trigger_indices": drift_trigger_indices
+            "drift_trigger_indices": drift_trigger_indices,
+            "drift_detection_delay": self.drift_detection_delay
         }
         return metrics
 
@@ -469,55 +662,37 @@ class AggressiveTrainerV1:
                 error_cats[r.category] = error_cats.get(r.category, 0) + 1
         return sorted(error_cats.items(), key=lambda x: x[1], reverse=True)[:5]
 
-    def save_run(self, metadata: Dict[str, Any]):
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"data/training_runs/run_{timestamp}.json"
-        
-        # Ensure uniqueness
-        counter = 1
-        while os.path.exists(filename):
-            filename = f"data/training_runs/run_{timestamp}_{counter:02d}.json"
-            counter += 1
-        
-        report = {
-            "metadata": metadata,
-            "summary": {
-                "total_samples": len(self.history),
-                "final_accuracy": sum(1 for r in self.history[-100:] if r.error == 0.0) / min(100, len(self.history)) if self.history else 0,
-                "silent_miss_no_candidates": sum(1 for r in self.history[-100:] if r.decision.lane in [Lane.SILENT, Lane.NA] and r.error > 0.0 and not r.decision.meta.get("had_any_match")),
-                "silent_miss_with_candidates": sum(1 for r in self.history[-100:] if r.decision.lane in [Lane.SILENT, Lane.NA] and r.error > 0.0 and r.decision.meta.get("had_any_match")),
-                "proto_seeded_total": self.agent._total_handles_created,
-                "probe_count_total": sum(1 for r in self.history if r.decision.meta.get("probe")),
-                "silent_to_question_nudges_total": sum(1 for r in self.history if r.decision.meta.get("was_nudged_to_question")),
-                "question_repeats_blocked_total": sum(1 for r in self.history if r.decision.meta.get("on_cooldown") and r.decision.lane in [Lane.SILENT, Lane.NA])
-            },
-            "history": [
-                {
-                    "sent": _sig(r.sample.sent),
-                    "lane": r.decision.lane.value,
-                    "oracle_act": _sig(r.actual),
-                    "pred_act": _sig(r.decision.act) if r.decision.act is not None else "0",
-                    "err": r.error,
-                    "uncertainty_margin": r.uncertainty,
-                    "question": r.decision.question,
-                    "cat": r.category,
-                    "drill": r.sample.synthetic_drill,
-                    "corrected": r.corrected,
-                    "update_type": r.update_type,
-                    "meta": r.decision.meta,
-                    "top_candidates": [
-                        {
-                            "hid": h.hid,
-                            "eligibility": h.eligibility,
-                            "truth": h.truth,
-                            "combined_strength": h.strength
-                        } for h in self.agent.handles[:3] if h.sent_sig == _sig(r.sample.sent)
-                    ]
-                } for r in self.history
-            ]
+    def start_run(self, metadata: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Open this run's report now, so each result is written as it is final
+        rather than all at save_run(). Returns the report's path.
+        """
+        if self.run_writer is not None and not self.run_writer.closed:
+            raise RuntimeError(f"A run report is already open: {self.run_writer.path}")
+        self.run_writer = RunWriterV1(new_run_path(), metadata)
+        return self.run_writer.path
+
+    def save_run(self, metadata: Dict[str, Any]) -> str:
+        """
+        Finish the run report with its summary and metadata; returns its path.
+        Without start_run() the report is opened here and the history's rows
+        are streamed into it (only those a ring history still retains).
+        """
+        writer = self.run_writer
+        if writer is None or writer.closed:
+            writer = RunWriterV1(new_run_path())
+            for row in self.history.rows():
+                writer.write(row)
+        self.run_writer = None
+
+        # Summary from the sink's running totals and recent tail, not a pass over all results
+        recent = self.history.tail(SUMMARY_TAIL)
+        summary = {
+            "total_samples": len(self.history),
+            "final_accuracy": sum(1 for r in recent if r.error == 0.0) / len(recent) if recent else 0,
+            "silent_miss_no_candidates": sum(1 for r in recent if r.decision.lane in [Lane.SILENT, Lane.NA] and r.error > 0.0 and not r.decision.meta.get("had_any_match")),
+            "silent_miss_with_candidates": sum(1 for r in recent if r.decision.lane in [Lane.SILENT, Lane.NA] and r.error > 0.0 and r.decision.meta.get("had_any_match")),
+            "proto_seeded_total": self.agent._total_handles_created,
+            **self.history.totals,
         }
-        
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, "w") as f:
-            json.dump(report, f, indent=2)
-        return filename
+        return writer.close(summary, metadata)
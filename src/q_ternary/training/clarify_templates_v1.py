@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Tuple, Union
 
 def get_weak_knowledge_question(top1_act: str, top2_act: str) -> str:
     """Template for when knowledge exists but is below prediction threshold."""
@@ -12,8 +12,10 @@ def get_ambiguous_oracle_question(top1_act: str, top2_act: str) -> str:
     """Template for when the oracle response itself is ambiguous (multi-label)."""
     return f"This looks ambiguous (multiple valid acts). Which should I choose: {top1_act} or {top2_act}?"
 
-def format_act(act_sig: str) -> str:
-    """Helper to format signature for human reading."""
+def format_act(act_sig: Union[str, Tuple[int, ...]]) -> str:
+    """Helper to format signature (string or pulse tuple) for human reading."""
     if not act_sig or act_sig == "0":
         return "[]"
+    if isinstance(act_sig, tuple):
+        return f"[{' '.join(map(str, act_sig))}]"
     return f"[{act_sig.replace(',', ' ')}]"
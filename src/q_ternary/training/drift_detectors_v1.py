@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Protocol, Type
+
+
+class DriftDetector(Protocol):
+    """
+    Streaming detector over the trainer's committed outcomes (1 = miss).
+    update() returns True when it signals drift; rate is its current estimate
+    of the miss rate. Parameters are the dataclass init fields, running state
+    the init=False ones (JSON-able, so checkpoints can carry it).
+    """
+    kind: str
+    rate: float
+
+    def update(self, miss: bool) -> bool:
+        ...
+
+
+_REGISTRY: Dict[str, Type[DriftDetector]] = {}
+
+def register_drift_detector(kind: str, cls: Type[DriftDetector]) -> None:
+    _REGISTRY[kind.lower()] = cls
+
+def make_drift_detector(kind: str = "rolling", **params) -> DriftDetector:
+    kind = kind.strip().lower()
+    if kind not in _REGISTRY:
+        raise ValueError(f"Unknown drift detector: {kind!r}. Registered: {list(_REGISTRY.keys())}")
+    return _REGISTRY[kind](**params)
+
+def detector_params(det: DriftDetector) -> Dict[str, Any]:
+    return {f.name: getattr(det, f.name) for f in fields(det) if f.init}
+
+def detector_state(det: DriftDetector) -> Dict[str, Any]:
+    return {f.name: getattr(det, f.name) for f in fields(det) if not f.init and f.name != "kind"}
+
+def load_detector_state(det: DriftDetector, state: Dict[str, Any]) -> None:
+    for name, value in state.items():
+        setattr(det, name, value)
+
+
+@dataclass
+class RollingRateDetectorV1:
+    """
+    Miss rate over the last `window` outcomes, from a ring buffer and a running
+    count: signals while the window is full and the rate is >= threshold.
+    Doesn't reset on a signal (the trainer's probe burst gates re-triggering).
+    """
+    window: int = 50
+    threshold: float = 0.60
+    kind: str = field(default="rolling", init=False)
+    _buf: List[int] = field(default_factory=list, init=False)
+    _pos: int = field(default=0, init=False)
+    _misses: int = field(default=0, init=False)
+
+    def __post_init__(self) -> None:
+        if self.window < 1:
+            raise ValueError(f"window must be >= 1, got {self.window}")
+
+    @property
+    def rate(self) -> float:
+        return self._misses / self.window if len(self._buf) == self.window else self._misses / max(1, len(self._buf))
+
+    def update(self, miss: bool) -> bool:
+        x = int(miss)
+        if len(self._buf) < self.window:
+            self._buf.append(x)
+        else:
+            self._misses -= self._buf[self._pos]
+            self._buf[self._pos] = x
+            self._pos = (self._pos + 1) % self.window
+        self._misses += x
+        return len(self._buf) == self.window and self._misses / self.window >= self.threshold
+
+
+@dataclass
+class PageHinkleyDetectorV1:
+    """
+    Page-Hinkley test for an increase in the miss rate: cumulative deviation of
+    each outcome from the running mean (less `delta` slack) against its
+    minimum so far; signals when it rises more than `threshold` above it, then
+    starts over. No signal before `min_samples` outcomes.
+    """
+    delta: float = 0.05
+    threshold: float = 8.0
+    min_samples: int = 30
+    kind: str = field(default="page_hinkley", init=False)
+    _n: int = field(default=0, init=False)
+    _mean: float = field(default=0.0, init=False)
+    _cum: float = field(default=0.0, init=False)
+    _cum_min: float = field(default=0.0, init=False)
+    _recent: float = field(default=0.0, init=False) # EWMA, for rate
+
+    @property
+    def rate(self) -> float:
+        return self._recent
+
+    def update(self, miss: bool) -> bool:
+        x = 1.0 if miss else 0.0
+        self._recent += 0.05 * (x - self._recent)
+        n = self._n = self._n + 1
+        mean = self._mean = self._mean + (x - self._mean) / n
+        cum = self._cum = self._cum + x - mean - self.delta
+        if cum < self._cum_min:
+            self._cum_min = cum
+        elif n >= self.min_samples and cum - self._cum_min > self.threshold:
+            self._n, self._mean, self._cum, self._cum_min = 0, 0.0, 0.0, 0.0
+            return True
+        return False
+
+
+@dataclass
+class CusumDetectorV1:
+    """
+    One-sided CUSUM: the reference miss rate is the mean of the first `warmup`
+    outcomes (after construction or a signal); after that, S accumulates
+    outcome - (reference + slack), floored at 0, and a signal fires when S
+    exceeds `threshold`.
+    """
+    slack: float = 0.15
+    threshold: float = 5.0
+    warmup: int = 30
+    kind: str = field(default="cusum", init=False)
+    _n: int = field(default=0, init=False)
+    _ref: float = field(default=0.0, init=False)
+    _s: float = field(default=0.0, init=False)
+    _recent: float = field(default=0.0, init=False) # EWMA, for rate
+
+    @property
+    def rate(self) -> float:
+        return self._recent
+
+    def update(self, miss: bool) -> bool:
+        x = float(miss)
+        self._recent += 0.05 * (x - self._recent)
+        self._n += 1
+        if self._n <= self.warmup:
+            self._ref += (x - self._ref) / self._n
+            return False
+        self._s = max(0.0, self._s + x - self._ref - self.slack)
+        if self._s > self.threshold:
+            self._n, self._ref, self._s = 0, 0.0, 0.0
+            return True
+        return False
+
+
+@dataclass
+class AdwinDetectorV1:
+    """
+    ADWIN-style adaptive window. Outcomes go into an exponential histogram
+    (at most `buckets_per_size` buckets of each power-of-two size), so the
+    window costs O(log W) memory. Every `clock` outcomes each split into an
+    older and a newer part is tested with ADWIN's Hoeffding bound at
+    confidence `delta`; on a significant difference the older part is
+    dropped, and a rise in the miss rate is a signal.
+    """
+    delta: float = 0.002
+    clock: int = 32
+    min_part: int = 20
+    buckets_per_size: int = 5
+    kind: str = field(default="adwin", init=False)
+    _buckets: List[List[float]] = field(default_factory=list, init=False) # [misses, size], oldest first
+    _n: int = field(default=0, init=False)
+    _sum: float = field(default=0.0, init=False)
+    _tick: int = field(default=0, init=False)
+
+    @property
+    def rate(self) -> float:
+        return self._sum / self._n if self._n else 0.0
+
+    def update(self, miss: bool) -> bool:
+        x = 1.0 if miss else 0.0
+        b = self._buckets
+        b.append([x, 1])
+        self._n += 1
+        self._sum += x
+        # Only a new overflow of size-1 buckets can start a merge cascade
+        m = self.buckets_per_size
+        if len(b) > m and b[-m - 1][1] == 1:
+            self._compress()
+        self._tick += 1
+        if self._tick % self.clock:
+            return False
+        return self._cut()
+
+    def _compress(self) -> None:
+        # Newest buckets are at the end; merge the two oldest of a size once it overflows
+        b = self._buckets
+        i = len(b) - 1
+        while i >= 0:
+            size = b[i][1]
+            j = i
+            while j > 0 and b[j - 1][1] == size:
+                j -= 1
+            if i - j + 1 <= self.buckets_per_size:
+                return
+            b[j][0] += b[j + 1][0]
+            b[j][1] += b[j + 1][1]
+            del b[j + 1]
+            i = j
+
+    def _cut(self) -> bool:
+        rose = False
+        while True:
+            n, total = self._n, self._sum
+            # Hoeffding bound, squared: eps^2 = ln(4n/delta) / 2 * (1/n0 + 1/n1)
+            half_log = math.log(4.0 * n / self.delta) / 2.0
+            n0 = s0 = 0.0
+            cut_at = -1
+            for i, (s, size) in enumerate(self._buckets[:-1]):
+                n0 += size
+                s0 += s
+                n1 = n - n0
+                if n0 < self.min_part or n1 < self.min_part:
+                    continue
+                diff = (total - s0) / n1 - s0 / n0
+                if diff * diff > half_log * (1.0 / n0 + 1.0 / n1):
+                    cut_at = i
+                    rose = rose or diff > 0
+                    break
+            if cut_at < 0:
+                return rose
+            for s, size in self._buckets[:cut_at + 1]:
+                self._n -= size
+                self._sum -= s
+            del self._buckets[:cut_at + 1]
+
+
+register_drift_detector("rolling", RollingRateDetectorV1)
+register_drift_detector("page_hinkley", PageHinkleyDetectorV1)
+register_drift_detector("cusum", CusumDetectorV1)
+register_drift_detector("adwin", AdwinDetectorV1)
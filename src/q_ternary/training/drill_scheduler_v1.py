@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import heapq
+from typing import TYPE_CHECKING, Dict, Iterator, List, Tuple
+
+if TYPE_CHECKING:
+    from .aggressive_trainer_v1 import TrainingSample
+
+
+def drill_priority(error: float, uncertainty: float) -> float:
+    """
+    Expected information of drilling around an exchange: how badly it missed,
+    plus how close its top-2 margin was (0 for a margin of 1 or more).
+    """
+    return error + max(0.0, 1.0 - uncertainty)
+
+
+class DrillSchedulerV1:
+    """
+    Bounded, deduplicating priority queue of drill samples.
+
+    pop() returns the highest-priority drill, ties in insertion order, so with
+    equal priorities it drains like the FIFO list it replaces. One entry per
+    sent signature: pushing a signature that is already queued merges into
+    it, keeping the higher priority. When full, a push evicts the
+    lowest-priority entry (the newest on ties), or is itself dropped if it
+    ranks no higher. merged and dropped count both outcomes.
+
+    Two heaps share the entries (max-first for pop, min-first for eviction);
+    entries superseded by a merge or removed from the other side are skipped
+    lazily, and the heaps are compacted once stale entries outnumber live
+    ones. push() and pop() are O(log n) amortized.
+    """
+
+    def __init__(self, capacity: int = 4096) -> None:
+        if capacity < 1:
+            raise ValueError(f"capacity must be >= 1, got {capacity}")
+        self.capacity = capacity
+        self.merged = 0
+        self.dropped = 0
+        self._live: Dict[tuple, list] = {} # sent -> [-priority, seq, sample]
+        self._max: List[list] = []
+        self._min: List[tuple] = [] # (priority, -seq, entry)
+        self._seq = 0
+
+    def __len__(self) -> int:
+        return len(self._live)
+
+    def __bool__(self) -> bool:
+        return bool(self._live)
+
+    def __iter__(self) -> Iterator["TrainingSample"]:
+        """Queued samples in pop order (doesn't consume them)."""
+        return (sample for sample, _ in self.items())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, DrillSchedulerV1):
+            return NotImplemented
+        return self.items() == other.items()
+
+    __hash__ = None
+
+    def items(self) -> List[Tuple["TrainingSample", float]]:
+        """(sample, priority) pairs in pop order."""
+        return [(e[2], -e[0]) for e in sorted(self._live.values())]
+
+    def push(self, sample: "TrainingSample", priority: float) -> str:
+        """Queue a drill; returns "queued", "merged" or "dropped"."""
+        old = self._live.get(sample.sent)
+        if old is not None:
+            self.merged += 1
+            if priority > -old[0]:
+                self._insert(sample, priority, old[1]) # keeps its place among ties
+            return "merged"
+        if len(self._live) >= self.capacity:
+            low = self._peek_min()
+            if priority <= -low[0]:
+                self.dropped += 1
+                return "dropped"
+            del self._live[low[2].sent]
+            self.dropped += 1
+        self._seq += 1
+        self._insert(sample, priority, self._seq)
+        return "queued"
+
+    def pop(self) -> "TrainingSample":
+        """Highest-priority drill (IndexError when empty)."""
+        while self._max:
+            entry = heapq.heappop(self._max)
+            if self._live.get(entry[2].sent) is entry:
+                del self._live[entry[2].sent]
+                return entry[2]
+        raise IndexError("pop from an empty DrillSchedulerV1")
+
+    def _insert(self, sample: "TrainingSample", priority: float, seq: int) -> None:
+        entry = [-priority, seq, sample]
+        self._live[sample.sent] = entry
+        heapq.heappush(self._max, entry)
+        heapq.heappush(self._min, (priority, -seq, entry))
+        if len(self._min) > 2 * len(self._live) + 64:
+            self._compact()
+
+    def _peek_min(self) -> list:
+        while True:
+            entry = self._min[0][2]
+            if self._live.get(entry[2].sent) is entry:
+                return entry
+            heapq.heappop(self._min)
+
+    def _compact(self) -> None:
+        entries = list(self._live.values())
+        self._max = list(entries)
+        heapq.heapify(self._max)
+        self._min = [(-e[0], -e[1], e) for e in entries]
+        heapq.heapify(self._min)
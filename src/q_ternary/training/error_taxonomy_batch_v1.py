@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Sequence, Tuple
+
+import numpy as np
+
+from constraint_bootstrap.metrics_batch_v1 import pad_pulses, response_error_batch
+from .error_taxonomy_v1 import ErrorCategory
+
+# Category codes returned by classify_error_batch: ERROR_CATEGORIES[code]
+ERROR_CATEGORIES: Tuple[ErrorCategory, ...] = tuple(ErrorCategory)
+_CODE = {c: np.int8(i) for i, c in enumerate(ERROR_CATEGORIES)}
+
+
+def classify_error_batch(pred_len: np.ndarray, act_len: np.ndarray, err: np.ndarray) -> np.ndarray:
+    """
+    classify_error() categories for a batch, as int8 codes into
+    ERROR_CATEGORIES. Only the signature lengths matter to the taxonomy, so it
+    takes lengths rather than signatures.
+    """
+    pred_len = np.asarray(pred_len)
+    act_len = np.asarray(act_len)
+    err = np.asarray(err, dtype=np.float64)
+    # First matching rule wins, as in the scalar function
+    return np.select(
+        [
+            err == 0.0,
+            (pred_len == 0) != (act_len == 0),
+            pred_len == act_len,
+            (0.0 < err) & (err < 1.5),
+        ],
+        [_CODE[ErrorCategory.NONE], _CODE[ErrorCategory.POLARITY_MISSED], _CODE[ErrorCategory.METAPHOR], _CODE[ErrorCategory.NA_MISSED]],
+        default=_CODE[ErrorCategory.OTHER],
+    ).astype(np.int8)
+
+
+def score_batch(preds: Sequence[Tuple[int, ...]], actuals: Sequence[Tuple[int, ...]]) -> Tuple[np.ndarray, np.ndarray]:
+    """(response errors, category codes) for parallel lists of predicted and actual acts."""
+    width = max((len(s) for s in (*preds, *actuals)), default=0)
+    pred, pred_len = pad_pulses(preds, width)
+    actual, actual_len = pad_pulses(actuals, width)
+    err = response_error_batch(pred, pred_len, actual, actual_len)
+    return err, classify_error_batch(pred_len, actual_len, err)
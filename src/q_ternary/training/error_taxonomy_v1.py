@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
+from typing import Tuple, Union
 
 class ErrorCategory(Enum):
     NONE = "none"
@@ -14,7 +15,12 @@ class ErrorClassification:
     category: ErrorCategory
     description: str
 
-def classify_error(pred_sig: str, act_sig: str, err: float) -> ErrorClassification:
+def _act_len(act: Union[str, Tuple[int, ...]]) -> int:
+    if isinstance(act, tuple):
+        return len(act)
+    return act.count(",") + 1 if act != "0" else 0 # length without splitting the string
+
+def classify_error(pred_sig: Union[str, Tuple[int, ...]], act_sig: Union[str, Tuple[int, ...]], err: float) -> ErrorClassification:
     """
     Classify the error between predicted and actual signatures.
     In the toy world:
@@ -26,14 +32,14 @@ def classify_error(pred_sig: str, act_sig: str, err: float) -> ErrorClassificati
     if err == 0.0:
         return ErrorClassification(ErrorCategory.NONE, "No error")
     
-    if pred_sig == "0" and act_sig != "0":
+    pred_len = _act_len(pred_sig)
+    act_len = _act_len(act_sig)
+
+    if pred_len == 0 and act_len != 0:
         return ErrorClassification(ErrorCategory.POLARITY_MISSED, "False negative (silent when should have responded)")
     
-    if pred_sig != "0" and act_sig == "0":
+    if pred_len != 0 and act_len == 0:
         return ErrorClassification(ErrorCategory.POLARITY_MISSED, "False positive (responded when should have been silent)")
-
-    pred_len = len(pred_sig.split(",")) if pred_sig != "0" else 0
-    act_len = len(act_sig.split(",")) if act_sig != "0" else 0
     
     if pred_len == act_len:
         return ErrorClassification(ErrorCategory.METAPHOR, "Same length, different values")
@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import json
+import os
+import pickle
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, Iterator, List, Sequence
+
+from constraint_bootstrap.bootstrap_agent_v1 import _sig
+from q_ternary.lane_v1 import Lane
+
+if TYPE_CHECKING:
+    from .aggressive_trainer_v1 import TrainingResult
+
+# save_run()'s summary looks at this many of the latest results
+SUMMARY_TAIL = 100
+
+
+def history_row(r: "TrainingResult") -> Dict[str, Any]:
+    """A result as save_run() writes it."""
+    return {
+        "sent": _sig(r.sample.sent),
+        "lane": r.decision.lane.value,
+        "oracle_act": _sig(r.actual),
+        "pred_act": _sig(r.decision.act) if r.decision.act is not None else "0",
+        "err": r.error,
+        "uncertainty_margin": r.uncertainty,
+        "question": r.decision.question,
+        "cat": r.category,
+        "drill": r.sample.synthetic_drill,
+        "corrected": r.corrected,
+        "update_type": r.update_type,
+        "meta": r.decision.meta,
+        "top_candidates": [
+            {"hid": hid, "eligibility": eligibility, "truth": truth, "combined_strength": strength}
+            for hid, eligibility, truth, strength in r.top_candidates
+        ],
+    }
+
+
+class HistoryV1:
+    """
+    Where AggressiveTrainerV1 keeps its TrainingResults.
+
+    Every sink counts all results appended (len()) and keeps the running
+    totals save_run() reports; what it retains in memory depends on the kind.
+    Indexing and iteration cover the retained results, oldest first, and
+    rows() yields save_run()'s history rows. Append a result only once it is
+    final (spilled rows are written on append).
+
+    This base class keeps everything in memory, as the trainer always has.
+    """
+
+    kind = "memory"
+
+    def __init__(self) -> None:
+        self._count = 0
+        self.totals = {"probe_count_total": 0, "silent_to_question_nudges_total": 0, "question_repeats_blocked_total": 0}
+        self._results: Sequence["TrainingResult"] = []
+
+    def append(self, r: "TrainingResult") -> None:
+        self._count += 1
+        meta = r.decision.meta
+        if meta.get("probe"):
+            self.totals["probe_count_total"] += 1
+        if meta.get("was_nudged_to_question"):
+            self.totals["silent_to_question_nudges_total"] += 1
+        if meta.get("on_cooldown") and r.decision.lane in (Lane.SILENT, Lane.NA):
+            self.totals["question_repeats_blocked_total"] += 1
+        self._keep(r)
+
+    def _keep(self, r: "TrainingResult") -> None:
+        self._results.append(r)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __bool__(self) -> bool:
+        return self._count > 0
+
+    def __iter__(self) -> Iterator["TrainingResult"]:
+        return iter(self._results)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice) and not isinstance(self._results, list):
+            return list(self._results)[i]
+        return self._results[i]
+
+    def tail(self, n: int) -> List["TrainingResult"]:
+        """The latest n results (at least SUMMARY_TAIL are always retained)."""
+        if n <= 0:
+            return []
+        return self._results[-n:] if isinstance(self._results, list) else list(self._results)[-n:]
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        return (history_row(r) for r in self._results)
+
+    def close(self) -> None:
+        pass
+
+
+class RingHistoryV1(HistoryV1):
+    """Retains only the last `size` results (rows() covers just those)."""
+
+    kind = "ring"
+
+    def __init__(self, size: int = 10000) -> None:
+        super().__init__()
+        self._results: Deque["TrainingResult"] = deque(maxlen=max(size, SUMMARY_TAIL))
+
+
+class SpillHistoryV1(HistoryV1):
+    """
+    Appends every result to `path` as it arrives, one record per result:
+    a JSON line (fmt="jsonl") or a pickled row (fmt="binary", faster and
+    smaller), and retains only the last `keep` in memory. rows() reads the
+    file back one record at a time.
+    """
+
+    kind = "spill"
+
+    def __init__(self, path: str, fmt: str = "jsonl", keep: int = SUMMARY_TAIL) -> None:
+        if fmt not in ("jsonl", "binary"):
+            raise ValueError(f"Unknown history format: {fmt!r} (jsonl | binary)")
+        super().__init__()
+        self.path = path
+        self.fmt = fmt
+        self._results: Deque["TrainingResult"] = deque(maxlen=max(keep, SUMMARY_TAIL))
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._file = open(path, "w" if fmt == "jsonl" else "wb")
+
+    def _keep(self, r: "TrainingResult") -> None:
+        self._results.append(r)
+        if self.fmt == "jsonl":
+            self._file.write(json.dumps(history_row(r)) + "\n")
+        else:
+            pickle.dump(history_row(r), self._file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def rows(self) -> Iterator[Dict[str, Any]]:
+        if not self._file.closed:
+            self._file.flush()
+        if self.fmt == "jsonl":
+            with open(self.path) as f:
+                for line in f:
+                    yield json.loads(line)
+        else:
+            with open(self.path, "rb") as f:
+                while True:
+                    try:
+                        yield pickle.load(f)
+                    except EOFError:
+                        return
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def make_history(kind: str = "memory", size: int = 10000, path: str | None = None, fmt: str = "jsonl") -> HistoryV1:
+    """memory | ring (last `size` results) | spill (to `path`, as jsonl or binary)."""
+    kind = kind.strip().lower()
+    if kind == "memory":
+        return HistoryV1()
+    if kind == "ring":
+        return RingHistoryV1(size)
+    if kind == "spill":
+        if not path:
+            raise ValueError("Spill history needs a path")
+        return SpillHistoryV1(path, fmt=fmt)
+    raise ValueError(f"Unknown history kind: {kind!r} (memory | ring | spill)")
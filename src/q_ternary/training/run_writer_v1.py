@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional
+
+RUN_FORMAT = "run_report_v1"
+
+
+def new_run_path(directory: str = "data/training_runs") -> str:
+    """run_<timestamp>.jsonl in directory, with a counter suffix if that name is taken."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    filename = os.path.join(directory, f"run_{timestamp}.jsonl")
+    counter = 1
+    while os.path.exists(filename):
+        filename = os.path.join(directory, f"run_{timestamp}_{counter:02d}.jsonl")
+        counter += 1
+    return filename
+
+
+class RunWriterV1:
+    """
+    Writes a run report as it happens, one JSON object per line: a header
+    ({"header": {...}}) on open, one history row per write(), and the summary
+    ({"summary": {...}, "metadata": {...}}) on close(). Rows are not kept,
+    so a report costs constant memory however long the run, and a run that
+    dies before close() still leaves its header and the rows flushed so far.
+    load_run() reads it back.
+
+    Rows are history_row() dicts. A row's top_candidates are its signature's
+    two strongest handles ({hid, eligibility, truth, combined_strength}) as
+    they stood when the decision was taken.
+    """
+
+    def __init__(self, path: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        self.path = path
+        self.rows_written = 0
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        # Reserve the name now, so a second writer in the same second gets another
+        self._file = open(path, "x")
+        header = {"format": RUN_FORMAT, "started": datetime.now().isoformat(timespec="seconds"), "metadata": metadata or {}}
+        self._file.write(json.dumps({"header": header}) + "\n")
+
+    @property
+    def closed(self) -> bool:
+        return self._file.closed
+
+    def write(self, row: Dict[str, Any]) -> None:
+        self._file.write(json.dumps(row) + "\n")
+        self.rows_written += 1
+
+    def flush(self) -> None:
+        self._file.flush()
+
+    def close(self, summary: Dict[str, Any], metadata: Optional[Dict[str, Any]] = None) -> str:
+        """Write the summary (and any metadata known only at the end) and close; returns the path."""
+        self._file.write(json.dumps({"summary": summary, "metadata": metadata or {}}) + "\n")
+        self._file.close()
+        return self.path
+
+
+def iter_run(path: str) -> Iterator[Dict[str, Any]]:
+    """The lines of a RunWriterV1 report as dicts: header, rows, summary."""
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def load_run(path: str) -> Dict[str, Any]:
+    """
+    A run report as {"metadata", "summary", "history", ...}: streamed reports
+    (header metadata updated by the closing line's, plus the header's "format")
+    and the older single-JSON reports alike. A report whose run never closed
+    has an empty summary.
+    """
+    with open(path, encoding="utf-8") as f:
+        first = f.readline()
+    try:
+        head = json.loads(first)
+    except json.JSONDecodeError:
+        head = None
+    if not isinstance(head, dict) or "header" not in head:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    header = head["header"]
+    report: Dict[str, Any] = {"format": header.get("format"), "metadata": dict(header.get("metadata", {})), "summary": {}, "history": []}
+    lines = iter_run(path)
+    next(lines)
+    for obj in lines:
+        if "summary" in obj and "sent" not in obj:
+            report["summary"] = obj["summary"]
+            report["metadata"].update(obj.get("metadata", {}))
+        else:
+            report["history"].append(obj)
+    return report
@@ -0,0 +1,29 @@
+"""Shared driver and state snapshot for the tests that compare two agents step for step."""
+
+def run_agent(agent, steps, start=1, partner=None, decay=True, read_every=0):
+    """
+    Drive agent through steps turns from step start: choose, predict, observe
+    with learning, then one decay tick. Responses come from partner, or else
+    from a fixed rule with a second response every 7th step so handles compete.
+    read_every > 0 ranks the handles every that many steps, settling lazy decay.
+    """
+    for t in range(start, start + steps):
+        sent = agent.choose_action(t)
+        d = agent.predict(sent)
+        received = partner.respond(sent) if partner else (len(sent) % 3,) if t % 7 else (sum(sent) % 4,)
+        agent.observe(sent, received, learn=True, decision=d)
+        if decay:
+            agent._apply_handle_decay()
+        if read_every and t % read_every == 0:
+            agent.top_handles(3)
+    return agent
+
+def agent_state(agent):
+    """Everything two agents fed the same stream must agree on; handles come first."""
+    return (
+        [(h.hid, h.sent_sig, h.resp_sig, h.eligibility, h.truth, h.hits, h.misses) for h in agent._handles],
+        agent._focus_seq, agent._focus_left, agent._current_step, dict(agent._last_question_step),
+        agent.total_predict_calls, agent.sum_candidate_count, agent.total_evictions, agent.total_inhibitions,
+        agent._proto_seeded_round, agent._silent_to_question_nudges_round, agent._question_repeats_blocked_round,
+        agent._rng.getstate(),
+    )
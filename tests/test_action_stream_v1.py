@@ -0,0 +1,35 @@
+from itertools import islice
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+
+def _kind(seq):
+    if len(seq) >= 2 and seq[0] == 2 * seq[1] and len(seq) <= 4:
+        return "ratio"
+    if len(seq) in (4, 5) and seq == seq[::-1]:
+        return "palindrome"
+    return "random"
+
+def test_stream_is_reproducible_and_covers_every_phase():
+    a = list(islice(BootstrapAgentV1(seed=3).actions(block=64), 3000))
+    assert a == list(islice(BootstrapAgentV1(seed=3).actions(block=64), 3000))
+    assert a != list(islice(BootstrapAgentV1(seed=4).actions(), 3000))
+
+    early, probes = a[:14], a[14:]
+    assert all(1 <= len(s) <= 7 and all(1 <= p <= 7 for p in s) for s in early)
+    assert all(2 <= len(s) <= 8 and all(1 <= p <= 12 for p in s) for s in probes)
+    kinds = [_kind(s) for s in probes]
+    for kind, share in (("random", 0.35), ("palindrome", 0.30), ("ratio", 0.35)):
+        assert abs(kinds.count(kind) / len(kinds) - share) < 0.05
+
+def test_stream_follows_the_focus_loop():
+    agent = BootstrapAgentV1(seed=1, focus_mutate_prob=0.5)
+    stream = agent.actions(start=100)
+    agent._focus_seq, agent._focus_left = (4, 4, 4), 40
+    focused = list(islice(stream, 40))
+    assert agent._focus_left == 0 and stream.step == 140
+    assert all(sum(abs(x - y) for x, y in zip(s, (4, 4, 4))) <= 1 for s in focused)
+    assert 10 < focused.count((4, 4, 4)) < 30 # about half mutate
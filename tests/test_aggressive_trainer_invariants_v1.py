@@ -127,3 +127,39 @@ def test_no_updates_on_ambiguous_oracle():
     
     assert metrics["corrections"] == 0
     assert h.strength == 0.5, "Should not update core weights on ambiguous oracle"
+
+def _full_scan_margin(agent, sent_id):
+    # The old compute_uncertainty: filter the fully sorted registry
+    cands = [h for h in agent.handles if h.sent_id == sent_id and h.strength >= agent.min_strength_to_predict]
+    if not cands:
+        return 1.0
+    if agent.compete_topk > 0:
+        cands = cands[:agent.compete_topk]
+    return cands[0].strength - (cands[1].strength if len(cands) > 1 else 0.0)
+
+@pytest.mark.parametrize("kw", [
+    dict(),
+    dict(compete_topk=1, decay_rate=0.01, lazy_decay=True),
+    dict(compete_topk=2, eligibility_min_to_consider=0.5, min_strength_to_predict=0.2),
+    dict(handle_backend="table", decay_rate=0.01),
+])
+def test_indexed_uncertainty_matches_full_scan(kw, monkeypatch):
+    if kw.get("handle_backend") == "table":
+        pytest.importorskip("numpy")
+    agent = BootstrapAgentV1(**{"seed": 5, "promote_threshold": 2, "seed_proto_handles": True, "min_strength_to_predict": 0.1, **kw})
+    trainer = AggressiveTrainerV1(agent, partner_name="mixed", seed=5)
+    indexed = trainer.run_inference_batch
+    checked = []
+
+    def both(samples, decided):
+        # A chunk's updates go in after all of it is scored, so the registry still holds decision-time strengths
+        results = indexed(samples, decided)
+        for sample, res in zip(samples, results):
+            assert res.uncertainty == _full_scan_margin(agent, sample.sent_id)
+            checked.append(res.uncertainty)
+        return results
+
+    monkeypatch.setattr(trainer, "run_inference_batch", both)
+    for _ in range(4):
+        trainer.train_round(batch_size=150, drill_n=2, uncertainty_threshold=0.1, predict_chunk=16)
+    assert any(u != 1.0 for u in checked) # some samples had candidates
@@ -0,0 +1,59 @@
+import random
+
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1, TrainingSample
+
+from _agent_harness import agent_state
+
+def _twins(**kw):
+    agents = []
+    for _ in range(2):
+        agent = BootstrapAgentV1(seed=11, promote_threshold=2, seed_proto_handles=True, question_cooldown_n=3, **kw)
+        for sent in _stream(300, seed=9)[0]:
+            # Mostly consistent partner; a second response on some inputs so handles compete
+            agent.observe(sent, (sum(sent) % 4,) if sum(sent) % 5 else (7,), learn=True)
+        agents.append(agent)
+    return agents
+
+def _stream(n, seed=0):
+    rng = random.Random(seed)
+    sents = [tuple(rng.randint(1, 4) for _ in range(rng.randint(1, 2))) for _ in range(n)]
+    return sents, [(sum(s) % 4,) for s in sents]
+
+def test_predict_batch_matches_sequential_predict():
+    seq_agent, batch_agent = _twins()
+    sents, _ = _stream(200)
+
+    expected = [seq_agent.predict(s) for s in sents]
+    got = batch_agent.predict_batch(sents)
+
+    assert got == expected
+    assert agent_state(batch_agent) == agent_state(seq_agent)
+
+@pytest.mark.parametrize("learn", [False, True])
+def test_observe_batch_matches_sequential_observe(learn):
+    seq_agent, batch_agent = _twins(decay_rate=0.01)
+    sents, recvs = _stream(200, seed=1)
+
+    expected = [seq_agent.observe(s, r, learn=learn) for s, r in zip(sents, recvs)]
+    got = batch_agent.observe_batch(sents, recvs, learn=learn)
+
+    assert got == expected
+    assert agent_state(batch_agent) == agent_state(seq_agent)
+
+def test_observe_batch_rejects_length_mismatch():
+    with pytest.raises(ValueError):
+        BootstrapAgentV1().observe_batch([(1,)], [])
+
+def test_train_round_predict_chunk_of_one_is_sequential():
+    def run(**kw):
+        agent = BootstrapAgentV1(seed=4, seed_proto_handles=True)
+        trainer = AggressiveTrainerV1(agent, partner_name="mixed", seed=4)
+        batch = [TrainingSample(sent=s) for s in _stream(150, seed=2)[0]]
+        metrics = trainer.train_round(batch_size=len(batch), drill_n=0, uncertainty_threshold=0.1, fixed_batch=batch, **kw)
+        return metrics["accuracy"], metrics["corrections"], [r.decision.lane for r in trainer.history]
+
+    assert run(predict_chunk=1) == run()
+    assert run(predict_chunk=32)[2] # chunked decisions still produce a full history
@@ -0,0 +1,51 @@
+import contextlib
+import io
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.metrics_v1 import response_error
+from constraint_bootstrap.metrics_batch_v1 import pad_pulses, response_error_batch
+from q_ternary.training.error_taxonomy_v1 import classify_error
+from q_ternary.training import aggressive_trainer_v1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+from q_ternary.training.error_taxonomy_batch_v1 import ERROR_CATEGORIES, classify_error_batch, score_batch
+
+def _acts(rng, n):
+    pool = [(), (999,), (3,), (3, 4), (4, 3)]
+    return [rng.choice(pool) if rng.random() < 0.3 else tuple(rng.randint(0, 12) for _ in range(rng.randint(0, 5))) for _ in range(n)]
+
+def test_batch_scores_match_scalar_functions():
+    rng = random.Random(7)
+    preds, actuals = _acts(rng, 3000), _acts(rng, 3000)
+    preds[:3], actuals[:3] = [(999,), (999,), ()], [(999,), (1,), ()]
+
+    err, codes = score_batch(preds, actuals)
+    expected = [response_error(p, a) for p, a in zip(preds, actuals)]
+    assert err.tolist() == expected
+    assert [ERROR_CATEGORIES[c] for c in codes] == [classify_error(p, a, e).category for p, a, e in zip(preds, actuals, expected)]
+
+def test_padding_and_string_signatures():
+    values, lengths = pad_pulses([(1, 2), (), (5,)])
+    assert values.tolist() == [[1, 2], [0, 0], [5, 0]] and lengths.tolist() == [2, 0, 1]
+    err = response_error_batch(values, lengths, values[::-1].copy(), lengths[::-1].copy())
+    assert err.tolist() == [response_error((1, 2), (5,)), 0.0, response_error((5,), (1, 2))]
+    # String signatures classify by their length, like the tuples
+    assert classify_error("0", "1,2", 2.0).category == ERROR_CATEGORIES[classify_error_batch(np.array([0]), np.array([2]), np.array([2.0]))[0]]
+
+def test_chunked_train_round_scores_like_the_scalar_path(monkeypatch):
+    def rows():
+        agent = BootstrapAgentV1(seed=6, seed_proto_handles=True, promote_threshold=2)
+        trainer = AggressiveTrainerV1(agent, partner_name="mixed_shift", seed=6)
+        with contextlib.redirect_stdout(io.StringIO()):
+            for _ in range(4):
+                trainer.train_round(batch_size=200, drill_n=2, uncertainty_threshold=0.4, predict_chunk=64)
+        return list(trainer.history.rows())
+
+    batched = rows()
+    monkeypatch.setattr(aggressive_trainer_v1, "score_batch", None) # as without NumPy
+    assert rows() == batched
+    assert {r["meta"]["phase"] for r in batched} == {0, 1} # per-sample partner steps survive drawing a chunk's responses up front
@@ -0,0 +1,113 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.checkpoint_v1 import load_checkpoint, save_checkpoint
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+
+from _agent_harness import agent_state, run_agent
+
+@pytest.mark.parametrize("kw", [
+    dict(decay_rate=0.01, prune_below=0.05, lazy_decay=True, compete_topk=2, inhibit_mult=0.1),
+    dict(seed_proto_handles=True, question_cooldown_n=2, promote_threshold=2),
+    dict(seen_counts_mode="lru", seen_counts_budget=224 * 40, promote_threshold=2),
+    dict(seen_counts_mode="sketch", seen_counts_budget=512, promote_threshold=2),
+    dict(handle_backend="table", decay_rate=0.01, prune_below=0.05),
+])
+def test_restored_agent_continues_like_the_original(tmp_path, kw):
+    if kw.get("handle_backend") == "table":
+        pytest.importorskip("numpy")
+    agent = BootstrapAgentV1(seed=3, **kw)
+    run_agent(agent, 300, read_every=5) # ranking reads settle lazy decay as they go
+    path = tmp_path / "agent.ckpt"
+    save_checkpoint(str(path), agent)
+    restored, trainer_state = load_checkpoint(str(path))
+
+    assert trainer_state is None
+    assert type(restored._seen_counts) is type(agent._seen_counts)
+    assert restored.stats() == agent.stats()
+    run_agent(agent, 200, start=301, read_every=5)
+    run_agent(restored, 200, start=301, read_every=5)
+    if not kw.get("lazy_decay"):
+        assert agent_state(restored) == agent_state(agent)
+        return
+    # Lazy decay settles at different steps after a restore: values agree to the last bits
+    (handles, *rest), (expected, *expected_rest) = agent_state(restored), agent_state(agent)
+    assert rest == expected_rest
+    assert [h[:3] + h[5:] for h in handles] == [h[:3] + h[5:] for h in expected]
+    assert [h[3:5] for h in handles] == [pytest.approx(h[3:5], rel=1e-12) for h in expected]
+
+def test_trainer_resumes_mid_stream(tmp_path):
+    def trainer():
+        agent = BootstrapAgentV1(seed=5, seed_proto_handles=True, decay_rate=0.005)
+        return AggressiveTrainerV1(agent, partner_name="mixed_shift", seed=5)
+
+    def rounds(tr, n):
+        return [tr.train_round(batch_size=150, drill_n=3, uncertainty_threshold=0.4) for _ in range(n)]
+
+    original = trainer()
+    rounds(original, 2)
+    path = tmp_path / "trainer.ckpt"
+    original.save_checkpoint(str(path))
+    resumed = AggressiveTrainerV1.from_checkpoint(str(path))
+
+    assert resumed.drill_queue == original.drill_queue
+    assert resumed.partner.step_count == original.partner.step_count
+    assert rounds(resumed, 2) == rounds(original, 2)
+    assert agent_state(resumed.agent) == agent_state(original.agent)
+
+def test_signatures_are_reinterned_in_a_fresh_process(tmp_path):
+    agent = BootstrapAgentV1(seed=8, promote_threshold=2)
+    run_agent(agent, 200)
+    path = tmp_path / "agent.ckpt"
+    save_checkpoint(str(path), agent)
+    expected = repr([(h.hid, h.sent_sig, h.resp_sig, h.hits) for h in agent._handles])
+
+    # Intern unrelated sequences first so every id differs from this process
+    script = (
+        "import sys\n"
+        "from constraint_bootstrap.signatures_v1 import SIGS\n"
+        "from constraint_bootstrap.checkpoint_v1 import load_checkpoint\n"
+        "for i in range(500): SIGS.id_of((99, i))\n"
+        "agent, _ = load_checkpoint(sys.argv[1])\n"
+        "print(repr([(h.hid, h.sent_sig, h.resp_sig, h.hits) for h in agent._handles]))\n"
+    )
+    src = str(Path(__file__).resolve().parent.parent / "src")
+    out = subprocess.run([sys.executable, "-c", script, str(path)], capture_output=True, text=True, env={"PYTHONPATH": src}, check=True)
+    assert out.stdout.strip() == expected
+
+def test_rejects_foreign_and_future_files(tmp_path):
+    bad = tmp_path / "bad.ckpt"
+    bad.write_bytes(b"not a checkpoint at all")
+    with pytest.raises(ValueError):
+        load_checkpoint(str(bad))
+
+    path = tmp_path / "agent.ckpt"
+    save_checkpoint(str(path), BootstrapAgentV1())
+    data = bytearray(path.read_bytes())
+    data[8] = 99 # version field
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="version"):
+        load_checkpoint(str(path))
+
+def test_shell_resume_reports_the_checkpointed_config(tmp_path, monkeypatch, capsys):
+    from unittest.mock import patch
+    from q_ternary.qd_shell_v1 import main
+    from q_ternary.training.run_writer_v1 import load_run
+
+    monkeypatch.chdir(tmp_path)
+    base = ["qd_shell", "train_aggressive", "--rounds", "1", "--batch", "50"]
+    with patch.object(sys, "argv", base + ["--min-strength", "0.2", "--seen-counts", "lru", "--save-checkpoint", "t.ckpt"]):
+        main()
+    capsys.readouterr()
+    with patch.object(sys, "argv", base + ["--resume", "t.ckpt", "--promote-threshold", "9"]):
+        main()
+    out = capsys.readouterr().out
+    assert "--promote-threshold ignored with --resume" in out
+
+    report = load_run(out.rsplit("Metrics saved to ", 1)[1].strip())
+    meta = report["metadata"]
+    assert (meta["min_strength"], meta["promote_threshold"], meta["seen_counts"]) == (0.2, 4, "lru")
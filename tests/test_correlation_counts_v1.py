@@ -0,0 +1,135 @@
+import contextlib
+import io
+import random
+
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.correlation_counts_v1 import (
+    CountMinPairCountsV1,
+    ExactPairCountsV1,
+    LruPairCountsV1,
+    PromotionAuditV1,
+)
+from constraint_bootstrap.signatures_v1 import SIGS, seq_key
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+
+def test_sketch_never_undercounts():
+    rng = random.Random(0)
+    sketch = CountMinPairCountsV1(budget_bytes=256) # 16 counters per row: lots of collisions
+    exact = ExactPairCountsV1()
+    for _ in range(2000):
+        key = (SIGS.id_of((rng.randrange(50),)), SIGS.id_of((rng.randrange(5),)))
+        assert sketch.add(key) >= exact.add(key)
+    assert all(sketch.estimate(k) >= c for k, c in exact.items())
+
+def test_lru_stays_in_budget_and_keeps_repeated_pairs():
+    lru = LruPairCountsV1(budget_bytes=224 * 10)
+    lru.add((1, 1))
+    lru.add((1, 1)) # seen twice -> protected
+    for i in range(100):
+        lru.add((100 + i, 0)) # one-off noise churns through probation
+    assert len(lru) <= lru.max_entries
+    assert lru.add((1, 1)) == 3
+    assert lru.stats()["evictions"] > 0
+
+def test_lru_evicts_promoted_pairs_before_climbing_ones():
+    lru = LruPairCountsV1(budget_bytes=224 * 3)
+    for key in ((1, 1), (1, 1), (2, 2), (2, 2)):
+        lru.add(key)
+    lru.promoted((1, 1), 2) # (1, 1) has its handle; (2, 2) hasn't promoted yet
+    lru.add((3, 3))
+    lru.add((4, 4)) # full: the spent pair goes, although it isn't the least recent
+    assert lru.add((2, 2)) == 3
+    assert lru.add((1, 1)) == 1
+    assert lru.stats()["spent"] == 0
+
+def test_sketch_audit_measures_false_promotions():
+    # Few distinct pairs: the audit samples all of them, so its rate is the exact one
+    rng = random.Random(1)
+    sketch = CountMinPairCountsV1(budget_bytes=256, seed=0)
+    exact = ExactPairCountsV1()
+    promoted, early = set(), 0
+    for _ in range(3000):
+        key = (seq_key((rng.randrange(60),)), seq_key((rng.randrange(3),)))
+        true_n = exact.add(key)
+        if sketch.add(key) >= 4 and key not in promoted:
+            promoted.add(key)
+            sketch.promoted(key, 4)
+            early += true_n < 4
+    stats = sketch.stats()
+    assert stats["audit_sample_rate"] == 1 and early > 0
+    assert stats["false_promotion_rate"] == early / len(promoted)
+
+def test_promotion_audit_keeps_an_exact_sample_in_budget():
+    rng = random.Random(2)
+    audit = PromotionAuditV1(max_entries=50)
+    exact = ExactPairCountsV1()
+    for _ in range(5000):
+        key = (seq_key((rng.randrange(500),)), seq_key((7,)))
+        audit.add(key)
+        exact.add(key)
+    assert audit.sample_rate > 1 and len(audit.pairs) <= 50
+    # Every pair in the slice is kept, counted since its first sighting
+    assert {k for k in exact if (k[0] ^ k[1]) % audit.sample_rate == 0} == set(audit.pairs)
+    assert all(e[0] == exact[k] for k, e in audit.pairs.items())
+
+@pytest.mark.parametrize("mode", ["exact", "lru", "sketch"])
+def test_agent_stats_report_the_false_promotion_rate(mode):
+    rng = random.Random(3)
+    agent = BootstrapAgentV1(seed=0, seen_counts_mode=mode, seen_counts_budget=256, promote_threshold=3)
+    for t in range(1, 3001):
+        sent = agent.choose_action(t)
+        agent.observe(sent, (rng.randint(1, 6),), learn=False, decision=agent.predict(sent))
+    stats = agent.stats()
+    assert (stats["handles"], stats["seen_counts"]["mode"]) == (len(agent._handles), mode)
+    rate = stats["seen_counts"]["false_promotion_rate"]
+    assert rate > 0.0 if mode == "sketch" else rate == 0.0
+
+@pytest.mark.parametrize("mode", ["lru", "sketch"])
+def test_bounded_modes_match_exact_with_ample_budget(mode):
+    def run(**kw):
+        agent = BootstrapAgentV1(seed=7, promote_threshold=2, **kw)
+        for t in range(1, 80):
+            sent = agent.choose_action(t)
+            agent.predict(sent)
+            agent.observe(sent, (len(sent) % 3,), learn=True)
+        return [(h.hid, h.sent_sig, h.resp_sig) for h in agent._handles]
+
+    assert run(seen_counts_mode=mode, seen_counts_budget=1 << 16) == run()
+
+@pytest.mark.parametrize("mode", ["lru", "sketch"])
+def test_bounded_modes_only_intern_what_handles_reference(mode):
+    # Noisy responses: almost every pair is new and never promotes
+    rng = random.Random(0)
+    agent = BootstrapAgentV1(seed=0, seen_counts_mode=mode, seen_counts_budget=1 << 16, promote_threshold=3)
+    before = len(SIGS)
+    for t in range(1, 5001):
+        sent = agent.choose_action(t)
+        d = agent.predict(sent)
+        agent.observe(sent, tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 3))), learn=t % 2 == 0, decision=d)
+    referenced = {h.sent_id for h in agent._handles} | {h.resp_id for h in agent._handles}
+    assert len(SIGS) - before <= len(referenced)
+
+@pytest.mark.parametrize("mode", ["lru", "sketch"])
+def test_trainer_only_interns_what_handles_reference(mode):
+    # Random trainer samples are mostly new sequences; looking them up must not intern them
+    agent = BootstrapAgentV1(seed=1, seen_counts_mode=mode, seen_counts_budget=1 << 14)
+    trainer = AggressiveTrainerV1(agent, partner_name="mixed", seed=2)
+    before = len(SIGS)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for predict_chunk in (0, 64, 0):
+            trainer.train_round(batch_size=1000, drill_n=2, uncertainty_threshold=0.1, predict_chunk=predict_chunk)
+    referenced = {h.sent_id for h in agent._handles} | {h.resp_id for h in agent._handles}
+    assert len(SIGS) - before <= len(referenced)
+
+def test_plain_dict_assignment_still_counts():
+    agent = BootstrapAgentV1(promote_threshold=2)
+    agent._seen_counts = {}
+    agent.observe((3, 3), (5,), learn=False)
+    agent.observe((3, 3), (5,), learn=False)
+    assert len(agent._handles) == 1
+
+def test_unknown_mode_is_rejected():
+    with pytest.raises(ValueError):
+        BootstrapAgentV1(seen_counts_mode="bloom")
@@ -0,0 +1,63 @@
+import io
+import json
+import random
+import contextlib
+
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+from q_ternary.training.drift_detectors_v1 import detector_state, make_drift_detector
+
+KINDS = ("rolling", "page_hinkley", "cusum", "adwin")
+
+def _stream(seed, before=0.1, after=0.9, n=400):
+    rng = random.Random(seed)
+    return [rng.random() < before for _ in range(n)] + [rng.random() < after for _ in range(n)]
+
+def test_rolling_matches_the_list_window():
+    det = make_drift_detector("rolling", window=50, threshold=0.6)
+    window = []
+    for miss in _stream(1, before=0.5, after=0.6):
+        window.append(miss)
+        if len(window) > 50:
+            window.pop(0)
+        expected = len(window) == 50 and sum(window) / 50 >= 0.6
+        assert det.update(miss) == expected
+        if expected:
+            assert det.rate == sum(window) / 50
+
+@pytest.mark.parametrize("kind", KINDS)
+def test_detects_a_rise_in_miss_rate(kind):
+    for seed in range(5):
+        det = make_drift_detector(kind)
+        signals = [i for i, miss in enumerate(_stream(seed)) if det.update(miss)]
+        assert signals and 400 <= signals[0] < 520, signals[:3]
+        assert det.rate > 0.5
+
+def test_unknown_detector():
+    with pytest.raises(ValueError, match="Unknown drift detector"):
+        make_drift_detector("nope")
+
+@pytest.mark.parametrize("kind", ["page_hinkley", "adwin"])
+def test_trainer_detector_resumes_from_checkpoint(kind, tmp_path):
+    def rounds(tr, n):
+        with contextlib.redirect_stdout(io.StringIO()):
+            return [tr.train_round(batch_size=300, drill_n=0, uncertainty_threshold=0.4, question_budget_per_round=40, probe_after_budget=True) for _ in range(n)]
+
+    agent = BootstrapAgentV1(seed=123, truth_min_to_speak=0.1, min_strength_to_predict=0.1, eligibility_min_to_consider=0.1, seed_proto_handles=True)
+    original = AggressiveTrainerV1(agent, partner_name="mixed_shift", seed=123, drift_detector=kind)
+    rounds(original, 1)
+    original.save_checkpoint(str(tmp_path / "t.ckpt"))
+    resumed = AggressiveTrainerV1.from_checkpoint(str(tmp_path / "t.ckpt"))
+    assert resumed.drift_detector == original.drift_detector
+    json.dumps(detector_state(resumed.drift_detector))
+
+    # Trigger indices count history, which checkpoints leave out
+    later = rounds(original, 3)
+    resumed_later = rounds(resumed, 3)
+    for m in later + resumed_later:
+        m.pop("drift_trigger_indices")
+    assert resumed_later == later
+    assert sum(m["drift_triggers"] for m in later) >= 1
+    assert later[-1]["drift_detection_delay"] is not None
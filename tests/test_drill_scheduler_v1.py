@@ -0,0 +1,85 @@
+import random
+import struct
+
+import pytest
+
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1, TrainingSample
+from q_ternary.training.drill_scheduler_v1 import DrillSchedulerV1
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.checkpoint_v1 import FORMAT_VERSION
+
+def _drill(*sent):
+    return TrainingSample(sent=sent, synthetic_drill=True)
+
+def test_priority_order_merge_and_drop():
+    q = DrillSchedulerV1(capacity=3)
+    assert q.push(_drill(1), 0.5) == "queued"
+    assert q.push(_drill(2), 0.5) == "queued"
+    assert q.push(_drill(3), 2.0) == "queued"
+    assert q.push(_drill(2), 0.1) == "merged" # lower priority: unchanged
+    assert q.push(_drill(1), 1.0) == "merged" # raised, ahead of (2,) now
+    assert q.push(_drill(4), 0.5) == "dropped" # full, no better than the lowest
+    assert q.push(_drill(5), 0.7) == "queued" # evicts (2,)
+    assert (q.merged, q.dropped, len(q)) == (2, 2, 3)
+    assert [s.sent for s in q] == [(3,), (1,), (5,)]
+    assert [q.pop().sent for _ in range(3)] == [(3,), (1,), (5,)]
+    with pytest.raises(IndexError):
+        q.pop()
+
+def test_matches_a_sorted_model_under_churn():
+    rng = random.Random(4)
+    q = DrillSchedulerV1(capacity=20)
+    model = {} # sent -> (priority, seq)
+    seq = 0
+    for _ in range(5000):
+        if rng.random() < 0.7:
+            sent, p = (rng.randrange(40),), rng.choice([0.0, 0.5, 1.0, rng.random()])
+            q.push(_drill(*sent), p)
+            if sent in model:
+                model[sent] = (max(p, model[sent][0]), model[sent][1])
+            elif len(model) < 20:
+                seq += 1
+                model[sent] = (p, seq)
+            else:
+                low = min(model, key=lambda s: (model[s][0], -model[s][1]))
+                if p > model[low][0]:
+                    del model[low]
+                    seq += 1
+                    model[sent] = (p, seq)
+        elif model:
+            best = min(model, key=lambda s: (-model[s][0], model[s][1]))
+            del model[best]
+            assert q.pop().sent == best
+        assert [s.sent for s in q] == sorted(model, key=lambda s: (-model[s][0], model[s][1]))
+    assert len(q._min) <= 2 * len(q) + 65 # stale entries get compacted
+
+def test_trainer_drills_are_deduplicated(tmp_path):
+    # Low gates so the agent speaks (and misses) early
+    agent = BootstrapAgentV1(seed=5, seed_proto_handles=True, promote_threshold=2, min_strength_to_predict=0.1, truth_min_to_speak=0.1, eligibility_min_to_consider=0.1)
+    trainer = AggressiveTrainerV1(agent, partner_name="mixed_shift", seed=5, drill_capacity=8)
+    merged = dropped = 0
+    for _ in range(5):
+        m = trainer.train_round(batch_size=200, drill_n=20, uncertainty_threshold=0.4)
+        merged += m["drills_merged"]
+        dropped += m["drills_dropped"]
+        assert m["drill_queue_size"] <= 8
+    assert merged > 0 and dropped > 0
+    queued = [s.sent for s in trainer.drill_queue]
+    assert len(queued) == len(set(queued))
+
+    # Checkpoints keep priorities, order and counters
+    trainer.save_checkpoint(str(tmp_path / "t.ckpt"))
+    resumed = AggressiveTrainerV1.from_checkpoint(str(tmp_path / "t.ckpt"))
+    assert len(trainer.drill_queue) > 0
+    assert resumed.drill_queue == trainer.drill_queue
+    assert (resumed.drill_queue.capacity, resumed.drill_queue.merged, resumed.drill_queue.dropped) == (8, trainer.drill_queue.merged, trainer.drill_queue.dropped)
+
+def test_checkpoints_from_an_older_layout_are_refused_by_version(tmp_path):
+    # An older trainer state (e.g. drills without priorities) must fail the version check, not a KeyError in from_checkpoint
+    path = tmp_path / "t.ckpt"
+    AggressiveTrainerV1(BootstrapAgentV1(seed=1), seed=1).save_checkpoint(str(path))
+    data = bytearray(path.read_bytes())
+    struct.pack_into("<I", data, 8, FORMAT_VERSION - 1)
+    path.write_bytes(bytes(data))
+    with pytest.raises(ValueError, match="Unsupported checkpoint version"):
+        AggressiveTrainerV1.from_checkpoint(str(path))
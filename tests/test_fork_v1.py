@@ -0,0 +1,56 @@
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.sweep_v1 import fork_map
+
+from _agent_harness import agent_state, run_agent
+
+@pytest.mark.parametrize("kw", [
+    dict(decay_rate=0.01, prune_below=0.05, lazy_decay=True, promote_threshold=2),
+    dict(seen_counts_mode="lru", seen_counts_budget=224 * 40, promote_threshold=2, question_cooldown_n=2),
+    dict(handle_backend="table", decay_rate=0.01, prune_below=0.05),
+])
+def test_fork_is_independent_and_exact(kw):
+    if kw.get("handle_backend") == "table":
+        pytest.importorskip("numpy")
+    parent = run_agent(BootstrapAgentV1(seed=2, **kw), 300)
+    twin = run_agent(BootstrapAgentV1(seed=2, **kw), 300)
+    child = parent.fork()
+    assert agent_state(child) == agent_state(parent)
+
+    # Driving the child doesn't touch the parent, and vice versa
+    run_agent(child, 200, start=301)
+    assert agent_state(parent) == agent_state(twin)
+    run_agent(parent, 200, start=301)
+    run_agent(twin, 200, start=301)
+    assert agent_state(parent) == agent_state(twin) == agent_state(child)
+
+def test_fork_overrides():
+    parent = run_agent(BootstrapAgentV1(seed=4, promote_threshold=2), 200)
+    child = parent.fork(decay_rate=0.05, compete_topk=1, seed=9)
+    assert (child.decay_rate, child.compete_topk) == (0.05, 1)
+    assert (parent.decay_rate, parent.compete_topk) == (0.0, 0)
+    assert child._rng.getstate() != parent._rng.getstate()
+    with pytest.raises(ValueError):
+        parent.fork(handle_backend="table")
+    with pytest.raises(TypeError):
+        parent.fork(no_such_field=1)
+
+def _summary(agent):
+    run_agent(agent, 150, start=201)
+    return agent.decay_rate, agent.compete_topk, len(agent._handles), agent_state(agent)[0][:5]
+
+def test_fork_map_matches_in_process_forks():
+    parent = run_agent(BootstrapAgentV1(seed=6, promote_threshold=2), 200)
+    configs = [dict(decay_rate=r, compete_topk=k) for r in (0.0, 0.01) for k in (0, 2)]
+
+    expected = [_summary(parent.fork(**cfg)) for cfg in configs]
+    assert fork_map(_summary, parent, configs, processes=2) == expected
+    assert parent._current_step == 200 # children ran on their own copies
+
+def _boom(agent):
+    raise KeyError("boom")
+
+def test_fork_map_reports_child_errors():
+    with pytest.raises(RuntimeError, match="boom"):
+        fork_map(_boom, BootstrapAgentV1(), [{}])
@@ -0,0 +1,95 @@
+import random
+
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.handle_registry_v1 import HandleRegistryV1
+from constraint_bootstrap.signatures_v1 import as_sig_id
+
+def _full_sort(reg):
+    return sorted(reg._values(), key=lambda h: (h.strength, h.hits), reverse=True)
+
+def _check_top_k(reg, lazy, prune):
+    rng = random.Random(3)
+    for i in range(300):
+        # Mix of exact-zero, tied and distinct strengths
+        truth = 0.0 if i % 4 == 0 else rng.choice([0.5, rng.random()])
+        reg.append(Handle(hid=i + 1, sent_sig=str(i % 40), resp_sig=str(i % 3), eligibility=rng.random(), truth=truth, hits=rng.randint(0, 2)))
+
+    for step in range(200):
+        for h in reg.for_sent(str(rng.randrange(40))):
+            h.update(rng.random() < 0.5, update_truth=True)
+        if step % 7 == 0:
+            reg.inhibit(reg.for_sent(str(rng.randrange(40))), 0.05)
+        # Rate change halfway through moves the ranking frame
+        reg.decay(*((0.97, 0.985) if step < 100 else (0.9, 0.99)), lazy=lazy, prune_below=prune)
+        for k in (1, 3, 10):
+            assert reg.top(k) == _full_sort(reg)[:k]
+
+@pytest.mark.parametrize("lazy,prune", [(False, 0.0), (True, 0.0), (True, 0.05)])
+def test_top_k_matches_full_sort_under_updates(lazy, prune):
+    _check_top_k(HandleRegistryV1(), lazy, prune)
+
+def test_top_k_on_table_backend():
+    pytest.importorskip("numpy")
+    from constraint_bootstrap.handle_table_v1 import HandleTableV1
+    _check_top_k(HandleTableV1(), False, 0.05)
+
+def test_touch_reranks_handles_mutated_outside_the_registry():
+    reg = HandleRegistryV1()
+    a = Handle(hid=1, sent_sig="1", resp_sig="2", strength=0.5)
+    b = Handle(hid=2, sent_sig="1", resp_sig="3", strength=0.4)
+    reg.extend([a, b])
+    assert reg.top(1) == [a]
+
+    b.eligibility = b.truth = 0.9
+    reg.touch(b)
+    assert reg.top(1) == [b]
+
+def test_agent_top_handles_matches_handles_prefix():
+    agent = BootstrapAgentV1(seed=5, promote_threshold=1, seed_proto_handles=True, prune_below=0.02)
+    for step in range(300):
+        sent = agent.choose_action(step)
+        agent.predict(sent)
+        agent.observe(sent, (sum(sent) % 5,), learn=True)
+        assert agent.top_handles(3) == _full_sort(agent._handles)[:3]
+    assert agent.top_handles(3) == agent.handles[:3]
+
+def _check_top2(reg, lazy, prune):
+    rng = random.Random(5)
+    for i in range(200):
+        reg.append(Handle(hid=i + 1, sent_sig=str(i % 8), resp_sig=str(i % 5), eligibility=rng.choice([0.3, rng.random()]), truth=rng.choice([0.3, rng.random()]), hits=rng.randint(0, 1)))
+
+    def expected(sent, elig_min):
+        bucket = sorted(reg._by_sent.get(as_sig_id(sent), []), key=lambda h: (h.strength, h.hits), reverse=True)
+        eligible = [h for h in bucket if h.eligibility >= elig_min]
+        ranked = (eligible or bucket) + [None, None]
+        return len(bucket), len(eligible), ranked[0], ranked[1]
+
+    for step in range(150):
+        sent = str(rng.randrange(8))
+        action = rng.randrange(4)
+        if action == 0:
+            for h in reg.for_sent(sent):
+                h.update(rng.random() < 0.5, update_truth=True)
+        elif action == 1:
+            reg.inhibit([h for h in expected(sent, 0.4)[2:] if h is not None], 0.3) # knock the leaders down
+        elif action == 2:
+            reg.append(Handle(hid=1000 + step, sent_sig=sent, resp_sig="9", eligibility=rng.random(), truth=rng.random()))
+        if step % 3 == 0:
+            reg.decay(0.97, 0.985, lazy=lazy, prune_below=prune)
+        for s in map(str, range(8)):
+            got = reg.top2_for_sent(s, 0.4)
+            assert got == reg.top2_for_sent(s, 0.4) # cached read
+            assert got == expected(s, 0.4)
+            # Eligible or not; mostly answered from the entry cached just above
+            assert reg.strongest_two(s) == expected(s, float("-inf"))[2:]
+
+@pytest.mark.parametrize("lazy,prune", [(False, 0.0), (True, 0.05)])
+def test_top2_for_sent_tracks_updates(lazy, prune):
+    _check_top2(HandleRegistryV1(), lazy, prune)
+
+def test_top2_for_sent_on_table_backend():
+    pytest.importorskip("numpy")
+    from constraint_bootstrap.handle_table_v1 import HandleTableV1
+    _check_top2(HandleTableV1(), False, 0.05)
@@ -0,0 +1,63 @@
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.handle_registry_v1 import HandleRegistryV1
+
+def _index_matches_scan(agent: BootstrapAgentV1) -> bool:
+    sigs = {h.sent_sig for h in agent._handles}
+    for s in sigs:
+        scan = [h for h in agent._handles if h.sent_sig == s]
+        if agent._handles.for_sent(s) != scan:
+            return False
+    return True
+
+def test_list_assignment_is_reindexed():
+    agent = BootstrapAgentV1()
+    h1 = Handle(hid="H001", sent_sig="1", resp_sig="10", strength=0.2)
+    h2 = Handle(hid="H002", sent_sig="1", resp_sig="20", strength=0.5)
+    agent._handles = [h1, h2]
+
+    assert isinstance(agent._handles, HandleRegistryV1)
+    assert agent._handles.for_sent("1") == [h1, h2]
+    assert agent._handles.count_sent("2") == 0
+
+def test_index_consistent_through_promotion_and_proto_seeding():
+    agent = BootstrapAgentV1(seed=1, promote_threshold=1, seed_proto_handles=True)
+    agent.observe((3, 3, 3), (5,), learn=True)
+    agent.observe((3, 3, 3), (6,), learn=True)
+    agent.observe((1, 2), (7,), learn=False)
+    agent.predict((4, 4))
+
+    assert agent._handles.count_sent("3,3,3") == 2
+    assert agent._handles.count_sent("4,4") == 1
+    assert _index_matches_scan(agent)
+
+def test_index_consistent_through_pruning():
+    agent = BootstrapAgentV1(decay_rate=0.1, prune_below=0.5)
+    weak = Handle(hid="H001", sent_sig="1", resp_sig="2", strength=0.5)
+    strong = Handle(hid="H002", sent_sig="1", resp_sig="3", strength=1.0)
+    agent._handles.extend([weak, strong])
+
+    agent._apply_handle_decay()
+
+    assert agent._handles.for_sent("1") == [strong]
+    assert list(agent._handles) == [strong]
+    assert _index_matches_scan(agent)
+
+def test_pair_index_follows_proto_adoption():
+    agent = BootstrapAgentV1(seed_proto_handles=True, seed_eligibility=0.25)
+    agent.predict((1, 2))
+    h = agent._handles[0]
+    assert agent._handles.for_pair("1,2", "0") == [h]
+
+    agent.observe((1, 2), (5,), learn=True, update_truth=False)
+
+    assert h.resp_sig == "5"
+    assert agent._handles.for_pair("1,2", "5") == [h]
+    assert not agent._handles.has_pair("1,2", "0")
+
+def test_promotion_does_not_duplicate_pair():
+    agent = BootstrapAgentV1(promote_threshold=1)
+    for _ in range(5):
+        agent.observe((3, 3), (5,), learn=False)
+
+    assert len(agent._handles.for_pair("3,3", "5")) == 1
+    assert len(agent._handles) == 1
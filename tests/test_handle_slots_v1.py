@@ -0,0 +1,39 @@
+from constraint_bootstrap import bootstrap_agent_v1
+from constraint_bootstrap.bootstrap_agent_v1 import LABEL_UID, BootstrapAgentV1, Handle, _sig
+from constraint_bootstrap.checkpoint_v1 import load_checkpoint, save_checkpoint
+from constraint_bootstrap.signatures_v1 import SIGS
+
+def test_handle_is_slotted_with_int_id():
+    h = Handle(hid=7, sent_sig="1,2", resp_sig="5")
+    assert not hasattr(h, "__dict__")
+    assert h.uid == 7
+    assert h.hid == "H007"
+
+def test_display_ids_round_trip():
+    assert Handle(hid="H042", sent_sig="1", resp_sig="2").uid == 42
+    label = Handle(hid="H_PROTO", sent_sig="1", resp_sig="2")
+    assert label.hid == "H_PROTO" and label.clone().hid == "H_PROTO"
+    # Labels live on the handle, not in a process-wide table
+    assert label.uid == LABEL_UID and not hasattr(bootstrap_agent_v1, "_HID_LABELS")
+
+def test_labels_survive_decisions_and_checkpoints(tmp_path):
+    agent = BootstrapAgentV1(seed=1)
+    agent._handles.append(Handle(hid="H_PROTO", sent_sig="1", resp_sig="2", strength=0.9))
+    agent._handles.append(Handle(hid=4, sent_sig="3", resp_sig="2", strength=0.9))
+    assert agent.predict((1,)).meta["hid"] == "H_PROTO"
+    save_checkpoint(str(tmp_path / "a.ckpt"), agent)
+    restored, _ = load_checkpoint(str(tmp_path / "a.ckpt"))
+    assert [h.hid for h in restored._handles] == ["H_PROTO", "H004"]
+
+def test_signatures_are_interned():
+    a = Handle(hid=1, sent_sig=_sig((1, 2)), resp_sig=_sig((5,)))
+    b = Handle(hid=2, sent_sig=SIGS.id_of((1, 2)), resp_sig=SIGS.id_of((5,)))
+    assert type(a.sent_id) is int
+    assert (a.sent_id, a.resp_id) == (b.sent_id, b.resp_id)
+    assert a.sent_sig == "1,2" and b.resp_act == (5,)
+
+def test_agent_handles_get_sequential_ids():
+    agent = BootstrapAgentV1(promote_threshold=1)
+    agent.observe((3, 3), (5,), learn=True)
+    agent.observe((3, 3), (6,), learn=True)
+    assert [h.hid for h in agent._handles] == ["H001", "H002"]
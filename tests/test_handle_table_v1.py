@@ -0,0 +1,55 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.handle_table_v1 import HandleTableV1
+from constraint_bootstrap.alien_partners_v1 import make_partner
+
+def _run(backend: str, **kw) -> BootstrapAgentV1:
+    agent = BootstrapAgentV1(seed=5, promote_threshold=2, handle_backend=backend, **kw)
+    partner = make_partner("adversarial")
+    for t in range(1, 500):
+        sent = agent.choose_action(t)
+        agent.observe(sent, partner.respond(sent), learn=True)
+        agent._apply_handle_decay()
+    return agent
+
+@pytest.mark.parametrize("kw", [
+    dict(decay_rate=0.01, prune_below=0.05),
+    dict(compete_topk=1, inhibit_mult=0.5, seed_proto_handles=True),
+])
+def test_table_backend_matches_list_backend(kw):
+    ref = _run("list", **kw)
+    tab = _run("table", **kw)
+
+    assert isinstance(tab._handles, HandleTableV1)
+    assert tab.total_inhibitions == ref.total_inhibitions
+    assert tab.total_evictions == ref.total_evictions
+    assert [(h.hid, h.hits, h.misses) for h in tab.handles] == [(h.hid, h.hits, h.misses) for h in ref.handles]
+    for ht, hr in zip(tab.handles, ref.handles):
+        assert ht.strength == pytest.approx(hr.strength)
+
+    assert tab._handles.avg_strength() == pytest.approx(ref._handles.avg_strength())
+    assert tab._handles.speakable_counts(0.1, 0.1) == ref._handles.speakable_counts(0.1, 0.1)
+    assert [h.hid for h in tab._handles.top_by_strength(10)] == [h.hid for h in ref._handles.top_by_strength(10)]
+
+def test_table_rows_are_views_and_survive_removal():
+    agent = BootstrapAgentV1(handle_backend="table", decay_rate=0.1, prune_below=0.5)
+    weak = Handle(hid="H001", sent_sig="1", resp_sig="2", strength=0.5)
+    keep = Handle(hid="H002", sent_sig="2", resp_sig="3", strength=1.0)
+    agent._handles.extend([weak, keep])
+
+    # Handle attributes read and write the table row
+    agent._handles._elig[keep._row] = 0.8
+    assert keep.eligibility == 0.8
+    keep.eligibility = 1.0
+    assert agent._handles._elig[keep._row] == 1.0
+
+    agent._apply_handle_decay() # weak: 0.45 < 0.5 -> evicted
+
+    assert agent.total_evictions == 1
+    assert type(weak) is Handle # detached, values copied back
+    assert weak.eligibility == pytest.approx(0.45)
+    assert keep.strength == pytest.approx(0.9)
+    assert agent._handles.for_sent("2") == [keep]
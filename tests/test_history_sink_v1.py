@@ -0,0 +1,43 @@
+import io
+import contextlib
+
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+from q_ternary.training.history_sink_v1 import RingHistoryV1, make_history
+from q_ternary.training.run_writer_v1 import load_run
+
+def _run(history):
+    agent = BootstrapAgentV1(seed=123, truth_min_to_speak=0.1, min_strength_to_predict=0.1, eligibility_min_to_consider=0.1, seed_proto_handles=True)
+    trainer = AggressiveTrainerV1(agent, partner_name="mixed_shift", seed=123, history=history)
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(3):
+            trainer.train_round(batch_size=300, drill_n=2, uncertainty_threshold=0.4, question_budget_per_round=40, probe_after_budget=True)
+    report = load_run(trainer.save_run({}))
+    trainer.history.close()
+    return trainer, report
+
+def test_sinks_agree_with_the_in_memory_history(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    memory, full = _run(None)
+    assert len(memory.history) == 900 and len(list(memory.history)) == 900
+    assert any(row["meta"].get("DE_DRIFT") for row in full["history"]) # appended after the drift check
+
+    ring, ring_report = _run(RingHistoryV1(150))
+    assert len(ring.history) == 900 and len(list(ring.history)) == 150
+    assert ring_report["summary"] == full["summary"]
+    assert ring_report["history"] == full["history"][-150:]
+
+    for fmt in ("jsonl", "binary"):
+        spill, spill_report = _run(make_history("spill", path=str(tmp_path / f"h.{fmt}"), fmt=fmt))
+        assert len(list(spill.history)) == 100
+        assert spill_report == full
+
+def test_make_history_rejects_bad_options(tmp_path):
+    with pytest.raises(ValueError):
+        make_history("spill")
+    with pytest.raises(ValueError):
+        make_history("spill", path=str(tmp_path / "h"), fmt="csv")
+    with pytest.raises(ValueError):
+        make_history("tape")
@@ -0,0 +1,32 @@
+import pytest
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.alien_partners_v1 import make_partner
+
+from _agent_harness import run_agent
+
+def _run(lazy: bool) -> BootstrapAgentV1:
+    agent = BootstrapAgentV1(seed=7, decay_rate=0.02, promote_threshold=2, lazy_decay=lazy)
+    return run_agent(agent, 299, partner=make_partner("mixed"))
+
+def test_lazy_matches_eager():
+    eager = _run(lazy=False)
+    lazy = _run(lazy=True)
+
+    assert [h.hid for h in lazy.handles] == [h.hid for h in eager.handles]
+    for he, hl in zip(eager.handles, lazy.handles):
+        assert hl.eligibility == pytest.approx(he.eligibility)
+        assert hl.truth == pytest.approx(he.truth)
+
+def test_lazy_decay_defers_untouched_handles():
+    agent = BootstrapAgentV1(decay_rate=0.1, lazy_decay=True)
+    h = Handle(hid="H001", sent_sig="1", resp_sig="2", strength=1.0)
+    agent._handles.append(h)
+
+    for _ in range(3):
+        agent._apply_handle_decay()
+
+    # Nothing touched the handle yet
+    assert h.eligibility == 1.0
+    # Reading through the registry materializes (1 - rate)^dt
+    assert agent._handles.for_sent("1")[0].eligibility == pytest.approx(0.9 ** 3)
+    assert h.truth == pytest.approx(0.95 ** 3)
@@ -0,0 +1,39 @@
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.lane_v1 import Decision, LazyDecision
+
+def _run(agent, steps, batch=1):
+    out = []
+    for start in range(1, steps + 1, batch):
+        sents = [agent.choose_action(t) for t in range(start, min(start + batch, steps + 1))]
+        for sent, d in zip(sents, agent.predict_batch(sents)):
+            out.append(d)
+            agent.observe(sent, (len(sent) % 3,) if len(out) % 5 else (sum(sent) % 4,), learn=True, decision=d)
+    return out
+
+@pytest.mark.parametrize("batch", [1, 16])
+def test_minimal_decisions_render_like_full_ones(batch):
+    kw = dict(seed=3, promote_threshold=2, seed_proto_handles=True, question_cooldown_n=3)
+    full = BootstrapAgentV1(telemetry="full", **kw)
+    minimal = BootstrapAgentV1(telemetry="minimal", **kw)
+    a, b = _run(full, 400, batch), _run(minimal, 400, batch)
+
+    assert all(type(d) is LazyDecision for d in b)
+    assert [(d.lane, d.act, d.question, d.meta) for d in a] == [(d.lane, d.act, d.question, d.meta) for d in b]
+    assert [list(d.meta) for d in a] == [list(d.meta) for d in b] # same key order
+    assert {d.meta.get("reason") for d in b} >= {"pre_eligible_nudge", "weak_knowledge"}
+    assert (full.total_predict_calls, full._silent_to_question_nudges_round, full._question_repeats_blocked_round) == \
+        (minimal.total_predict_calls, minimal._silent_to_question_nudges_round, minimal._question_repeats_blocked_round)
+
+def test_lazy_meta_is_built_once_and_mutable():
+    agent = BootstrapAgentV1(telemetry="minimal", seed_proto_handles=True)
+    d = agent.predict((1, 2))
+    assert d._rendered is None
+    d.meta["extra"] = 1
+    assert d.meta["extra"] == 1
+    assert d == Decision(lane=d.lane, act=d.act, question=d.question, meta=d.meta)
+
+def test_unknown_telemetry_level():
+    with pytest.raises(ValueError):
+        BootstrapAgentV1(telemetry="off")
@@ -0,0 +1,31 @@
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.alien_partners_v1 import make_partner
+
+from _agent_harness import run_agent
+
+def _run(lazy: bool) -> BootstrapAgentV1:
+    agent = BootstrapAgentV1(seed=3, decay_rate=0.02, prune_below=0.1, promote_threshold=1, lazy_decay=lazy)
+    return run_agent(agent, 399, partner=make_partner("mixed"), decay=False)
+
+def test_lazy_prune_matches_eager():
+    eager = _run(lazy=False)
+    lazy = _run(lazy=True)
+
+    assert lazy.total_evictions == eager.total_evictions > 0
+    assert [h.hid for h in lazy._handles] == [h.hid for h in eager._handles]
+
+def test_lazy_prune_leaves_healthy_handles_untouched():
+    agent = BootstrapAgentV1(decay_rate=0.1, prune_below=0.5, lazy_decay=True)
+    weak = Handle(hid="H001", sent_sig="1", resp_sig="2", strength=0.6)
+    healthy = Handle(hid="H002", sent_sig="2", resp_sig="3", strength=1.0)
+    agent._handles.extend([weak, healthy])
+
+    agent._apply_handle_decay() # weak: 0.54
+    assert agent.total_evictions == 0
+    agent._apply_handle_decay() # weak: 0.486 -> evicted
+
+    assert agent.total_evictions == 1
+    assert agent._handles.count_sent("1") == 0
+    # The healthy handle was never materialized
+    assert healthy.decay_t == 0
+    assert healthy.eligibility == 1.0
@@ -1,5 +1,6 @@
 import pytest
 from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.signatures_v1 import SIGS
 from q_ternary.lane_v1 import Lane
 
 def test_question_cooldown_blocks_repeat():
@@ -15,7 +16,7 @@ def test_question_cooldown_blocks_repeat():
     # 1. First time: Seed proto and ask QUESTION
     d1 = agent.predict(sent)
     assert d1.lane == Lane.QUESTION
-    assert agent._last_question_step["1,2"] == 1
+    assert agent._last_question_step[SIGS.id_of(sent)] == 1
     assert agent._current_step == 1
     
     # 2. Second time (step 2): Should be on cooldown
@@ -36,7 +37,7 @@ def test_question_cooldown_blocks_repeat():
     d4 = agent.predict(sent)
     assert d4.lane == Lane.QUESTION
     assert d4.meta["on_cooldown"] is False
-    assert agent._last_question_step["1,2"] == 4
+    assert agent._last_question_step[SIGS.id_of(sent)] == 4
     assert agent._current_step == 4
 
 def test_question_cooldown_weak_knowledge():
@@ -78,3 +79,20 @@ def test_question_cooldown_conflict():
     d2 = agent.predict((1,))
     assert d2.lane == Lane.NA # conflict routes to NA on cooldown
     assert d2.meta["on_cooldown"] is True
+
+def test_observe_with_decision_counts_one_step():
+    """predict + observe(decision=...) is one step: no second search, no double cooldown tick."""
+    agent = BootstrapAgentV1(seed_proto_handles=True, question_cooldown_n=1, eligibility_min_to_consider=0.1)
+    sent = (1, 2)
+
+    d1 = agent.predict(sent)
+    m = agent.observe(sent, (3,), learn=False, decision=d1)
+    assert d1.lane == Lane.QUESTION
+    assert m.predicted == (999,)
+    assert agent._current_step == 1
+    assert agent._proto_seeded_round == 1
+    assert agent._last_question_step[SIGS.id_of(sent)] == 1
+
+    # Step 2 is within the 1-step cooldown; step 3 may ask again
+    assert agent.predict(sent).lane == Lane.NA
+    assert agent.predict(sent).lane == Lane.QUESTION
@@ -0,0 +1,70 @@
+import io
+import json
+import contextlib
+
+import pytest
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+from q_ternary.training.history_sink_v1 import RingHistoryV1
+from q_ternary.training.run_writer_v1 import RUN_FORMAT, RunWriterV1, iter_run, load_run
+
+def _trainer(history=None):
+    agent = BootstrapAgentV1(seed=123, truth_min_to_speak=0.1, min_strength_to_predict=0.1, eligibility_min_to_consider=0.1, seed_proto_handles=True)
+    return AggressiveTrainerV1(agent, partner_name="mixed_shift", seed=123, history=history)
+
+def _rounds(trainer, n=3):
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(n):
+            trainer.train_round(batch_size=300, drill_n=2, uncertainty_threshold=0.4, question_budget_per_round=40, probe_after_budget=True)
+
+def test_streamed_report_matches_one_written_at_save(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    at_save = _trainer()
+    _rounds(at_save)
+    saved = load_run(at_save.save_run({"seed": 123}))
+
+    streamed = _trainer(RingHistoryV1(150))
+    path = streamed.start_run({"partner": "mixed_shift"})
+    _rounds(streamed)
+    lines = list(iter_run(path))
+    assert len(lines) == 1 + 900 and "header" in lines[0] # rows are on disk before save_run
+    assert streamed.save_run({"seed": 123}) == path
+
+    report = load_run(path)
+    assert report["format"] == lines[0]["header"]["format"] == RUN_FORMAT
+    assert report["metadata"] == {"partner": "mixed_shift", "seed": 123}
+    assert report["summary"] == saved["summary"]
+    assert report["history"] == saved["history"] # all 900, though the ring kept 150
+    assert streamed.run_writer is None
+
+def test_top_candidates_are_taken_at_decision_time(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    trainer = _trainer()
+    _rounds(trainer, 1)
+    rows = load_run(trainer.save_run({}))["history"]
+    handles = {h.hid: h for h in trainer.agent._handles}
+    changed = 0
+    for row in rows:
+        assert len(row["top_candidates"]) <= 2
+        for c in row["top_candidates"]:
+            h = handles[c["hid"]]
+            assert h.sent_sig == row["sent"]
+            changed += c["combined_strength"] != h.strength
+    assert changed > 0 # end-of-run strengths differ from those at decision time
+
+def test_start_run_twice_and_unfinished_reports(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    trainer = _trainer()
+    trainer.start_run()
+    with pytest.raises(RuntimeError):
+        trainer.start_run()
+
+    writer = RunWriterV1(str(tmp_path / "r.jsonl"), {"seed": 1})
+    writer.write({"sent": "1", "err": 0.0})
+    writer._file.flush()
+    assert load_run(writer.path) == {"format": RUN_FORMAT, "metadata": {"seed": 1}, "summary": {}, "history": [{"sent": "1", "err": 0.0}]}
+
+    legacy = {"metadata": {}, "summary": {"total_samples": 0}, "history": []}
+    (tmp_path / "old.json").write_text(json.dumps(legacy, indent=2))
+    assert load_run(str(tmp_path / "old.json")) == legacy
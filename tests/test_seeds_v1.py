@@ -0,0 +1,41 @@
+import pytest
+
+from constraint_bootstrap.alien_partners_v1 import make_partner
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.seeds_v1 import SeedTreeV1
+from constraint_bootstrap.sweep_v1 import fork_map
+
+def test_seed_mapping_is_pinned_and_distinct():
+    tree = SeedTreeV1(123)
+    # The documented mapping; these must not change between releases
+    assert tree.seed("agent") == 5177824091814123410
+    assert tree.worker(2).seed("channel") == 17430845411130625432
+    assert tree.spawn(3)[2] == tree.worker(2) == SeedTreeV1(123, (2,))
+
+    names = ("agent", "channel", "partner", "trainer", "actions")
+    seeds = {node.seed(name) for node in [tree, *tree.spawn(8), tree.worker(0).worker(0)] for name in names}
+    assert len(seeds) == 10 * len(names)
+    with pytest.raises(ValueError):
+        tree.worker(-1)
+
+_WORKERS = SeedTreeV1(5).spawn(4)
+_PARTNER_SEED = {w.seed("agent"): w.seed("partner") for w in _WORKERS}
+
+def _worker_run(agent):
+    partner = make_partner("adversarial", seed=_PARTNER_SEED[agent.seed])
+    for t in range(1, 301):
+        sent = agent.choose_action(t)
+        agent.observe(sent, partner.respond(sent), decision=agent.predict(sent))
+    return [(h.sent_sig, h.resp_sig, h.hits) for h in agent._handles]
+
+def test_workers_match_serial_and_parallel():
+    configs = [dict(seed=w.seed("agent")) for w in _WORKERS]
+    serial = [_worker_run(BootstrapAgentV1(**cfg)) for cfg in configs]
+    assert fork_map(_worker_run, BootstrapAgentV1(), configs, processes=2) == serial
+    assert len({str(r) for r in serial}) == 4
+
+def test_seed_sequence_matches_numpy_spawn():
+    np = pytest.importorskip("numpy")
+    children = np.random.SeedSequence(99).spawn(3)
+    for node, child in zip(SeedTreeV1(99).spawn(3), children):
+        assert node.seed_sequence().generate_state(4).tolist() == child.generate_state(4).tolist()
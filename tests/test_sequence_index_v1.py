@@ -0,0 +1,62 @@
+import random
+
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1, Handle
+from constraint_bootstrap.channel_v1 import ChannelV1
+from constraint_bootstrap.handle_registry_v1 import HandleRegistryV1
+from q_ternary.lane_v1 import Lane
+from constraint_bootstrap.sequence_index_v1 import SequenceIndexV1, pulse_distance
+from constraint_bootstrap.signatures_v1 import SIGS
+
+def _brute(ids, seq, radius):
+    near = [(pulse_distance(seq, SIGS.seq_of(i)), i) for i in ids if len(SIGS.seq_of(i)) == len(seq)]
+    near = [x for x in near if x[0] <= radius]
+    return min(near)[1] if near else None
+
+def test_nearest_matches_brute_force_with_discards():
+    rng = random.Random(4)
+    ids = [SIGS.id_of(tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 4)))) for _ in range(400)]
+    index = SequenceIndexV1()
+    live = set()
+    for i, sid in enumerate(ids):
+        index.add(sid)
+        live.add(sid)
+        if i % 5 == 0:
+            gone = rng.choice(sorted(live))
+            index.discard(gone)
+            live.discard(gone)
+    index.add(ids[0]) # revive
+    live.add(ids[0])
+    for _ in range(300):
+        q = tuple(rng.randint(1, 12) for _ in range(rng.randint(1, 4)))
+        for radius in (0, 2, 5):
+            assert index.nearest(q, radius) == _brute(live, q, radius)
+
+def test_registry_index_follows_handle_removal():
+    reg = HandleRegistryV1([Handle(hid=1, sent_sig="4,6", resp_sig="2"), Handle(hid=2, sent_sig="4,9", resp_sig="2")])
+    assert reg.nearest_sent("4,7", 2) == SIGS.id_of((4, 6))
+    reg.remove(reg.for_sent("4,6")[0])
+    assert reg.nearest_sent("4,7", 2) == SIGS.id_of((4, 9))
+    assert reg.nearest_sent("4,7", 1) is None
+    assert reg.nearest_sent("4,7,1", 5) is None # lengths never mix
+
+def test_jittered_sequence_reuses_the_known_handle():
+    agent = BootstrapAgentV1(fuzzy_tolerance=0.5, min_strength_to_predict=0.2)
+    agent._handles.append(Handle(hid=1, sent_sig="5,5,5", resp_sig="3", eligibility=0.9, truth=0.9))
+    d = agent.predict((5, 6, 5))
+    assert (d.lane, d.act) == (Lane.SPEAK, (3,))
+    agent.observe((5, 6, 5), (3,), decision=d)
+    assert len(agent._handles) == 1 and agent._handles[0].hits == 1
+    assert agent.predict((5, 8, 5)).lane == Lane.SILENT # 3 units off: outside 0.5
+
+def test_fuzzy_lookup_curbs_growth_under_noise():
+    def run(tol):
+        agent = BootstrapAgentV1(seed=2, promote_threshold=2, fuzzy_tolerance=tol)
+        chan = ChannelV1(noise_prob=0.3, noise_jitter=1, seed=2)
+        rng = random.Random(2)
+        base = [tuple(rng.randint(2, 9) for _ in range(3)) for _ in range(20)]
+        for t in range(3000):
+            ex = chan.transmit(base[t % 20], (sum(base[t % 20]) % 5,))
+            agent.observe(ex.sent, (sum(base[t % 20]) % 5,), decision=agent.predict(ex.sent))
+        return len(agent._handles), len(agent._seen_counts)
+    exact, fuzzy = run(0.0), run(0.25)
+    assert fuzzy[0] < exact[0] and fuzzy[1] < exact[1]
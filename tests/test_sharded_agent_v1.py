@@ -0,0 +1,107 @@
+import io
+import os
+import contextlib
+
+import pytest
+
+from constraint_bootstrap.alien_partners_v1 import make_partner
+from constraint_bootstrap.bootstrap_agent_v1 import BootstrapAgentV1
+from constraint_bootstrap.sharded_agent_v1 import ShardedBootstrapAgentV1
+from constraint_bootstrap.signatures_v1 import SIGS
+from q_ternary.training.aggressive_trainer_v1 import AggressiveTrainerV1
+
+CONFIG = dict(
+    seed=11, promote_threshold=2, seed_proto_handles=True, question_cooldown_n=3,
+    decay_rate=0.01, prune_below=0.05, lazy_decay=True, compete_topk=2, inhibit_mult=0.1,
+)
+
+def _drive(agent, steps=600, batch=25):
+    partner = make_partner("mixed")
+    out = []
+    for start in range(1, steps + 1, batch):
+        sents = [agent.choose_action(t) for t in range(start, start + batch)]
+        recvs = [partner.respond(s) for s in sents]
+        decisions = agent.predict_batch(sents)
+        metrics = agent.observe_batch(sents, recvs, decisions=decisions) if isinstance(agent, ShardedBootstrapAgentV1) else \
+            [agent.observe(s, r, decision=d) for s, r, d in zip(sents, recvs, decisions)]
+        # Unlearned observes and a manual decay step, like the trainer's drills
+        agent.observe_batch(sents[:3], recvs[:3], learn=False)
+        agent._apply_handle_decay()
+        out += [(d.lane, d.act, m.error) for d, m in zip(decisions, metrics)]
+    return out
+
+def _counters(agent):
+    names = ("total_predict_calls", "sum_candidate_count", "total_multi_candidate_steps", "total_inhibitions", "total_evictions", "_total_handles_created")
+    return {n: getattr(agent, n) for n in names}
+
+@pytest.mark.parametrize("shards,processes", [(1, False), (3, False), (3, True)])
+def test_sharded_run_matches_single_agent(shards, processes):
+    if processes and not hasattr(os, "fork"):
+        pytest.skip("needs os.fork")
+    single = BootstrapAgentV1(**CONFIG)
+    expected = _drive(single)
+    with ShardedBootstrapAgentV1(shards=shards, processes=processes, **CONFIG) as sharded:
+        assert _drive(sharded) == expected
+        counters = sharded.counters()
+        assert counters.pop("handles") == len(single._handles)
+        assert {n: counters[n] for n in _counters(single)} == _counters(single)
+        top = sharded.top_handles(5)
+        assert [(h.sent_sig, h.resp_sig, h.strength) for h in top] == [(h.sent_sig, h.resp_sig, h.strength) for h in single.top_handles(5)]
+
+def test_routing_is_stable_and_worker_errors_surface():
+    with ShardedBootstrapAgentV1(shards=4, **CONFIG) as sharded:
+        assert [sharded.shard_of((i, 3)) for i in range(8)] == [sharded.shard_of((i, 3)) for i in range(8)]
+        with pytest.raises(ValueError):
+            sharded.observe_batch([(1,)], [])
+        with pytest.raises(RuntimeError, match="shard"):
+            sharded.observe_batch([(1, 2)], [(3,)], decisions=["not a decision"]) # fails inside the worker
+        sharded.predict((1, 2)) # workers still answer after an error
+    with pytest.raises(ValueError):
+        ShardedBootstrapAgentV1(shards=0)
+    with pytest.raises(ValueError, match="fuzzy_tolerance"):
+        ShardedBootstrapAgentV1(shards=2, fuzzy_tolerance=0.25)
+
+def _train(agent, predict_chunk=0):
+    trainer = AggressiveTrainerV1(agent, partner_name="mixed_shift", seed=3)
+    with contextlib.redirect_stdout(io.StringIO()):
+        metrics = [trainer.train_round(batch_size=200, drill_n=3, uncertainty_threshold=0.4, question_budget_per_round=30, probe_after_budget=True, predict_chunk=predict_chunk) for _ in range(3)]
+    rows = [(r.decision.lane, r.decision.act, r.error, r.uncertainty, [c[1:] for c in r.top_candidates]) for r in trainer.history.tail(len(trainer.history))]
+    return metrics, rows
+
+TRAIN_CONFIG = dict(CONFIG, lazy_decay=False, truth_min_to_speak=0.1, min_strength_to_predict=0.1, eligibility_min_to_consider=0.1)
+
+@pytest.mark.parametrize("processes,predict_chunk", [(False, 0), (True, 0), (True, 32)])
+def test_trainer_drives_a_sharded_agent_like_a_single_one(processes, predict_chunk):
+    if processes and not hasattr(os, "fork"):
+        pytest.skip("needs os.fork")
+    expected_metrics, expected_rows = _train(BootstrapAgentV1(**TRAIN_CONFIG), predict_chunk)
+    with ShardedBootstrapAgentV1(shards=3, processes=processes, **TRAIN_CONFIG) as sharded:
+        metrics, rows = _train(sharded, predict_chunk)
+        assert sharded.min_strength_to_predict == 0.1
+        assert len(sharded._handles) == sharded.counters()["handles"]
+    assert rows == expected_rows
+    for got, expected in zip(metrics, expected_metrics):
+        assert got.pop("avg_strength") == pytest.approx(expected.pop("avg_strength"))
+        assert got == expected
+
+def test_chunked_rounds_take_one_predict_and_one_observe_per_chunk(monkeypatch):
+    with ShardedBootstrapAgentV1(shards=3, processes=False, **TRAIN_CONFIG) as sharded:
+        calls = []
+        call = sharded._call
+        monkeypatch.setattr(sharded, "_call", lambda op, args: calls.append(op) or call(op, args))
+        _train(sharded, predict_chunk=50)
+    # Besides the per-round counter resets and end-of-round metrics
+    per_chunk = [op for op in calls if op not in ("counters", "set_counter", "speakable_counts", "strength_total", "top_by_strength")]
+    assert per_chunk.count("predict") == per_chunk.count("observe") == 3 * 4
+    assert per_chunk.count("top_handles") <= 3 * 4 # forced questions share one read per chunk
+    assert set(per_chunk) <= {"predict", "observe", "top_handles"}
+
+def test_handles_from_workers_keep_their_signatures():
+    with ShardedBootstrapAgentV1(shards=2, **CONFIG) as sharded:
+        # SIGS ids are per process: after the fork the parent and the workers number new sequences apart
+        for i in range(3):
+            SIGS.id_of((99, i))
+        sharded.observe_batch([(12, 12, 12, 11)] * 3, [(11, 12, 12)] * 3)
+        h1, h2 = sharded._handles.strongest_two(SIGS.id_of((12, 12, 12, 11)))
+        assert (h1.sent_sig, h1.resp_sig, h2) == ("12,12,12,11", "11,12,12", None)
+        assert [h.resp_sig for h in sharded._handles.for_sent("12,12,12,11")] == ["11,12,12"]
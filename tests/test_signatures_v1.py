@@ -0,0 +1,20 @@
+from constraint_bootstrap.signatures_v1 import SignatureTableV1, as_sig_id, SIGS
+
+def test_ids_round_trip_through_strings():
+    t = SignatureTableV1()
+    sid = t.id_of((4, 6))
+    assert t.id_of((4, 6)) == sid
+    assert t.seq_of(sid) == (4, 6)
+    assert t.str_of(sid) == "4,6"
+    assert t.id_of_str("4,6") == sid
+
+def test_empty_sequence_is_id_zero():
+    t = SignatureTableV1()
+    assert t.id_of(()) == 0
+    assert t.id_of_str("0") == 0
+    assert t.str_of(0) == "0"
+
+def test_as_sig_id_accepts_ids_and_strings():
+    sid = SIGS.id_of((9, 9, 1))
+    assert as_sig_id(sid) == sid
+    assert as_sig_id("9,9,1") == sid